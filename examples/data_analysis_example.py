@@ -4,7 +4,6 @@
 import os
 import pandas as pd
 import numpy as np
-import matplotlib.pyplot as plt
 from datetime import datetime, timedelta
 
 # Import functions from yfinance_scraper
@@ -19,6 +18,46 @@ from yfinance_scraper import (
 # Set the data directory - adjust this to your actual data path
 DATA_DIR = os.path.expanduser("~/data/yfinance")
 
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _returns_stats(close):
+    """Mean, sample std, min and max of daily returns in a single pass.
+    
+    Uses Welford's update for the variance so the prices are scanned once;
+    NaN prices are skipped.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    low = np.inf
+    high = -np.inf
+    for i in range(1, close.shape[0]):
+        r = close[i] / close[i - 1] - 1.0
+        if np.isnan(r):
+            continue
+        count += 1
+        delta = r - mean
+        mean += delta / count
+        m2 += delta * (r - mean)
+        low = min(low, r)
+        high = max(high, r)
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    return mean, std, low, high
+
+
+if njit is not None:
+    returns_stats = njit(fastmath=True, cache=True)(_returns_stats)
+else:
+    def returns_stats(close):
+        """NumPy fallback for :func:`_returns_stats` when Numba is unavailable."""
+        returns = np.diff(close) / close[:-1]
+        returns = returns[~np.isnan(returns)]
+        return returns.mean(), returns.std(ddof=1), returns.min(), returns.max()
+
 def main():
     """Main entry point for example script."""
     print("YFinance Scraper Data Analysis Example")
@@ -57,13 +96,14 @@ def main():
         print(f"Loaded {len(history)} days of data for {example_ticker}")
         print(history.tail())
         
-        # Calculate some stats
-        daily_returns = history['Close'].pct_change().dropna()
+        # Calculate some stats in one pass over the Close buffer
+        close = history['Close'].to_numpy(dtype=np.float64)
+        mean, std, low, high = returns_stats(close)
         print(f"\nDaily returns statistics for {example_ticker}:")
-        print(f"Mean: {daily_returns.mean():.4f}")
-        print(f"Std Dev: {daily_returns.std():.4f}")
-        print(f"Min: {daily_returns.min():.4f}")
-        print(f"Max: {daily_returns.max():.4f}")
+        print(f"Mean: {mean:.4f}")
+        print(f"Std Dev: {std:.4f}")
+        print(f"Min: {low:.4f}")
+        print(f"Max: {high:.4f}")
     
     # 4. Load portfolio data for multiple tickers
     if len(tickers) >= 3:
@@ -83,9 +123,16 @@ def main():
             print(f"Portfolio data shape: {portfolio.shape}")
             print(portfolio.tail())
             
-            # Calculate correlations
-            corr = portfolio.pct_change().corr()
-            print("\nCorrelation matrix:")
+            # Correlate log returns with a single BLAS matmul on standardised returns
+            log_prices = np.log(portfolio.dropna().to_numpy())
+            returns = np.diff(log_prices, axis=0)
+            z = (returns - returns.mean(axis=0)) / returns.std(axis=0, ddof=1)
+            corr = pd.DataFrame(
+                (z.T @ z) / (len(z) - 1),
+                index=portfolio.columns,
+                columns=portfolio.columns
+            )
+            print("\nCorrelation matrix (log returns):")
             print(corr)
     
     # 5. Load financial statement data
@@ -4,7 +4,9 @@
 import os
 import sys
 import logging
-import pandas as pd
+import requests
+import lxml.html
+import numpy as np
 from yfinance_scraper.config import load_config, ensure_data_dir
 from yfinance_scraper.utils import save_tickers_to_file
 from yahoo_fin import stock_info as si
@@ -16,14 +18,29 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+SP500_URL = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
+
 
 # Define list of tickers
 def get_combined_tickers():
-    tickers = set()
-    tickers.update(si.tickers_sp500())
-    # tickers.update(si.tickers_nasdaq())
-    # tickers.update(si.tickers_dow())
-    return sorted(tickers)
+    tickers = list(si.tickers_sp500())
+    # tickers += si.tickers_nasdaq()
+    # tickers += si.tickers_dow()
+    return unique_tickers(tickers)
+
+def unique_tickers(tickers):
+    """Deduplicate and sort ticker symbols."""
+    return np.unique(np.asarray(tickers, dtype=object)).tolist()
+
+def get_sp500_tickers(url: str = SP500_URL):
+    """Extract S&P 500 symbols from the Wikipedia constituents table."""
+    # Wikipedia rejects requests without a User-Agent
+    response = requests.get(url, headers={"User-Agent": "yfinance-scraper"}, timeout=30)
+    response.raise_for_status()
+    root = lxml.html.fromstring(response.content)
+    # Only the Symbol column of the constituents table is needed
+    symbols = root.xpath('//table[@id="constituents"]//tr/td[1]//a/text()')
+    return [s.strip() for s in symbols if s.strip()]
 
 def main():
     """Main function to save combined tickers."""
@@ -34,14 +51,8 @@ def main():
     data_dir = config["data_dir"]
     ensure_data_dir(data_dir)
     
-    url = "https://en.wikipedia.org/wiki/List_of_S%26P_500_companies"
-    tables = pd.read_html(url)
-    # The first table should have the list of S&P 500 companies.
-    sp500_df = tables[0]
-
-    # Often the column with tickers is labeled 'Symbol'. Adjust if needed.
-    sp500_tickers = sp500_df["Symbol"].tolist()
-    tickers = sorted(set(sp500_tickers))
+    sp500_tickers = get_sp500_tickers()
+    tickers = unique_tickers(sp500_tickers)
     # tickers = get_combined_tickers()
     print(tickers)
     # Save tickers to file
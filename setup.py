@@ -28,6 +28,7 @@ setup(
         "pyarrow>=7.0.0",
         "numpy>=1.20.0",
         "requests>=2.26.0",
+        "lxml>=4.6.0",
     ],
     entry_points={
         "console_scripts": [
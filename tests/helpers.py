@@ -0,0 +1,30 @@
+"""Shared fixtures for the tests."""
+
+import numpy as np
+import pandas as pd
+
+
+def make_ohlcv(start: str, periods: int, tz: str = "America/New_York", base: float = 100.0) -> pd.DataFrame:
+    """Build a small business-day OHLCV frame in the shape the fetcher stores.
+
+    Args:
+        start: First date
+        periods: Number of business days
+        tz: Timezone of the index
+        base: First Close price; each later day is one higher
+
+    Returns:
+        DataFrame with float32 prices, int64 Volume and a "Date" index
+    """
+    index = pd.bdate_range(start, periods=periods, tz=tz, name="Date")
+    close = base + np.arange(periods, dtype=np.float32)
+    return pd.DataFrame(
+        {
+            "Open": close - 1,
+            "High": close + 1,
+            "Low": close - 2,
+            "Close": close,
+            "Volume": np.arange(1000, 1000 + periods, dtype=np.int64),
+        },
+        index=index,
+    )
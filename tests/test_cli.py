@@ -0,0 +1,39 @@
+"""Tests for the command line interface."""
+
+import contextlib
+import io
+import unittest
+
+from yfinance_scraper.cli import parse_args
+
+
+class TestParseArgs(unittest.TestCase):
+    """Test command line validation."""
+
+    def assert_rejected(self, args):
+        """Assert that argparse exits with a usage error for args."""
+        with contextlib.redirect_stderr(io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit) as cm:
+                parse_args(args)
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn("must be positive", stderr.getvalue())
+
+    def test_batch_size_zero(self):
+        """Test that a zero batch size is a usage error, not a crash."""
+        self.assert_rejected(["fetch", "--batch-size", "0"])
+
+    def test_non_positive_counts(self):
+        """Test that retry and worker counts must be positive."""
+        self.assert_rejected(["fetch", "--batch-size", "-5"])
+        self.assert_rejected(["fetch", "--max-retries", "0"])
+        self.assert_rejected(["update", "--workers", "0"])
+
+    def test_defaults(self):
+        """Test that valid values and defaults parse."""
+        args = parse_args(["fetch", "--batch-size", "10"])
+        self.assertEqual(args.batch_size, 10)
+        self.assertEqual(args.max_retries, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -10,6 +10,7 @@ from yfinance_scraper.config import (
     load_config,
     save_config,
     update_config,
+    dump_config,
     ensure_data_dir,
     DEFAULT_CONFIG
 )
@@ -61,6 +62,15 @@ class TestConfig(unittest.TestCase):
         
         self.assertEqual(saved_config, config)
     
+    def test_dump_config_format(self):
+        """Test that the saved format does not depend on orjson being installed."""
+        config = DEFAULT_CONFIG.copy()
+        expected = json.dumps(config, indent=2).encode("utf-8")
+        
+        self.assertEqual(dump_config(config), expected)
+        with patch("yfinance_scraper.config.orjson", None):
+            self.assertEqual(dump_config(config), expected)
+    
     def test_load_config_existing(self):
         """Test loading configuration from an existing file."""
         config = DEFAULT_CONFIG.copy()
@@ -88,6 +98,27 @@ class TestConfig(unittest.TestCase):
             # Check that save_config was called to create the file
             mock_save.assert_called_once_with(DEFAULT_CONFIG, self.config_path)
     
+    def test_load_config_reloads_changed_file(self):
+        """Test that a cached configuration is refreshed after the file changes."""
+        config = DEFAULT_CONFIG.copy()
+        config["data_dir"] = self.data_dir
+        save_config(config, self.config_path)
+        
+        loaded_config = load_config(self.config_path)
+        self.assertEqual(loaded_config["period"], DEFAULT_CONFIG["period"])
+        
+        # Mutating the returned config must not leak into later loads
+        loaded_config["period"] = "mutated"
+        self.assertEqual(load_config(self.config_path)["period"], DEFAULT_CONFIG["period"])
+        
+        # Rewrite the file behind the loader's back
+        config["period"] = "1y"
+        with open(self.config_path, "w") as f:
+            json.dump(config, f)
+        os.utime(self.config_path, ns=(0, 0))
+        
+        self.assertEqual(load_config(self.config_path)["period"], "1y")
+    
     def test_update_config(self):
         """Test updating configuration."""
         # Save initial config
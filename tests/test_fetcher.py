@@ -0,0 +1,135 @@
+"""Tests for the fetcher module."""
+
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from yfinance_scraper import fetcher
+from yfinance_scraper.fetcher import TTL_DAYS, _cached_fundamentals, _compact_ohlcv, fetch_data_for_tickers
+from yfinance_scraper.storage import get_ticker_file, save_ticker_data
+from tests.helpers import make_ohlcv
+
+
+def make_history(start: str, periods: int) -> pd.DataFrame:
+    """Build a price history frame shaped like yfinance's, actions included."""
+    hist = make_ohlcv(start, periods).astype("float64")
+    hist.insert(4, "Adj Close", hist["Close"] - 0.5)
+    hist["Dividends"] = 0.0
+    hist["Stock Splits"] = 0.0
+    hist.iloc[1, hist.columns.get_loc("Dividends")] = 0.22
+    return hist
+
+
+class TestCompactOhlcv(unittest.TestCase):
+    """Test shrinking price histories before caching."""
+
+    def test_dtypes(self):
+        """Test that prices become float32, Volume int64 and actions are dropped."""
+        result = _compact_ohlcv(make_history("2021-01-04", 5))
+        self.assertEqual(list(result.columns), ["Open", "High", "Low", "Close", "Adj Close", "Volume"])
+        for column in fetcher.PRICE_COLUMNS:
+            self.assertEqual(result[column].dtype, np.float32, column)
+        self.assertEqual(result["Volume"].dtype, np.int64)
+
+    def test_volume_schema_is_fixed(self):
+        """Test that large or missing volumes still give an int64 Arrow column."""
+        small = make_history("2021-01-04", 3)
+        large = make_history("2021-01-04", 3)
+        large["Volume"] = [3e9, np.nan, 4e9]
+
+        for hist in (small, large):
+            table = pa.Table.from_pandas(_compact_ohlcv(hist))
+            self.assertEqual(table.schema.field("Volume").type, pa.int64())
+        self.assertTrue(pd.isna(_compact_ohlcv(large)["Volume"].iloc[1]))
+
+
+class TestCachedFundamentals(unittest.TestCase):
+    """Test picking the fundamentals to refetch by their TTL."""
+
+    def setUp(self):
+        """Set up cached fundamentals of different ages."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = self.temp_dir.name
+        frame = pd.DataFrame({"value": [1.0]})
+        save_ticker_data(
+            "AAPL",
+            {data_type: frame for data_type in ["info", "financials", "balance_sheet", "cashflow", "earnings"]},
+            self.data_dir
+        )
+        ages = {"info": 40, "financials": 60, "balance_sheet": 100, "cashflow": 10, "earnings": 60}
+        for data_type, days in ages.items():
+            mtime = time.time() - days * 86400
+            os.utime(get_ticker_file(self.data_dir, "AAPL", data_type), (mtime, mtime))
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_ttl_per_data_type(self):
+        """Test that each fundamental is judged against its own TTL."""
+        self.assertLess(TTL_DAYS["info"], 40)
+        self.assertGreater(TTL_DAYS["financials"], 60)
+
+        cached, stale = _cached_fundamentals("AAPL", self.data_dir)
+        self.assertEqual(stale, ["info", "balance_sheet"])
+        # earnings follows financials
+        self.assertEqual(set(cached), {"financials", "cashflow", "earnings"})
+
+    def test_force_refresh(self):
+        """Test that forcing a refresh treats everything as stale."""
+        all_types = [data_type for data_type, _ in fetcher.FUNDAMENTALS]
+        self.assertEqual(_cached_fundamentals("AAPL", self.data_dir, force_refresh=True), ({}, all_types))
+        self.assertEqual(_cached_fundamentals("AAPL", None), ({}, all_types))
+
+
+class TestDailyBudget(unittest.TestCase):
+    """Test that fetch_data_for_tickers stops at the daily limit."""
+
+    def setUp(self):
+        """Mock out the network and the delays."""
+        self.downloads = []
+
+        def download(tickers, **kwargs):
+            self.downloads.append(list(tickers))
+            return {ticker: make_history("2021-01-04", 3) for ticker in tickers}
+
+        for target, kwargs in [
+            ("fetch_batch_price_data", {"side_effect": download}),
+            ("_fetch_fundamentals", {"return_value": {}}),
+            ("_new_session", {"return_value": None}),
+            ("_restore_ratelimit_state", {}),
+            ("BATCH_DELAY", {"new": 0}),
+        ]:
+            patcher = patch.object(fetcher, target, **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_batch_truncated(self):
+        """Test that the batch crossing the limit is cut and later ones skipped."""
+        tickers = ["A", "B", "C", "D", "E"]
+        with self.assertLogs("yfinance_scraper.fetcher", level="WARNING") as logs:
+            result = fetch_data_for_tickers(tickers, batch_size=2, daily_limit=3)
+
+        self.assertEqual(self.downloads, [["A", "B"], ["C"]])
+        self.assertEqual(list(result), ["A", "B", "C"])
+        self.assertEqual(sum("Daily limit" in message for message in logs.output), 1)
+
+    def test_budget_shared_across_runs(self):
+        """Test that a second run on the same day only gets what is left."""
+        with tempfile.TemporaryDirectory() as data_dir:
+            fetch_data_for_tickers(["A", "B"], data_dir=data_dir, daily_limit=3)
+            with self.assertLogs("yfinance_scraper.fetcher", level="WARNING"):
+                result = fetch_data_for_tickers(["C", "D"], data_dir=data_dir, daily_limit=3)
+
+        self.assertEqual(self.downloads, [["A", "B"], ["C"]])
+        self.assertEqual(list(result), ["C"])
+
+
+if __name__ == "__main__":
+    unittest.main()
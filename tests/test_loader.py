@@ -0,0 +1,72 @@
+"""Tests for the loader module."""
+
+import tempfile
+import unittest
+
+import pandas as pd
+
+from yfinance_scraper.loader import load_field_bulk, load_field_for_all_tickers
+from yfinance_scraper.storage import clear_footer_cache, save_ticker_data
+from tests.helpers import make_ohlcv
+
+
+class TestLoadField(unittest.TestCase):
+    """Test loading one field for many tickers."""
+
+    def setUp(self):
+        """Set up a data directory with two tickers."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = self.temp_dir.name
+        clear_footer_cache()
+        self.aapl = make_ohlcv("2021-01-04", 5)
+        self.msft = make_ohlcv("2021-01-06", 5, base=200.0)
+        save_ticker_data("AAPL", {"ohlcv": self.aapl}, self.data_dir)
+        save_ticker_data("MSFT", {"ohlcv": self.msft}, self.data_dir)
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_load_field_bulk(self):
+        """Test that the dataset scan aligns tickers on the union of dates."""
+        result = load_field_bulk(self.data_dir, "Close")
+        self.assertEqual(sorted(result.columns), ["AAPL", "MSFT"])
+        self.assertEqual(len(result), 7)
+        self.assertEqual(result["AAPL"].dropna().tolist(), self.aapl["Close"].tolist())
+        self.assertEqual(result["MSFT"].dropna().tolist(), self.msft["Close"].tolist())
+
+    def test_engines_agree(self):
+        """Test that every engine gives the same forward-filled frame."""
+        expected = load_field_for_all_tickers(self.data_dir, field="Close", engine="pandas")
+        self.assertEqual(expected["MSFT"].iloc[-1], 204)
+        self.assertEqual(expected["AAPL"].iloc[-1], 104)
+        result = load_field_for_all_tickers(self.data_dir, field="Close", engine="pyarrow")
+        pd.testing.assert_frame_equal(
+            result.sort_index(axis=1), expected.sort_index(axis=1), check_dtype=False, check_names=False, check_freq=False
+        )
+
+    def test_other_data_type_per_ticker(self):
+        """Test that non-OHLCV types are read per ticker by the pandas engine."""
+        dividends = pd.DataFrame(
+            {"Dividends": [0.205, 0.22]},
+            index=pd.DatetimeIndex(["2021-02-05", "2021-05-07"], tz="America/New_York", name="Date"),
+        )
+        save_ticker_data("AAPL", {"dividends": dividends}, self.data_dir)
+
+        result = load_field_for_all_tickers(
+            self.data_dir, data_type="dividends", field="Dividends", fill_method=None, engine="pandas"
+        )
+        self.assertEqual(list(result.columns), ["AAPL"])
+        self.assertEqual(result["AAPL"].tolist(), [0.205, 0.22])
+
+    def test_missing_field(self):
+        """Test that a field no ticker has gives an empty frame."""
+        with self.assertLogs("yfinance_scraper.loader", level="WARNING"):
+            result = load_field_for_all_tickers(
+                self.data_dir, data_type="splits", field="Stock Splits", engine="pandas"
+            )
+        self.assertTrue(result.empty)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+"""Tests for the rate limiting module."""
+
+import asyncio
+import json
+import os
+import tempfile
+import time
+import unittest
+
+from yfinance_scraper.ratelimit import DailyBudget, TokenBucket, TokenBucketRateLimiter
+
+
+class TestTokenBucketRateLimiter(unittest.TestCase):
+    """Test the asyncio token bucket rate limiter."""
+
+    def test_burst_up_to_capacity(self):
+        """Test that a full bucket admits max_tokens callers without waiting."""
+        limiter = TokenBucketRateLimiter(max_tokens=5, refill_interval=1.0)
+
+        async def run():
+            start = time.monotonic()
+            for _ in range(5):
+                await limiter.acquire()
+            return time.monotonic() - start
+
+        self.assertLess(asyncio.run(run()), 0.1)
+
+    def test_waits_for_refill(self):
+        """Test that callers beyond capacity are spaced by the refill rate."""
+        limiter = TokenBucketRateLimiter(max_tokens=10, refill_interval=0.5)
+
+        async def run():
+            async def enter():
+                async with limiter:
+                    pass
+
+            start = time.monotonic()
+            await asyncio.gather(*(enter() for _ in range(15)))
+            return time.monotonic() - start
+
+        # 5 tokens over capacity at 20 tokens/s need ~0.25s
+        elapsed = asyncio.run(run())
+        self.assertGreaterEqual(elapsed, 0.2)
+        self.assertLess(elapsed, 1.0)
+
+    def test_invalid_arguments(self):
+        """Test that non-positive settings are rejected."""
+        with self.assertRaises(ValueError):
+            TokenBucketRateLimiter(max_tokens=0)
+        with self.assertRaises(ValueError):
+            TokenBucketRateLimiter(max_tokens=1, refill_interval=0)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test the thread-safe token bucket."""
+
+    def test_acquire_within_capacity(self):
+        """Test that tokens up to capacity are handed out immediately."""
+        bucket = TokenBucket(rate=10, capacity=3)
+        self.assertEqual(sum(bucket.acquire() for _ in range(3)), 0.0)
+
+    def test_acquire_waits_for_refill(self):
+        """Test that an empty bucket blocks until a token has refilled."""
+        bucket = TokenBucket(rate=20, capacity=1, jitter=0)
+        bucket.acquire()
+        self.assertGreater(bucket.acquire(), 0.0)
+
+    def test_penalize_pauses_callers(self):
+        """Test that penalize blocks the next acquire for the given delay."""
+        bucket = TokenBucket(rate=100, capacity=10, jitter=0)
+        bucket.penalize(0.2)
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+    def test_set_rate(self):
+        """Test that set_rate changes how fast tokens refill."""
+        bucket = TokenBucket(rate=1, capacity=1, jitter=0)
+        bucket.acquire()
+        bucket.set_rate(50)
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertLess(time.monotonic() - start, 0.5)
+
+        with self.assertRaises(ValueError):
+            bucket.set_rate(0)
+
+    def test_update_from_headers(self):
+        """Test that rate-limit headers drain the bucket and pause callers."""
+        bucket = TokenBucket(rate=100, capacity=10, jitter=0)
+        bucket.update_from_headers({"X-RateLimit-Remaining": "0"})
+        self.assertGreater(bucket.acquire(), 0.0)
+
+        bucket.update_from_headers({"Retry-After": "0.2"})
+        start = time.monotonic()
+        bucket.acquire()
+        self.assertGreaterEqual(time.monotonic() - start, 0.19)
+
+        # Unparsable values are ignored
+        bucket.update_from_headers({"Retry-After": "soon", "X-RateLimit-Remaining": "many"})
+
+
+class TestDailyBudget(unittest.TestCase):
+    """Test the persisted daily ticker budget."""
+
+    def setUp(self):
+        """Set up a temporary budget file."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "_budget.json")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_consume_caps_at_limit(self):
+        """Test that grants stop once the limit is used up."""
+        budget = DailyBudget(5)
+        self.assertEqual(budget.consume(3), 3)
+        self.assertEqual(budget.consume(3), 2)
+        self.assertEqual(budget.consume(), 0)
+        self.assertEqual(budget.remaining, 0)
+
+    def test_usage_shared_across_instances(self):
+        """Test that a second budget on the same file sees today's usage."""
+        DailyBudget(5, self.path).consume(4)
+        self.assertEqual(DailyBudget(5, self.path).remaining, 1)
+
+    def test_previous_day_is_ignored(self):
+        """Test that usage recorded on another day does not count."""
+        with open(self.path, "w") as f:
+            json.dump({"date": "2000-01-01", "used": 5}, f)
+        self.assertEqual(DailyBudget(5, self.path).remaining, 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
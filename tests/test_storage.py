@@ -0,0 +1,148 @@
+"""Tests for the storage module."""
+
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from yfinance_scraper.storage import (
+    append_dataframe_to_parquet,
+    clear_footer_cache,
+    get_earliest_date,
+    get_latest_date,
+    get_latest_dates_bulk,
+    get_ticker_file,
+    load_dataframe_from_parquet,
+    load_partitioned_data,
+    migrate_to_partitioned,
+    save_dataframe_to_parquet,
+    save_partitioned_data,
+    save_ticker_data
+)
+from tests.helpers import make_ohlcv
+
+
+class StorageTestCase(unittest.TestCase):
+    """Base class providing a temporary data directory."""
+
+    def setUp(self):
+        """Set up a temporary data directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = self.temp_dir.name
+        clear_footer_cache()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+
+class TestAppendDataFrame(StorageTestCase):
+    """Test appending rows to a stored Parquet file."""
+
+    def setUp(self):
+        """Set up a stored OHLCV file."""
+        super().setUp()
+        self.stored = make_ohlcv("2021-01-04", 10)
+        self.path = get_ticker_file(self.data_dir, "AAPL", "ohlcv")
+        self.assertTrue(save_dataframe_to_parquet(self.stored, self.path))
+
+    def test_append_after_stored_range(self):
+        """Test that rows after the stored range are appended."""
+        new = make_ohlcv("2021-01-18", 5, base=200.0)
+        self.assertTrue(append_dataframe_to_parquet(new, self.path))
+
+        result = load_dataframe_from_parquet(self.path)
+        pd.testing.assert_frame_equal(result, pd.concat([self.stored, new]), check_freq=False)
+
+    def test_overlap_is_rejected(self):
+        """Test that overlapping rows are refused and the file is left unchanged."""
+        overlap = make_ohlcv("2021-01-14", 3, base=200.0)
+        self.assertFalse(append_dataframe_to_parquet(overlap, self.path))
+
+        result = load_dataframe_from_parquet(self.path)
+        pd.testing.assert_frame_equal(result, self.stored, check_freq=False)
+
+    def test_schema_mismatch_is_rejected(self):
+        """Test that rows with other columns are refused so the caller merges."""
+        new = make_ohlcv("2021-01-18", 2).drop(columns=["Volume"])
+        self.assertFalse(append_dataframe_to_parquet(new, self.path))
+
+    def test_missing_file(self):
+        """Test that appending to a file that does not exist is refused."""
+        path = get_ticker_file(self.data_dir, "MSFT", "ohlcv")
+        self.assertFalse(append_dataframe_to_parquet(make_ohlcv("2021-01-04", 2), path))
+
+
+class TestFooterDates(StorageTestCase):
+    """Test reading date ranges from Parquet footers."""
+
+    def test_latest_and_earliest_date(self):
+        """Test that the range comes back in the stored timezone."""
+        df = make_ohlcv("2021-01-04", 10)
+        save_ticker_data("AAPL", {"ohlcv": df}, self.data_dir)
+
+        self.assertEqual(get_earliest_date("AAPL", self.data_dir), df.index[0].to_pydatetime())
+        self.assertEqual(get_latest_date("AAPL", self.data_dir), df.index[-1].to_pydatetime())
+        self.assertIsNone(get_latest_date("MSFT", self.data_dir))
+
+    def test_cached_range_follows_appends(self):
+        """Test that a cached footer is read again after the file changes."""
+        save_ticker_data("AAPL", {"ohlcv": make_ohlcv("2021-01-04", 10)}, self.data_dir)
+        get_latest_date("AAPL", self.data_dir)
+
+        new = make_ohlcv("2021-02-01", 3)
+        self.assertTrue(append_dataframe_to_parquet(new, get_ticker_file(self.data_dir, "AAPL", "ohlcv")))
+        self.assertEqual(get_latest_date("AAPL", self.data_dir), new.index[-1].to_pydatetime())
+
+    def test_latest_dates_bulk(self):
+        """Test that the bulk lookup matches the per-ticker one."""
+        save_ticker_data("AAPL", {"ohlcv": make_ohlcv("2021-01-04", 10)}, self.data_dir)
+        save_ticker_data("MSFT", {"ohlcv": make_ohlcv("2021-03-01", 4)}, self.data_dir)
+
+        result = get_latest_dates_bulk(["AAPL", "MSFT", "NONE"], self.data_dir)
+        self.assertEqual(result["AAPL"], get_latest_date("AAPL", self.data_dir))
+        self.assertEqual(result["MSFT"], get_latest_date("MSFT", self.data_dir))
+        self.assertIsNone(result["NONE"])
+
+
+class TestPartitionedStore(StorageTestCase):
+    """Test the Hive-partitioned time series store."""
+
+    def test_round_trip(self):
+        """Test that saved frames load back with their values and timezone."""
+        aapl = make_ohlcv("2021-01-04", 5)
+        tokyo = make_ohlcv("2021-01-04", 3, tz="Asia/Tokyo")
+        dividends = pd.DataFrame(
+            {"Dividends": [0.205]}, index=pd.DatetimeIndex(["2021-02-05"], tz="America/New_York", name="Date")
+        )
+        self.assertTrue(save_partitioned_data("AAPL", {"ohlcv": aapl, "dividends": dividends}, self.data_dir))
+        self.assertTrue(save_partitioned_data("7203.T", {"ohlcv": tokyo}, self.data_dir))
+
+        loaded = load_partitioned_data(self.data_dir, "ohlcv")
+        self.assertEqual(set(loaded), {"AAPL", "7203.T"})
+        for ticker, expected in [("AAPL", aapl), ("7203.T", tokyo)]:
+            result = loaded[ticker].sort_index()
+            self.assertEqual(str(result.index.tz), str(expected.index.tz))
+            self.assertTrue(result.index.equals(expected.index))
+            np.testing.assert_allclose(result["Close"].to_numpy(), expected["Close"].to_numpy())
+            self.assertEqual(result["Close"].dtype, np.float64)
+            self.assertEqual(result["Volume"].dtype, np.int64)
+
+        loaded = load_partitioned_data(self.data_dir, "dividends", ["AAPL"])
+        self.assertEqual(loaded["AAPL"]["Dividends"].tolist(), [0.205])
+        self.assertEqual(load_partitioned_data(self.data_dir, "splits"), {})
+
+    def test_migrate(self):
+        """Test that migration backfills the store from the per-ticker files."""
+        df = make_ohlcv("2021-01-04", 5)
+        save_ticker_data("AAPL", {"ohlcv": df}, self.data_dir)
+
+        self.assertEqual(migrate_to_partitioned(self.data_dir), {"AAPL": True})
+        loaded = load_partitioned_data(self.data_dir, "ohlcv")
+        self.assertTrue(loaded["AAPL"].sort_index().index.equals(df.index))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+"""Tests for the updater module."""
+
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import pandas as pd
+
+from yfinance_scraper.storage import (
+    clear_footer_cache,
+    get_ticker_file,
+    load_summary_index,
+    load_ticker_data,
+    save_dataframe_to_parquet,
+    save_ticker_data,
+    update_summary_index
+)
+from yfinance_scraper.updater import _merge_time_series, update_data_for_tickers, update_ticker_data
+from tests.helpers import make_ohlcv
+
+
+class TestMergeTimeSeries(unittest.TestCase):
+    """Test merging new rows into stored data."""
+
+    def test_new_values_win_on_overlap(self):
+        """Test that shared dates take the new values and order is kept."""
+        existing = make_ohlcv("2021-01-04", 5)
+        new = make_ohlcv("2021-01-07", 4, base=200.0)
+
+        merged = _merge_time_series(existing, new)
+        self.assertTrue(merged.index.is_monotonic_increasing)
+        self.assertTrue(merged.index.is_unique)
+        self.assertEqual(len(merged), 7)
+        self.assertEqual(merged["Close"].tolist(), [100, 101, 102, 200, 201, 202, 203])
+
+    def test_stored_dates_missing_from_new_data_are_kept(self):
+        """Test that the general path keeps stored rows the new data skips."""
+        existing = make_ohlcv("2021-01-04", 5)
+        new = make_ohlcv("2021-01-05", 5, base=200.0).drop(index=pd.Timestamp("2021-01-06", tz="America/New_York"))
+
+        merged = _merge_time_series(existing, new)
+        self.assertEqual(len(merged), 6)
+        self.assertTrue(merged.index.is_monotonic_increasing)
+        self.assertEqual(merged.loc["2021-01-06", "Close"].item(), 102)
+        self.assertEqual(merged.loc["2021-01-05", "Close"].item(), 200)
+
+
+class TestUpdateTickerData(unittest.TestCase):
+    """Test updating a stored ticker with mocked downloads."""
+
+    def setUp(self):
+        """Set up a temporary data directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = self.temp_dir.name
+        clear_footer_cache()
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def update(self, new: pd.DataFrame) -> bool:
+        """Run update_ticker_data with the download returning new."""
+        with patch("yfinance_scraper.updater.fetch_data_from_date", return_value={"AAPL": {"ohlcv": new}}) as fetch:
+            result = update_ticker_data("AAPL", self.data_dir)
+        self.assertEqual(fetch.call_count, 1)
+        return result
+
+    def stored(self) -> pd.DataFrame:
+        """The ticker's stored OHLCV data."""
+        return load_ticker_data("AAPL", self.data_dir, ["ohlcv"])["ohlcv"]
+
+    def test_append_after_stored_range(self):
+        """Test that new rows after the stored range are appended."""
+        existing = make_ohlcv("2021-01-04", 5)
+        save_ticker_data("AAPL", {"ohlcv": existing}, self.data_dir)
+        new = make_ohlcv("2021-01-11", 3, base=200.0)
+
+        with patch("yfinance_scraper.updater.save_ticker_data") as save:
+            self.assertTrue(self.update(new))
+        save.assert_not_called()
+
+        pd.testing.assert_frame_equal(self.stored(), pd.concat([existing, new]), check_freq=False)
+
+    def test_overlap_falls_back_to_merge(self):
+        """Test that rows overlapping the stored range are merged and rewritten."""
+        save_ticker_data("AAPL", {"ohlcv": make_ohlcv("2021-01-04", 5)}, self.data_dir)
+        new = make_ohlcv("2021-01-07", 4, base=200.0)
+
+        self.assertTrue(self.update(new))
+
+        result = self.stored()
+        self.assertEqual(len(result), 7)
+        self.assertTrue(result.index.is_unique)
+        self.assertEqual(result["Close"].tolist(), [100, 101, 102, 200, 201, 202, 203])
+
+    def test_legacy_float64_file_with_action_columns(self):
+        """Test that a file from before the compact format is merged, not appended."""
+        legacy = make_ohlcv("2021-01-04", 5).astype("float64")
+        legacy["Dividends"] = 0.0
+        legacy["Stock Splits"] = 0.0
+        save_dataframe_to_parquet(legacy, get_ticker_file(self.data_dir, "AAPL", "ohlcv"))
+        new = make_ohlcv("2021-01-11", 3, base=200.0)
+
+        self.assertTrue(self.update(new))
+
+        result = self.stored()
+        self.assertEqual(len(result), 8)
+        self.assertEqual(result["Close"].tolist(), [100, 101, 102, 103, 104, 200, 201, 202])
+        self.assertEqual(result["Dividends"].iloc[:5].tolist(), [0.0] * 5)
+        self.assertTrue(result["Dividends"].iloc[5:].isna().all())
+
+    def test_no_stored_data(self):
+        """Test that a ticker without stored data is skipped."""
+        with patch("yfinance_scraper.updater.fetch_data_from_date") as fetch:
+            self.assertFalse(update_ticker_data("AAPL", self.data_dir))
+        fetch.assert_not_called()
+
+    def test_summary_written_once(self):
+        """Test that updating many tickers rewrites the summary index once."""
+        new_data = {}
+        for ticker in ["AAPL", "MSFT", "GOOG"]:
+            save_ticker_data(ticker, {"ohlcv": make_ohlcv("2021-01-04", 5)}, self.data_dir)
+            new_data[ticker] = {"ohlcv": make_ohlcv("2021-01-11", 3, base=200.0)}
+
+        def fetch(tickers, **kwargs):
+            return {ticker: new_data[ticker] for ticker in tickers}
+
+        with patch("yfinance_scraper.updater.fetch_data_from_date", side_effect=fetch), \
+                patch("yfinance_scraper.updater.update_summary_index", wraps=update_summary_index) as direct, \
+                patch("yfinance_scraper.storage.update_summary_index", wraps=update_summary_index) as update:
+            stats = update_data_for_tickers(["AAPL", "MSFT", "GOOG"], self.data_dir)
+
+        self.assertEqual(stats.success, 3)
+        self.assertEqual(direct.call_count + update.call_count, 1)
+        summary = load_summary_index(self.data_dir)
+        for ticker in ["AAPL", "MSFT", "GOOG"]:
+            self.assertEqual(summary[ticker]["trading_days"], 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
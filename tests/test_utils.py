@@ -0,0 +1,185 @@
+"""Tests for the utility functions."""
+
+import os
+import tempfile
+import time
+import unittest
+from datetime import date, datetime
+
+from yfinance_scraper.utils import (
+    chunk_list,
+    chunk_list_iter,
+    format_date,
+    get_valid_intervals,
+    get_valid_periods,
+    is_valid_interval,
+    is_valid_period,
+    load_tickers_from_file,
+    parse_date,
+    parse_dates,
+    prioritize_tickers,
+    validate_ticker_symbol,
+    validate_tickers
+)
+
+
+class TestParseDate(unittest.TestCase):
+    """Test date parsing."""
+
+    def test_supported_formats(self):
+        """Test that every accepted format parses to the same date."""
+        expected = datetime(2021, 3, 14)
+        for date_str in ["2021-03-14", "2021/03/14", "03/14/2021", "14-03-2021", "14/03/2021"]:
+            self.assertEqual(parse_date(date_str), expected, date_str)
+
+    def test_ambiguous_date_after_day_first(self):
+        """Test that month-first wins for ambiguous dates whatever came before."""
+        self.assertEqual(parse_date("25/12/2020"), datetime(2020, 12, 25))
+        self.assertEqual(parse_date("03/04/2020"), datetime(2020, 3, 4))
+        self.assertEqual(parse_date("26/12/2020"), datetime(2020, 12, 26))
+
+    def test_invalid_date(self):
+        """Test that unparsable strings give None, also when repeated."""
+        with self.assertLogs("yfinance_scraper.utils", level="ERROR"):
+            self.assertIsNone(parse_date("not a date"))
+        with self.assertLogs("yfinance_scraper.utils", level="ERROR"):
+            self.assertIsNone(parse_date("not a date"))
+
+    def test_invalid_iso_date(self):
+        """Test that an ISO-shaped string with an impossible date gives None."""
+        with self.assertLogs("yfinance_scraper.utils", level="ERROR"):
+            self.assertIsNone(parse_date("2021-02-30"))
+        with self.assertLogs("yfinance_scraper.utils", level="ERROR"):
+            self.assertIsNone(parse_date("2021-+2-03"))
+
+    def test_parse_dates(self):
+        """Test that bulk parsing keeps order and marks failures with None."""
+        with self.assertLogs("yfinance_scraper.utils", level="ERROR"):
+            result = parse_dates(["2021-01-02", "bad", "2021-01-02", "01/03/2021"])
+        self.assertEqual(result, [datetime(2021, 1, 2), None, datetime(2021, 1, 2), datetime(2021, 1, 3)])
+
+
+class TestFormatDate(unittest.TestCase):
+    """Test date formatting."""
+
+    def test_format_date(self):
+        """Test that dates and datetimes format as YYYY-MM-DD."""
+        self.assertEqual(format_date(date(2021, 3, 4)), "2021-03-04")
+        self.assertEqual(format_date(datetime(2021, 12, 31, 23, 59)), "2021-12-31")
+
+
+class TestValidateTickers(unittest.TestCase):
+    """Test ticker symbol validation."""
+
+    def test_validate_ticker_symbol(self):
+        """Test accepted and rejected ticker symbols."""
+        for ticker in ["AAPL", "brk.b", "^GSPC", "BF-B", "0700"]:
+            self.assertTrue(validate_ticker_symbol(ticker), ticker)
+        for ticker in ["", "ABCDEFGHIJK", "A B", "A_B", "AÉ", "ß"]:
+            self.assertFalse(validate_ticker_symbol(ticker), ticker)
+
+    def test_validate_tickers(self):
+        """Test that valid tickers are uppercased once each and invalid ones dropped."""
+        with self.assertLogs("yfinance_scraper.utils", level="WARNING") as logs:
+            result = validate_tickers(["aapl", "MSFT", "AAPL", "bad ticker", "bad ticker", "ß"])
+        self.assertEqual(result, ["AAPL", "MSFT"])
+        self.assertEqual(len(logs.records), 2)
+
+
+class TestValidOptions(unittest.TestCase):
+    """Test the interval and period lists."""
+
+    def test_intervals_and_periods(self):
+        """Test that the helpers agree with the published lists."""
+        self.assertIn("1d", get_valid_intervals())
+        self.assertIn("ytd", get_valid_periods())
+        self.assertTrue(is_valid_interval("1wk"))
+        self.assertFalse(is_valid_interval("1y"))
+        self.assertTrue(is_valid_period("1y"))
+        self.assertFalse(is_valid_period("1wk"))
+
+
+class TestPrioritizeTickers(unittest.TestCase):
+    """Test ordering tickers by cache state."""
+
+    def setUp(self):
+        """Set up a data directory with one fresh and one stale ticker."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.data_dir = self.temp_dir.name
+        for ticker in ["FRESH", "STALE"]:
+            os.makedirs(os.path.join(self.data_dir, ticker))
+            open(os.path.join(self.data_dir, ticker, "ohlcv.parquet"), "w").close()
+        old = time.time() - 3 * 86400
+        os.utime(os.path.join(self.data_dir, "STALE", "ohlcv.parquet"), (old, old))
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_order(self):
+        """Test that uncached tickers come first and fresh ones last."""
+        result = prioritize_tickers(["FRESH", "STALE", "NEW"], self.data_dir, max_age_days=1)
+        self.assertEqual(result, ["NEW", "STALE", "FRESH"])
+
+    def test_missing_data_dir(self):
+        """Test that every ticker counts as uncached without a data directory."""
+        missing = os.path.join(self.data_dir, "missing")
+        self.assertEqual(prioritize_tickers(["A", "B"], missing), ["A", "B"])
+
+
+class TestChunkList(unittest.TestCase):
+    """Test splitting lists into chunks."""
+
+    def test_chunk_list(self):
+        """Test that chunks keep order and the last one holds the remainder."""
+        items = list(range(7))
+        self.assertEqual(chunk_list(items, 3), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(chunk_list(items, 1), [[i] for i in items])
+        self.assertEqual(chunk_list([], 3), [])
+
+    def test_chunk_list_iter(self):
+        """Test that the generator yields the same chunks as chunk_list."""
+        items = list(range(10))
+        for size in [1, 3, 10, 20]:
+            self.assertEqual(list(chunk_list_iter(items, size)), chunk_list(items, size))
+        with self.assertRaises(ValueError):
+            list(chunk_list_iter(items, 0))
+
+
+class TestLoadTickersFromFile(unittest.TestCase):
+    """Test reading ticker files."""
+
+    def setUp(self):
+        """Set up a temporary data directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, "tickers.txt")
+
+    def tearDown(self):
+        """Clean up after tests."""
+        self.temp_dir.cleanup()
+
+    def test_load_and_reload(self):
+        """Test that tickers are validated and a changed file is read again."""
+        with open(self.path, "w") as f:
+            f.write("aapl\nMSFT\n\n  GOOG \nAAPL\n")
+        self.assertEqual(load_tickers_from_file(self.temp_dir.name), ["AAPL", "MSFT", "GOOG"])
+        self.assertEqual(load_tickers_from_file(self.temp_dir.name), ["AAPL", "MSFT", "GOOG"])
+
+        with open(self.path, "w") as f:
+            f.write("AMZN\nTSLA\nNVDA\nMETA\n")
+        self.assertEqual(load_tickers_from_file(self.temp_dir.name), ["AMZN", "TSLA", "NVDA", "META"])
+
+    def test_one_ticker_per_line(self):
+        """Test that a line with several words is one invalid ticker, not several."""
+        with open(self.path, "w") as f:
+            f.write("AAPL MSFT\r\nBRK B\n\tGOOG\t\n")
+        with self.assertLogs("yfinance_scraper.utils", level="WARNING"):
+            self.assertEqual(load_tickers_from_file(self.temp_dir.name), ["GOOG"])
+
+    def test_missing_file(self):
+        """Test that a missing file gives an empty list."""
+        self.assertEqual(load_tickers_from_file(self.temp_dir.name, "missing.txt"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,31 +1,45 @@
 """YFinance Scraper package for retrieving and storing Yahoo Finance data."""
 
+import importlib
+
 __version__ = "0.1.0"
 
-# Import and expose key functions for ease of use
-from yfinance_scraper.loader import (
-    get_available_tickers,
-    get_available_data_types,
-    load_ticker_history,
-    load_ticker_financials,
-    load_portfolio_history,
-    load_all_ticker_data,
-    load_field_for_all_tickers,
-    get_data_summary
-)
-
-from yfinance_scraper.fetcher import (
-    fetch_data_for_tickers,
-    fetch_data_from_date
-)
-
-from yfinance_scraper.storage import (
-    save_ticker_data,
-    load_ticker_data,
-    load_data_for_tickers
-)
-
-from yfinance_scraper.config import (
-    load_config,
-    update_config
-) 
\ No newline at end of file
+# Key functions exposed for ease of use. They are imported on first access
+# (PEP 562) so importing the package, e.g. for the CLI, does not pull in
+# pandas, pyarrow and yfinance until they are actually needed.
+_EXPORTS = {
+    "get_available_tickers": "yfinance_scraper.loader",
+    "get_available_data_types": "yfinance_scraper.loader",
+    "load_ticker_history": "yfinance_scraper.loader",
+    "load_ticker_financials": "yfinance_scraper.loader",
+    "load_portfolio_history": "yfinance_scraper.loader",
+    "load_all_ticker_data": "yfinance_scraper.loader",
+    "load_field_for_all_tickers": "yfinance_scraper.loader",
+    "load_field_bulk": "yfinance_scraper.loader",
+    "get_data_summary": "yfinance_scraper.loader",
+    "fetch_data_for_tickers": "yfinance_scraper.fetcher",
+    "fetch_data_for_tickers_async": "yfinance_scraper.fetcher",
+    "fetch_data_from_date": "yfinance_scraper.fetcher",
+    "save_ticker_data": "yfinance_scraper.storage",
+    "load_ticker_data": "yfinance_scraper.storage",
+    "load_data_for_tickers": "yfinance_scraper.storage",
+    "load_data_for_tickers_async": "yfinance_scraper.storage",
+    "load_config": "yfinance_scraper.config",
+    "update_config": "yfinance_scraper.config",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    # Cache on the package so later lookups skip __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,38 +1,59 @@
 """Command Line Interface for yfinance_scraper."""
 
 import argparse
+import asyncio
+import functools
 import logging
 import sys
 from typing import List, Optional
 import json
 import os
-import pandas as pd
 
+# pandas, yfinance and pyarrow are only imported by the subcommands that
+# need them, so commands like 'config --show' start quickly
 from yfinance_scraper.config import (
     load_config,
     update_config,
+    dump_config,
+    get_log_level,
     DEFAULT_CONFIG_PATH
 )
-from yfinance_scraper.fetcher import fetch_data_for_tickers
-from yfinance_scraper.storage import save_data_for_tickers
-from yfinance_scraper.updater import update_data_for_tickers
 from yfinance_scraper.utils import save_tickers_to_file, load_tickers_from_file
-from yfinance_scraper.loader import (
-    get_available_tickers,
-    get_available_data_types,
-    get_data_summary,
-    load_ticker_history,
-    load_ticker_financials
-)
 
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _configure_logging() -> None:
+    """Set up root logging once per process."""
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+
+def _positive_float(value: str) -> float:
+    """argparse type for options that must be a number greater than zero."""
+    try:
+        number = float(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid number: {value!r}")
+    if not 0 < number < float("inf"):
+        raise argparse.ArgumentTypeError(f"must be a positive number, got {value}")
+    return number
+
+
+def _positive_int(value: str) -> int:
+    """argparse type for options that must be an integer greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {value!r}")
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be positive, got {value}")
+    return number
+
+
 def setup_fetch_parser(subparsers):
     """Set up the fetch subcommand parser."""
     parser = subparsers.add_parser(
@@ -75,7 +96,10 @@ def setup_fetch_parser(subparsers):
     parser.add_argument(
         "--from-file",
         type=str,
-        help="Load tickers from specified file"
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Load tickers from PATH (default: tickers.txt in the data directory)"
     )
     
     parser.add_argument(
@@ -86,21 +110,36 @@ def setup_fetch_parser(subparsers):
     
     parser.add_argument(
         "--batch-size",
-        type=int,
+        type=_positive_int,
+        default=50,
         help="Number of tickers to process in a batch"
     )
     
     parser.add_argument(
         "--daily-limit",
-        type=int,
-        help="Maximum number of tickers to process per day"
+        type=_positive_int,
+        default=400,
+        help="Maximum number of tickers fetched from Yahoo per day, across runs"
     )
     
     parser.add_argument(
         "--max-retries",
-        type=int,
+        type=_positive_int,
+        default=5,
         help="Maximum number of retry attempts for rate limiting"
     )
+    
+    parser.add_argument(
+        "--rate",
+        type=_positive_float,
+        help="Maximum tickers started per second; enables the concurrent fetch path"
+    )
+    
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        help="Number of tickers fetched at once; enables the concurrent fetch path"
+    )
 
 
 def setup_update_parser(subparsers):
@@ -138,8 +177,17 @@ def setup_update_parser(subparsers):
     
     parser.add_argument(
         "--from-file",
-        action="store_true",
-        help="Load tickers from tickers.txt file in data directory"
+        type=str,
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Load tickers from PATH (default: tickers.txt in the data directory)"
+    )
+    
+    parser.add_argument(
+        "--workers",
+        type=_positive_int,
+        help="Number of tickers updated at once (default: 8)"
     )
 
 
@@ -266,8 +314,52 @@ def setup_load_parser(subparsers):
     )
 
 
+def _load_tickers_arg(file_path: str, data_dir: str) -> List[str]:
+    """Load tickers for --from-file.
+    
+    Args:
+        file_path: Path given on the command line; empty for the default
+            tickers.txt in data_dir
+        data_dir: Data directory
+        
+    Returns:
+        List of ticker symbols, empty (with an error logged) if none were found
+    """
+    if file_path:
+        directory, filename = os.path.split(file_path)
+        directory = directory or "."
+    else:
+        directory, filename = data_dir, "tickers.txt"
+    
+    tickers = load_tickers_from_file(directory, filename)
+    if not tickers:
+        logger.error(f"No tickers found in {os.path.join(directory, filename)}")
+    return tickers
+
+
+async def _fetch_concurrently(config, args):
+    """Fetch tickers one by one with bounded concurrency and an optional rate limit."""
+    from yfinance_scraper.fetcher import fetch_data_for_tickers_async, MAX_CONCURRENCY
+    from yfinance_scraper.ratelimit import TokenBucketRateLimiter
+    
+    rate_limiter = TokenBucketRateLimiter(max_tokens=args.rate, refill_interval=1.0) if args.rate else None
+    return await fetch_data_for_tickers_async(
+        tickers=config["tickers"],
+        period=config["period"],
+        interval=config["interval"],
+        data_dir=config["data_dir"],
+        max_retries=args.max_retries,
+        force_refresh=args.force_refresh,
+        max_concurrency=args.concurrency or MAX_CONCURRENCY,
+        rate_limiter=rate_limiter,
+        daily_limit=args.daily_limit
+    )
+
+
 def handle_fetch(args):
     """Handle the fetch subcommand."""
+    from yfinance_scraper.fetcher import fetch_data_for_tickers
+    
     config = load_config(args.config)
     
     # Override config with command line arguments
@@ -275,50 +367,40 @@ def handle_fetch(args):
         config["data_dir"] = args.data_dir
     
     # Load tickers from file if requested
-    if args.from_file:
-        from yfinance_scraper.utils import load_tickers_from_file
-        file_path = args.from_file
-        if os.path.exists(file_path):
-            with open(file_path, 'r') as f:
-                file_tickers = [line.strip() for line in f if line.strip()]
-            if file_tickers:
-                config["tickers"] = file_tickers
-                logger.info(f"Loaded {len(file_tickers)} tickers from {file_path}")
-            else:
-                logger.error(f"No tickers found in {file_path}")
-                return 1
-        else:
-            logger.error(f"Ticker file not found: {file_path}")
+    if args.from_file is not None:
+        file_tickers = _load_tickers_arg(args.from_file, config["data_dir"])
+        if not file_tickers:
             return 1
+        config["tickers"] = file_tickers
     elif args.tickers:
         config["tickers"] = args.tickers
+    
+    # Drop duplicate tickers, keeping the first occurrence
+    config["tickers"] = list(dict.fromkeys(config["tickers"]))
         
     if args.period:
         config["period"] = args.period
     if args.interval:
         config["interval"] = args.interval
     
-    # Additional optimization parameters
-    force_refresh = args.force_refresh if args.force_refresh else False
-    batch_size = args.batch_size if args.batch_size else 50
-    daily_limit = args.daily_limit if args.daily_limit else 400
-    max_retries = args.max_retries if args.max_retries else 5
-    
     # Set log level
-    logging.getLogger().setLevel(config["log_level"])
+    logging.getLogger().setLevel(get_log_level(config))
     
     # Fetch data with optimizations
     logger.info(f"Fetching data for {len(config['tickers'])} tickers")
-    data = fetch_data_for_tickers(
-        tickers=config["tickers"],
-        period=config["period"],
-        interval=config["interval"],
-        data_dir=config["data_dir"],
-        force_refresh=force_refresh,
-        batch_size=batch_size,
-        daily_limit=daily_limit,
-        max_retries=max_retries
-    )
+    if args.rate or args.concurrency:
+        data = asyncio.run(_fetch_concurrently(config, args))
+    else:
+        data = fetch_data_for_tickers(
+            tickers=config["tickers"],
+            period=config["period"],
+            interval=config["interval"],
+            data_dir=config["data_dir"],
+            force_refresh=args.force_refresh,
+            batch_size=args.batch_size,
+            daily_limit=args.daily_limit,
+            max_retries=args.max_retries
+        )
     
     # No need to save data separately as it's cached during fetching
     if data:
@@ -332,6 +414,8 @@ def handle_fetch(args):
 
 def handle_update(args):
     """Handle the update subcommand."""
+    from yfinance_scraper.updater import update_data_for_tickers, UPDATE_WORKERS
+    
     config = load_config(args.config)
     
     # Override config with command line arguments
@@ -339,65 +423,67 @@ def handle_update(args):
         config["data_dir"] = args.data_dir
         
     # Load tickers from file if requested
-    if args.from_file:
-        file_tickers = load_tickers_from_file(config["data_dir"])
-        if file_tickers:
-            config["tickers"] = file_tickers
+    if args.from_file is not None:
+        file_tickers = _load_tickers_arg(args.from_file, config["data_dir"])
+        if not file_tickers:
+            return 1
+        config["tickers"] = file_tickers
     elif args.tickers:
         config["tickers"] = args.tickers
+    
+    # Drop duplicate tickers, keeping the first occurrence
+    config["tickers"] = list(dict.fromkeys(config["tickers"]))
         
     if args.interval:
         config["interval"] = args.interval
     
     # Set log level
-    logging.getLogger().setLevel(config["log_level"])
+    logging.getLogger().setLevel(get_log_level(config))
     
     # Update data
     logger.info(f"Updating data for {len(config['tickers'])} tickers")
-    results = update_data_for_tickers(
+    stats = update_data_for_tickers(
         tickers=config["tickers"],
         data_dir=config["data_dir"],
-        interval=config["interval"]
+        interval=config["interval"],
+        max_workers=args.workers or UPDATE_WORKERS
     )
     
     # Check results
-    success_count = sum(results.values())
-    if success_count < len(config["tickers"]):
-        logger.warning(f"Updated {success_count}/{len(config['tickers'])} tickers")
+    if stats.success < stats.total:
+        logger.warning(f"Updated {stats.success}/{stats.total} tickers")
         return 1
     else:
-        logger.info(f"All {len(config['tickers'])} tickers updated successfully")
+        logger.info(f"All {stats.total} tickers updated successfully")
         return 0
 
 
+def _coerce_config_value(value: str):
+    """Convert a --set value to the JSON type it spells, if any.
+    
+    Booleans and null are matched case-insensitively; numbers, lists and
+    objects are parsed by the json module. Anything else stays a string.
+    """
+    lowered = value.lower()
+    if lowered in ("true", "false", "null"):
+        value = lowered
+    try:
+        return json.loads(value)
+    except ValueError:
+        return value
+
+
 def handle_config(args):
     """Handle the config subcommand."""
     config = load_config(args.config)
     
     # Show current configuration
     if args.show:
-        print(json.dumps(config, indent=4))
+        print(dump_config(config).decode("utf-8"))
     
     # Set configuration options
     if args.set:
-        updates = {}
-        for key, value in args.set:
-            # Try to convert value to appropriate type
-            try:
-                if value.lower() == "true":
-                    value = True
-                elif value.lower() == "false":
-                    value = False
-                elif value.isdigit():
-                    value = int(value)
-                elif "." in value and all(p.isdigit() for p in value.split(".")):
-                    value = float(value)
-                elif value.startswith("[") and value.endswith("]"):
-                    value = json.loads(value)
-            except (ValueError, json.JSONDecodeError):
-                pass
-                
-            updates[key] = value
+        updates = {key: _coerce_config_value(value) for key, value in args.set}
         
         if updates:
             update_config(updates, args.config)
@@ -428,8 +514,7 @@ def handle_tickers(args):
             
         if args.load:
             print("Tickers:")
-            for ticker in tickers:
-                print(f"  {ticker}")
+            print("\n".join(f"  {ticker}" for ticker in tickers))
         
         # Update config with tickers from file
         if args.update_config:
@@ -439,8 +524,42 @@ def handle_tickers(args):
     return 0
 
 
+def _json_default(value):
+    """Serialize pandas timestamps (and NaT) for orjson."""
+    import pandas as pd
+    
+    if value is pd.NaT:
+        return None
+    if isinstance(value, pd.Timestamp):
+        return value.isoformat()
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def _write_summary_json(summary, output_path: str) -> None:
+    """Write a data summary as a JSON list of records with ISO 8601 dates."""
+    try:
+        import orjson
+    except ImportError:
+        summary.to_json(output_path, orient="records", date_format="iso", indent=4)
+        return
+    
+    records = summary.to_dict(orient="records")
+    with open(output_path, "wb") as f:
+        f.write(orjson.dumps(records, default=_json_default, option=orjson.OPT_INDENT_2))
+
+
 def handle_load(args):
     """Handle the load subcommand."""
+    import pandas as pd
+    from yfinance_scraper.loader import (
+        get_available_tickers,
+        get_available_data_types,
+        get_data_summary,
+        load_ticker_history,
+        load_ticker_financials,
+        ticker_exists
+    )
+    
     config = load_config(args.config)
     
     # Override config with command line arguments
@@ -454,8 +573,7 @@ def handle_load(args):
         tickers = get_available_tickers(data_dir)
         if tickers:
             print(f"Found {len(tickers)} tickers in {data_dir}:")
-            for ticker in tickers:
-                print(f"  {ticker}")
+            print("\n".join(f"  {ticker}" for ticker in tickers))
         else:
             print(f"No tickers found in {data_dir}")
         return 0
@@ -474,18 +592,21 @@ def handle_load(args):
             if args.format == "csv":
                 summary.to_csv(output_path, index=False)
             elif args.format == "json":
-                summary.to_json(output_path, orient="records", indent=4)
+                _write_summary_json(summary, output_path)
             elif args.format == "parquet":
-                summary.to_parquet(output_path, index=False)
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(summary, preserve_index=False)
+                pq.write_table(table, output_path, compression="zstd")
             elif args.format == "excel":
                 summary.to_excel(output_path, index=False)
             print(f"Data summary saved to {output_path}")
         else:
-            # Print summary to console
-            pd.set_option('display.max_rows', None)
-            pd.set_option('display.max_columns', None)
-            pd.set_option('display.width', None)
-            print(summary)
+            # Print the full summary without changing global pandas options
+            with pd.option_context('display.max_rows', None,
+                                   'display.max_columns', None,
+                                   'display.width', None):
+                print(summary)
             
         return 0
     
@@ -494,8 +615,7 @@ def handle_load(args):
         ticker = args.ticker_info
         
         # Check if ticker exists
-        available_tickers = get_available_tickers(data_dir)
-        if ticker not in available_tickers:
+        if not ticker_exists(data_dir, ticker):
             print(f"Ticker {ticker} not found in {data_dir}")
             return 1
             
@@ -503,8 +623,7 @@ def handle_load(args):
         data_types = get_available_data_types(data_dir, ticker)
         
         print(f"Data available for {ticker}:")
-        for data_type in sorted(data_types.get(ticker, [])):
-            print(f"  - {data_type}")
+        print("\n".join(f"  - {data_type}" for data_type in sorted(data_types.get(ticker, []))))
             
         # Print some sample data
         if 'ohlcv' in data_types.get(ticker, []):
@@ -530,8 +649,12 @@ def handle_load(args):
     return 1
 
 
-def parse_args(args: Optional[List[str]] = None):
-    """Parse command line arguments."""
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the root argument parser with all subcommands.
+    
+    Cached so the parser is only constructed once per process.
+    """
     parser = argparse.ArgumentParser(
         description="Retrieve and store Yahoo Finance data"
     )
@@ -549,11 +672,17 @@ def parse_args(args: Optional[List[str]] = None):
     setup_tickers_parser(subparsers)
     setup_load_parser(subparsers)
     
-    return parser.parse_args(args)
+    return parser
+
+
+def parse_args(args: Optional[List[str]] = None):
+    """Parse command line arguments."""
+    return _build_parser().parse_args(args)
 
 
 def main(args: Optional[List[str]] = None) -> int:
     """Main entry point for the CLI."""
+    _configure_logging()
     parsed_args = parse_args(args)
     
     if parsed_args.version:
@@ -572,7 +701,7 @@ def main(args: Optional[List[str]] = None) -> int:
     elif parsed_args.command == "load":
         return handle_load(parsed_args)
     else:
-        parse_args(["--help"])
+        _build_parser().print_help()
         return 1
 
 
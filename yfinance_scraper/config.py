@@ -1,25 +1,54 @@
 """Configuration module for YFinance Scraper."""
 
 import os
+import copy
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 DEFAULT_DATA_DIR = os.path.join(str(Path.home()), "data/yfinance")
 DEFAULT_CONFIG_PATH = os.path.join(str(Path.home()), ".yfinance_scraper_config.json")
 DEFAULT_TICKERS = ["AAPL", "MSFT", "GOOGL", "AMZN", "META"]
-DEFAULT_CONFIG = {
+# Read-only view so callers cannot change the defaults by accident
+DEFAULT_CONFIG = MappingProxyType({
     "data_dir": DEFAULT_DATA_DIR,
     "tickers": DEFAULT_TICKERS,
     "period": "max",  # Valid periods: 1d,5d,1mo,3mo,6mo,1y,2y,5y,10y,ytd,max
     "interval": "1d",  # Valid intervals: 1m,2m,5m,15m,30m,60m,90m,1h,1d,5d,1wk,1mo,3mo
     "log_level": "INFO"
+})
+
+# Numeric levels for the "log_level" config option
+LOG_LEVELS = {
+    "DEBUG": logging.DEBUG,
+    "INFO": logging.INFO,
+    "WARNING": logging.WARNING,
+    "ERROR": logging.ERROR,
+    "CRITICAL": logging.CRITICAL
 }
 
 
+def get_log_level(config: Dict[str, Any]) -> int:
+    """Resolve the configured log level name to its numeric value.
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        Logging level, INFO if the name is missing or unknown
+    """
+    return LOG_LEVELS.get(str(config.get("log_level", "INFO")).upper(), logging.INFO)
+
+
 def ensure_data_dir(data_dir: str) -> str:
     """Ensure the data directory exists.
     
@@ -29,11 +58,46 @@ def ensure_data_dir(data_dir: str) -> str:
     Returns:
         The path to the data directory
     """
-    os.makedirs(data_dir, exist_ok=True)
+    # Path.mkdir attempts the mkdir first; os.makedirs stats the parent before it
+    Path(data_dir).mkdir(parents=True, exist_ok=True)
     logger.info(f"Data directory ensured: {data_dir}")
     return data_dir
 
 
+# Parsed config files keyed by path: ((mtime_ns, size), config)
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _read_config_file(config_path: str) -> Dict[str, Any]:
+    """Parse a configuration file, reusing the last parse if it is unchanged.
+    
+    Entries are validated against the file's modification time and size, so
+    an edited file is re-read on the next call.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Parsed configuration dictionary (shared; callers must not mutate it)
+    """
+    stat = os.stat(config_path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    if orjson is not None:
+        with open(config_path, 'rb') as f:
+            user_config = orjson.loads(f.read())
+    else:
+        with open(config_path, 'r') as f:
+            user_config = json.load(f)
+    
+    _CONFIG_CACHE[config_path] = (key, user_config)
+    return user_config
+
+
 def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
     """Load configuration from file.
     
@@ -43,14 +107,15 @@ def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
     Returns:
         Configuration dictionary
     """
-    config = DEFAULT_CONFIG.copy()
+    # The default ticker list is copied so callers never share it
+    config = {**DEFAULT_CONFIG, "tickers": list(DEFAULT_TICKERS)}
     
     if os.path.exists(config_path):
         try:
-            with open(config_path, 'r') as f:
-                user_config = json.load(f)
-                config.update(user_config)
-                logger.info(f"Loaded configuration from {config_path}")
+            user_config = _read_config_file(config_path)
+            # Hand out a copy so callers cannot mutate the cached entry
+            config = {**config, **copy.deepcopy(user_config)}
+            logger.info(f"Loaded configuration from {config_path}")
         except Exception as e:
             logger.error(f"Error loading config from {config_path}: {e}")
     else:
@@ -63,6 +128,23 @@ def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> Dict[str, Any]:
     return config
 
 
+def dump_config(config: Dict[str, Any]) -> bytes:
+    """Serialize a configuration dictionary to indented JSON.
+    
+    Uses orjson when it is installed, falling back to the standard library
+    json module; both write the same 2-space indented UTF-8 output.
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        UTF-8 encoded JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 def save_config(config: Dict[str, Any], config_path: str = DEFAULT_CONFIG_PATH) -> None:
     """Save configuration to file.
     
@@ -71,8 +153,11 @@ def save_config(config: Dict[str, Any], config_path: str = DEFAULT_CONFIG_PATH)
         config_path: Path to save the configuration file
     """
     try:
-        with open(config_path, 'w') as f:
-            json.dump(config, f, indent=4)
+        # Serialize before opening so a bad value cannot truncate the file
+        data = dump_config(config)
+        with open(config_path, 'wb') as f:
+            f.write(data)
+        _CONFIG_CACHE.pop(config_path, None)
         logger.info(f"Saved configuration to {config_path}")
     except Exception as e:
         logger.error(f"Error saving config to {config_path}: {e}")
@@ -1,35 +1,589 @@
 """Module for fetching data from Yahoo Finance with rate limit handling."""
 
 import yfinance as yf
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import List, Dict, Any, Optional, Set, Union, Tuple
 import logging
 from datetime import datetime, timedelta
 import time
 import random
 import os
+import json
+import atexit
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 
 from yfinance_scraper.utils import (
     is_cache_valid,
+    is_cache_fresh,
+    is_cache_stale_ok,
     prioritize_tickers,
     chunk_list
 )
 from yfinance_scraper.storage import (
     save_ticker_data,
     load_ticker_data,
-    get_latest_date
+    get_latest_date,
+    refresh_summary_index
 )
+from yfinance_scraper.ratelimit import DailyBudget, TokenBucket, TokenBucketRateLimiter
 
 logger = logging.getLogger(__name__)
 
 # Rate limit settings
 RATE_LIMIT_DEFAULT_TIMEOUT = 30  # seconds
+BACKOFF_BASE = 0.5  # seconds, first retry window
+BACKOFF_CAP = 60  # seconds, longest retry window
 MAX_RETRIES = 5
 BATCH_SIZE = 50
 DAILY_LIMIT = 400  # Tickers per day
 REQUEST_DELAY = 2  # seconds between requests
 BATCH_DELAY = 5  # seconds between batches
-MAX_AGE_DAYS = 1  # Data older than this will be refreshed
+# Days before each cached data type is refreshed, following how often it
+# changes. dividends and splits come with the price history and are
+# refreshed together with ohlcv.
+TTL_DAYS = {
+    "ohlcv": 1,
+    "dividends": 1,
+    "splits": 1,
+    "info": 30,
+    "financials": 90,
+    "balance_sheet": 90,
+    "cashflow": 90,
+    "earnings": 90,
+}
+PRICE_TYPES = ("ohlcv", "dividends", "splits")
+PRICE_COLUMNS = ["Open", "High", "Low", "Close", "Adj Close"]
+# Company info keys to cache (e.g. ("longName", "sector", "marketCap")); all if None
+INFO_FIELDS: Optional[Tuple[str, ...]] = None
+ACTION_COLUMNS = ["Dividends", "Stock Splits"]
+CACHE_FRESH_HOURS = 4  # Stale-while-revalidate: served without a refresh
+CACHE_STALE_DAYS = 7  # Stale-while-revalidate: served while refreshing
+MAX_CONCURRENCY = 8  # Tickers fetched at once by the async path
+FUNDAMENTALS_CONCURRENCY = 8  # Fundamentals requests in flight across threads
+REQUEST_RATE = 2.0  # Yahoo requests per second across all threads
+REQUEST_BURST = 5  # Requests allowed back to back before pacing starts
+MAX_CONCURRENT_REQUESTS = 16  # Yahoo requests in flight from the async path (YFS_MAX_CONCURRENT)
+MIN_RPS = 0.1  # Floor for the adaptive request rate
+MAX_RPS = 5.0  # Ceiling for the adaptive request rate
+RATE_INCREASE_EVERY = 10  # Successful requests before the rate is raised
+RATELIMIT_STATE_FILE = "_ratelimit.json"  # Persisted rate state in data_dir
+BUDGET_FILE = "_budget.json"  # Today's daily-limit usage in data_dir
+DOWNLOAD_TIMEOUT = 10  # Seconds before a yf.download request times out
+
+_fundamentals_semaphore = threading.Semaphore(FUNDAMENTALS_CONCURRENCY)
+# yf.download keeps per-call state only in newer yfinance; see _download
+_DOWNLOAD_THREAD_SAFE = hasattr(getattr(yf, "multi", None), "_DownloadCtx")
+_download_lock = threading.Lock()
+# Shared by every fetch path so all threads see the same congestion state
+_request_bucket = TokenBucket(REQUEST_RATE, REQUEST_BURST)
+# Async request caps, one per event loop since asyncio primitives are loop-bound
+_request_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = weakref.WeakKeyDictionary()
+
+# Rate-limit state learned from Yahoo's responses, persisted across runs
+_ratelimit_state = {"last_429_ts": 0.0, "safe_rps": REQUEST_RATE, "consecutive_success": 0}
+_ratelimit_lock = threading.Lock()
+_ratelimit_data_dir: Optional[str] = None
+_ratelimit_registered = False
+# State files already read by this process; see _restore_ratelimit_state
+_ratelimit_loaded_paths: Set[str] = set()
+
+
+def _ratelimit_state_path(data_dir: Optional[str]) -> str:
+    """Path of the persisted rate-limit state file.
+    
+    Args:
+        data_dir: Base data directory (~/.yfinance_scraper is used if None)
+        
+    Returns:
+        Path to the state file
+    """
+    if data_dir:
+        return os.path.join(data_dir, RATELIMIT_STATE_FILE)
+    return os.path.join(os.path.expanduser("~"), ".yfinance_scraper", "ratelimit.json")
+
+
+def _load_ratelimit_state(data_dir: Optional[str]) -> Dict[str, float]:
+    """Load the rate-limit state saved by a previous run.
+    
+    Args:
+        data_dir: Base data directory
+        
+    Returns:
+        State dictionary with last_429_ts, safe_rps and consecutive_success
+        (defaults for anything missing or unreadable)
+    """
+    state = {"last_429_ts": 0.0, "safe_rps": REQUEST_RATE, "consecutive_success": 0}
+    file_path = _ratelimit_state_path(data_dir)
+    
+    try:
+        with open(file_path, "r") as f:
+            saved = json.load(f)
+        for key, default in state.items():
+            if key in saved:
+                state[key] = type(default)(saved[key])
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable rate-limit state {file_path}: {e}")
+    
+    state["safe_rps"] = min(max(state["safe_rps"], MIN_RPS), MAX_RPS)
+    return state
+
+
+def _budget_path(data_dir: Optional[str]) -> Optional[str]:
+    """Path of the daily budget file, or None to keep the budget in memory."""
+    return os.path.join(data_dir, BUDGET_FILE) if data_dir else None
+
+
+def _save_ratelimit_state(data_dir: Optional[str], state: Dict[str, float]) -> bool:
+    """Persist the rate-limit state for the next run.
+    
+    Args:
+        data_dir: Base data directory
+        state: State dictionary as returned by _load_ratelimit_state
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    file_path = _ratelimit_state_path(data_dir)
+    
+    try:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        tmp_path = f"{file_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(tmp_path, file_path)
+        return True
+    except Exception as e:
+        logger.error(f"Error saving rate-limit state to {file_path}: {e}")
+        return False
+
+
+def _save_current_ratelimit_state() -> None:
+    """Save the in-memory rate-limit state (registered with atexit)."""
+    with _ratelimit_lock:
+        state = dict(_ratelimit_state)
+    _save_ratelimit_state(_ratelimit_data_dir, state)
+
+
+def _restore_ratelimit_state(data_dir: Optional[str]) -> None:
+    """Start pacing at the safe rate learned by earlier runs.
+    
+    Each location's saved state is read once per process, so the backoff
+    learned by this process is not overwritten on later fetch calls. A
+    second location is merged in, keeping the lower rate and the later
+    429. The state is saved back to the last location when the process
+    exits.
+    
+    Args:
+        data_dir: Base data directory
+    """
+    global _ratelimit_data_dir, _ratelimit_registered
+    
+    file_path = _ratelimit_state_path(data_dir)
+    with _ratelimit_lock:
+        _ratelimit_data_dir = data_dir
+        loaded = file_path in _ratelimit_loaded_paths
+        register = not _ratelimit_registered
+        _ratelimit_registered = True
+    
+    if register:
+        atexit.register(_save_current_ratelimit_state)
+    if loaded:
+        return
+    
+    state = _load_ratelimit_state(data_dir)
+    
+    with _ratelimit_lock:
+        if file_path in _ratelimit_loaded_paths:
+            return
+        if _ratelimit_loaded_paths:
+            state["safe_rps"] = min(state["safe_rps"], _ratelimit_state["safe_rps"])
+            state["last_429_ts"] = max(state["last_429_ts"], _ratelimit_state["last_429_ts"])
+            state["consecutive_success"] = _ratelimit_state["consecutive_success"]
+        _ratelimit_loaded_paths.add(file_path)
+        _ratelimit_state.update(state)
+        _request_bucket.set_rate(state["safe_rps"])
+    
+    logger.debug(f"Pacing Yahoo requests at {state['safe_rps']:.2f} requests/s")
+
+
+def _record_success() -> None:
+    """Raise the request rate by 10% after every RATE_INCREASE_EVERY successes."""
+    with _ratelimit_lock:
+        _ratelimit_state["consecutive_success"] += 1
+        if _ratelimit_state["consecutive_success"] % RATE_INCREASE_EVERY == 0:
+            _ratelimit_state["safe_rps"] = min(_ratelimit_state["safe_rps"] * 1.1, MAX_RPS)
+            _request_bucket.set_rate(_ratelimit_state["safe_rps"])
+
+
+def _record_rate_limited(delay: float) -> None:
+    """Halve the request rate and pause every caller after a 429.
+    
+    Args:
+        delay: Seconds to pause all requests
+    """
+    with _ratelimit_lock:
+        _ratelimit_state["safe_rps"] = max(_ratelimit_state["safe_rps"] * 0.5, MIN_RPS)
+        _ratelimit_state["consecutive_success"] = 0
+        _ratelimit_state["last_429_ts"] = time.time()
+        _request_bucket.set_rate(_ratelimit_state["safe_rps"])
+    _request_bucket.penalize(delay)
+
+
+def _new_session() -> Any:
+    """Create an HTTP session to share across all yfinance calls of a run.
+    
+    Reusing one session keeps connections alive and keeps Yahoo's cookie
+    and crumb, instead of setting them up again for every yf.Ticker and
+    yf.download. curl_cffi, which yfinance prefers for its browser TLS
+    fingerprint, is used when installed; otherwise a pooled requests.Session.
+    
+    Returns:
+        Session object accepted by yf.Ticker and yf.download
+    """
+    try:
+        from curl_cffi import requests as curl_requests
+        return curl_requests.Session(impersonate="chrome")
+    except ImportError:
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        session = requests.Session()
+        session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0))
+        return session
+
+
+def _request_semaphore() -> asyncio.Semaphore:
+    """Semaphore capping the Yahoo requests in flight on the running event loop.
+    
+    The limit is read from YFS_MAX_CONCURRENT (MAX_CONCURRENT_REQUESTS if
+    unset) when the loop first makes a request.
+    
+    Returns:
+        The running loop's request semaphore
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _request_semaphores.get(loop)
+    if semaphore is None:
+        limit = MAX_CONCURRENT_REQUESTS
+        value = os.getenv("YFS_MAX_CONCURRENT")
+        if value:
+            try:
+                limit = max(1, int(value))
+            except ValueError:
+                logger.warning(f"Ignoring invalid YFS_MAX_CONCURRENT: {value}")
+        semaphore = _request_semaphores[loop] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+def _download_threads(batch_size: int) -> int:
+    """Number of threads yf.download uses for one batch.
+    
+    Args:
+        batch_size: Number of tickers in the batch
+        
+    Returns:
+        YFINANCE_DOWNLOAD_THREADS if set, otherwise min(batch_size, 16)
+    """
+    value = os.getenv("YFINANCE_DOWNLOAD_THREADS")
+    if value:
+        try:
+            return max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid YFINANCE_DOWNLOAD_THREADS: {value}")
+    return max(1, min(batch_size, 16))
+
+
+def _download(**kwargs: Any) -> pd.DataFrame:
+    """Call yf.download, one call at a time where yfinance needs it.
+    
+    Older yfinance releases collect download results in module globals
+    (yfinance.shared._DFS), so downloads running at the same time reset
+    and mix each other's results. Those are serialized behind a lock;
+    releases that keep per-call download state run concurrently.
+    
+    Args:
+        **kwargs: Arguments passed to yf.download
+        
+    Returns:
+        DataFrame returned by yf.download
+    """
+    if _DOWNLOAD_THREAD_SAFE:
+        return yf.download(**kwargs)
+    with _download_lock:
+        return yf.download(**kwargs)
+
+
+def _backoff(attempt: int, base: float = BACKOFF_BASE, cap: float = BACKOFF_CAP) -> float:
+    """Exponential backoff with full jitter.
+    
+    The wait is drawn uniformly from [0, min(cap, base * 2**attempt)], so
+    workers rate limited at the same moment retry at different times.
+    
+    Args:
+        attempt: Zero-based retry attempt
+        base: Window of the first retry in seconds
+        cap: Largest window in seconds
+        
+    Returns:
+        Seconds to wait
+    """
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# Tickers being refreshed in the background by stale-while-revalidate
+_revalidating = set()
+_revalidating_lock = threading.Lock()
+
+
+def _revalidate_in_background(ticker: str, data_dir: str, **fetch_kwargs) -> None:
+    """Refresh a ticker's cache on a daemon thread unless already in progress.
+    
+    Args:
+        ticker: Ticker symbol
+        data_dir: Base data directory
+        **fetch_kwargs: Further arguments for fetch_with_retry
+    """
+    with _revalidating_lock:
+        if ticker in _revalidating:
+            return
+        _revalidating.add(ticker)
+    
+    def refresh():
+        try:
+            fetch_with_retry(ticker, data_dir=data_dir, force_refresh=True, **fetch_kwargs)
+        finally:
+            with _revalidating_lock:
+                _revalidating.discard(ticker)
+    
+    logger.info(f"Refreshing cached data for {ticker} in the background")
+    threading.Thread(target=refresh, name=f"revalidate-{ticker}", daemon=True).start()
+
+
+@functools.lru_cache(maxsize=8192)
+def _cache_valid_cached(ticker: str, data_dir: str, max_age_days: int) -> bool:
+    """is_cache_valid memoized for the duration of one fetch_data_for_tickers run.
+    
+    The cache is cleared when each run starts, so a ticker's cache is
+    checked once per run instead of once per call site.
+    """
+    return is_cache_valid(ticker, data_dir, max_age_days=max_age_days)
+
+
+def _extract_sparse(hist_data: pd.DataFrame, column: str) -> Optional[pd.DataFrame]:
+    """Rows of a price history where a corporate action column is positive.
+    
+    Args:
+        hist_data: Price history as returned by yfinance
+        column: Action column, e.g. "Dividends" or "Stock Splits"
+        
+    Returns:
+        One-column DataFrame of the nonzero rows, or None if there are none
+    """
+    if column not in hist_data.columns:
+        return None
+    positions = np.flatnonzero(hist_data[column].to_numpy() > 0)
+    if positions.size == 0:
+        return None
+    return hist_data.iloc[positions][[column]]
+
+
+def _compact_ohlcv(hist_data: pd.DataFrame) -> pd.DataFrame:
+    """Shrink a price history frame before it is cached.
+    
+    The Dividends and Stock Splits columns are dropped (they are kept under
+    their own data types), prices are stored as float32 and Volume as int64.
+    Volume always gets the same Arrow type, nullable only where yfinance left
+    gaps, so every ticker's file shares one schema and can be scanned as a
+    single dataset.
+    
+    Args:
+        hist_data: Price history as returned by yfinance
+        
+    Returns:
+        Compacted DataFrame
+    """
+    hist_data = hist_data.drop(columns=ACTION_COLUMNS, errors="ignore")
+    dtypes = {col: "float32" for col in PRICE_COLUMNS if col in hist_data.columns}
+    
+    if "Volume" in hist_data.columns:
+        dtypes["Volume"] = "int64" if hist_data["Volume"].notna().all() else "Int64"
+    
+    return hist_data.astype(dtypes)
+
+
+def _finalize_ohlcv(
+    ticker: str,
+    hist_data: pd.DataFrame,
+    data_dir: Optional[str],
+    extra: Optional[Dict[str, pd.DataFrame]] = None,
+    update_summary: bool = True
+) -> Dict[str, pd.DataFrame]:
+    """Turn a fetched price history into a ticker result and cache it.
+    
+    Dividends and splits are split out of the history, the OHLCV frame is
+    compacted, and the frames in extra (e.g. freshly fetched fundamentals)
+    are added before everything is saved.
+    
+    Args:
+        ticker: Ticker symbol
+        hist_data: Price history as returned by yfinance
+        data_dir: Base data directory for caching (nothing is saved if None)
+        extra: Further DataFrames by data type to include and save
+        update_summary: Record the OHLCV date range in the summary index
+            (callers fetching many tickers batch this themselves)
+        
+    Returns:
+        Dictionary with data frames
+    """
+    result = {"ohlcv": _compact_ohlcv(hist_data)}
+    
+    # Extract dividends and splits if available
+    dividends = _extract_sparse(hist_data, "Dividends")
+    if dividends is not None:
+        result["dividends"] = dividends
+    
+    splits = _extract_sparse(hist_data, "Stock Splits")
+    if splits is not None:
+        result["splits"] = splits
+    
+    if extra:
+        result.update(extra)
+    
+    # Save to cache if data_dir is provided
+    if data_dir:
+        save_ticker_data(ticker, result, data_dir, update_summary=update_summary)
+        logger.info(f"Cached data for {ticker}")
+    
+    return result
+
+
+def _info_frame(ticker_obj: yf.Ticker) -> Optional[pd.DataFrame]:
+    """Company information as a one-row DataFrame.
+    
+    Nested values are flattened into dotted column names. Only INFO_FIELDS
+    are kept when it is set.
+    """
+    info = ticker_obj.info
+    if not info or not isinstance(info, dict):
+        return None
+    if INFO_FIELDS is not None:
+        info = {key: info[key] for key in INFO_FIELDS if key in info}
+    return pd.json_normalize(info)
+
+
+def _statement_frame(attr: str):
+    """Build a fetcher for a financial statement attribute of yf.Ticker."""
+    def fetch(ticker_obj: yf.Ticker) -> Optional[pd.DataFrame]:
+        statement = getattr(ticker_obj, attr)
+        return statement if not statement.empty else None
+    return fetch
+
+
+def _add_earnings(result: Dict[str, pd.DataFrame]) -> None:
+    """Derive net income by period from the fetched income statement.
+    
+    yfinance's financials are the income statement, so this replaces a
+    separate income_stmt request (the earnings attribute is deprecated).
+    """
+    income_stmt = result.get("financials")
+    if income_stmt is not None and "Net Income" in income_stmt.index:
+        result["earnings"] = income_stmt.loc["Net Income"].to_frame(name="Net Income")
+
+
+# Fundamental data requested per ticker: (data type, fetcher taking a
+# yf.Ticker). "earnings" is derived from "financials" by _add_earnings.
+FUNDAMENTALS = (
+    ("info", _info_frame),
+    ("financials", _statement_frame("financials")),
+    ("balance_sheet", _statement_frame("balance_sheet")),
+    ("cashflow", _statement_frame("cashflow")),
+)
+
+
+def _fetch_fundamental(ticker_obj: yf.Ticker, ticker: str, data_type: str, fetch) -> Optional[pd.DataFrame]:
+    """Run one fundamentals fetcher, logging and swallowing its errors."""
+    try:
+        _request_bucket.acquire()
+        frame = fetch(ticker_obj)
+        _record_success()
+        return frame
+    except Exception as e:
+        if "Too Many Requests" in str(e):
+            _record_rate_limited(RATE_LIMIT_DEFAULT_TIMEOUT)
+        log = logger.warning if data_type == "info" else logger.debug
+        log(f"Could not fetch {data_type} for {ticker}: {e}")
+        return None
+
+
+def _fetch_fundamentals(
+    ticker: str,
+    ticker_obj: Optional[yf.Ticker] = None,
+    data_types: Optional[List[str]] = None,
+    session: Optional[Any] = None
+) -> Dict[str, pd.DataFrame]:
+    """Fetch the fundamental data types for a ticker.
+    
+    Requests are made back to back; concurrent callers are limited to
+    FUNDAMENTALS_CONCURRENCY requests in flight across all threads.
+    
+    Args:
+        ticker: Ticker symbol
+        ticker_obj: Existing yf.Ticker to reuse (created if None)
+        data_types: Fundamentals to fetch (all of FUNDAMENTALS if None)
+        session: HTTP session for a newly created yf.Ticker
+        
+    Returns:
+        Dictionary of the fundamentals DataFrames that were available
+    """
+    if ticker_obj is None:
+        ticker_obj = yf.Ticker(ticker, session=session)
+    
+    result = {}
+    for data_type, fetch in FUNDAMENTALS:
+        if data_types is not None and data_type not in data_types:
+            continue
+        with _fundamentals_semaphore:
+            frame = _fetch_fundamental(ticker_obj, ticker, data_type, fetch)
+        if frame is not None:
+            result[data_type] = frame
+    _add_earnings(result)
+    return result
+
+
+def _cached_fundamentals(
+    ticker: str,
+    data_dir: Optional[str],
+    force_refresh: bool = False
+) -> Tuple[Dict[str, pd.DataFrame], List[str]]:
+    """Split a ticker's fundamentals into cached ones within TTL_DAYS and ones to fetch.
+    
+    Args:
+        ticker: Ticker symbol
+        data_dir: Base data directory for caching
+        force_refresh: Treat every cached fundamental as expired
+        
+    Returns:
+        Tuple of (cached DataFrames by data type, data types to fetch)
+    """
+    if not data_dir or force_refresh:
+        return {}, [data_type for data_type, _ in FUNDAMENTALS]
+    
+    fresh = [data_type for data_type, _ in FUNDAMENTALS
+             if is_cache_valid(ticker, data_dir, data_type, TTL_DAYS[data_type])]
+    stale = [data_type for data_type, _ in FUNDAMENTALS if data_type not in fresh]
+    if "financials" in fresh:
+        # earnings is derived from financials, so it is as fresh
+        fresh.append("earnings")
+    
+    cached = load_ticker_data(ticker, data_dir, data_types=fresh) if fresh else {}
+    return cached, stale
 
 
 def fetch_with_retry(
@@ -40,7 +594,10 @@ def fetch_with_retry(
     actions: bool = True,
     data_dir: Optional[str] = None,
     max_retries: int = MAX_RETRIES,
-    force_refresh: bool = False
+    force_refresh: bool = False,
+    stale_while_revalidate: bool = False,
+    session: Optional[Any] = None,
+    update_summary: bool = True
 ) -> Dict[str, pd.DataFrame]:
     """Fetch data for a single ticker with retry logic and caching.
     
@@ -53,24 +610,68 @@ def fetch_with_retry(
         data_dir: Base data directory for caching
         max_retries: Maximum number of retry attempts
         force_refresh: Force refresh even if cache is valid
+        stale_while_revalidate: Serve cached data younger than
+            CACHE_STALE_DAYS right away, refreshing it in the background
+            once it is older than CACHE_FRESH_HOURS
+        session: HTTP session shared by the yfinance requests (yfinance
+            creates its own if None)
+        update_summary: Record the OHLCV date range in the summary index
+            (callers fetching many tickers batch this themselves)
         
     Returns:
         Dictionary with data frames
     """
     # Check cache first if data_dir is provided
-    if data_dir and not force_refresh and is_cache_valid(ticker, data_dir, max_age_days=MAX_AGE_DAYS):
-        logger.info(f"Using cached data for {ticker}")
-        return load_ticker_data(ticker, data_dir)
+    if data_dir and not force_refresh:
+        if stale_while_revalidate:
+            if is_cache_fresh(ticker, data_dir, max_age_hours=CACHE_FRESH_HOURS):
+                logger.info(f"Using cached data for {ticker}")
+                return load_ticker_data(ticker, data_dir)
+            if is_cache_stale_ok(ticker, data_dir, max_stale_days=CACHE_STALE_DAYS):
+                logger.info(f"Using stale cached data for {ticker}")
+                _revalidate_in_background(
+                    ticker,
+                    data_dir,
+                    period=period,
+                    interval=interval,
+                    prepost=prepost,
+                    actions=actions,
+                    max_retries=max_retries,
+                    session=session
+                )
+                return load_ticker_data(ticker, data_dir)
+    
+    # Each data type is only refetched once its own TTL has expired
+    cached, stale_fundamentals = _cached_fundamentals(ticker, data_dir, force_refresh)
+    price_cached = (
+        data_dir is not None
+        and not force_refresh
+        and is_cache_valid(ticker, data_dir, max_age_days=TTL_DAYS["ohlcv"])
+    )
+    if price_cached:
+        if not stale_fundamentals:
+            logger.info(f"Using cached data for {ticker}")
+            return load_ticker_data(ticker, data_dir)
+        cached.update(load_ticker_data(ticker, data_dir, data_types=list(PRICE_TYPES)))
+    
+    # One ticker object for all attempts
+    ticker_obj = yf.Ticker(ticker, session=session)
     
     # Not in cache or forced refresh, fetch with retries
     for attempt in range(max_retries):
         try:
             logger.info(f"Fetching data for {ticker} (attempt {attempt+1}/{max_retries})")
             
-            # Get ticker object
-            ticker_obj = yf.Ticker(ticker)
+            if price_cached:
+                # Only expired fundamentals need refreshing
+                result = _fetch_fundamentals(ticker, ticker_obj, stale_fundamentals)
+                if data_dir and result:
+                    save_ticker_data(ticker, result, data_dir)
+                    logger.info(f"Cached data for {ticker}")
+                return {**cached, **result}
             
             # Fetch historical data
+            _request_bucket.acquire()
             hist_data = ticker_obj.history(
                 period=period,
                 interval=interval,
@@ -78,85 +679,142 @@ def fetch_with_retry(
                 actions=actions,
                 auto_adjust=False
             )
+            _record_success()
             
             if hist_data.empty:
                 logger.warning(f"No data returned for {ticker}")
                 time.sleep(REQUEST_DELAY)  # Sleep even on empty result
                 continue
             
-            # Prepare result
-            result = {"ohlcv": hist_data}
+            # Expired fundamentals in one pass, without fixed delays
+            fundamentals = _fetch_fundamentals(ticker, ticker_obj, stale_fundamentals)
             
-            # Extract dividends and splits if available
-            if 'Dividends' in hist_data.columns and hist_data['Dividends'].any():
-                dividends = hist_data[hist_data['Dividends'] > 0][['Dividends']]
-                result["dividends"] = dividends
+            # Cached frames are not rewritten so their TTL keeps counting
+            # from their last fetch
+            result = _finalize_ohlcv(ticker, hist_data, data_dir, fundamentals, update_summary)
+            return {**cached, **result}
                 
-            if 'Stock Splits' in hist_data.columns and hist_data['Stock Splits'].any():
-                splits = hist_data[hist_data['Stock Splits'] > 0][['Stock Splits']]
-                result["splits"] = splits
+        except Exception as e:
+            if "Too Many Requests" in str(e):
+                # Rate limited, use exponential backoff
+                wait_time = _backoff(attempt)
+                logger.warning(f"Rate limited for {ticker}, waiting {wait_time:.2f}s before retry")
+                _record_rate_limited(wait_time)
+                time.sleep(wait_time)
+            else:
+                logger.error(f"Error fetching data for {ticker}: {e}")
+                time.sleep(REQUEST_DELAY)  # Still add delay on errors
+    
+    logger.error(f"Failed to fetch {ticker} after {max_retries} retries")
+    return {}
+
+
+async def fetch_with_retry_async(
+    ticker: str,
+    period: str = "max",
+    interval: str = "1d",
+    prepost: bool = False,
+    actions: bool = True,
+    data_dir: Optional[str] = None,
+    max_retries: int = MAX_RETRIES,
+    force_refresh: bool = False,
+    rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    executor: Optional[ThreadPoolExecutor] = None,
+    session: Optional[Any] = None,
+    update_summary: bool = True
+) -> Dict[str, pd.DataFrame]:
+    """Fetch data for a single ticker with retry logic and caching, without blocking the event loop.
+    
+    The blocking yfinance calls run on executor. Once the price history is
+    in, the fundamentals are requested concurrently rather than one after
+    another with a fixed delay between them; pacing is left to rate_limiter.
+    Every Yahoo request also holds the loop's request semaphore, so no more
+    than YFS_MAX_CONCURRENT are in flight however many tickers are fetched.
+    
+    Args:
+        ticker: Ticker symbol
+        period: Data period to fetch
+        interval: Data interval
+        prepost: Include pre and post market data
+        actions: Include dividends and stock splits
+        data_dir: Base data directory for caching
+        max_retries: Maximum number of retry attempts
+        force_refresh: Force refresh even if cache is valid
+        rate_limiter: Optional limiter to pass before each attempt
+        executor: Executor for the blocking calls (the loop's default if None)
+        session: HTTP session shared by the yfinance requests (yfinance
+            creates its own if None)
+        update_summary: Record the OHLCV date range in the summary index
+            (callers fetching many tickers batch this themselves)
+        
+    Returns:
+        Dictionary with data frames
+    """
+    loop = asyncio.get_running_loop()
+    
+    def run(func, *args, **kwargs):
+        return loop.run_in_executor(executor, functools.partial(func, *args, **kwargs))
+    
+    async def request(func, *args, **kwargs):
+        async with _request_semaphore():
+            return await run(func, *args, **kwargs)
+    
+    # Check cache first if data_dir is provided; fundamentals still within
+    # their TTL are reused even when the price history has to be refetched
+    cached, stale_fundamentals = await run(_cached_fundamentals, ticker, data_dir, force_refresh)
+    if data_dir and not force_refresh and not stale_fundamentals and is_cache_valid(ticker, data_dir, max_age_days=TTL_DAYS["ohlcv"]):
+        logger.info(f"Using cached data for {ticker}")
+        return await run(load_ticker_data, ticker, data_dir)
+    fetchers = [(data_type, fetch) for data_type, fetch in FUNDAMENTALS if data_type in stale_fundamentals]
+    ticker_obj = yf.Ticker(ticker, session=session)
+    
+    for attempt in range(max_retries):
+        try:
+            logger.info(f"Fetching data for {ticker} (attempt {attempt+1}/{max_retries})")
+            if rate_limiter is not None:
+                await rate_limiter.acquire()
             
-            # Get fundamental data with delays between requests
-            try:
-                # Add information about the company
-                info = ticker_obj.info
-                if info:
-                    company_info = pd.DataFrame([info])
-                    result["info"] = company_info
-                time.sleep(REQUEST_DELAY)
-            except Exception as e:
-                logger.warning(f"Could not fetch info for {ticker}: {e}")
+            await run(_request_bucket.acquire)
+            hist_data = await request(
+                ticker_obj.history,
+                period=period,
+                interval=interval,
+                prepost=prepost,
+                actions=actions,
+                auto_adjust=False
+            )
+            _record_success()
             
-            # Try to get other fundamental data with delays
-            try:
-                financials = ticker_obj.financials
-                if not financials.empty:
-                    result["financials"] = financials
-                time.sleep(REQUEST_DELAY)
-            except Exception as e:
-                logger.debug(f"Could not fetch financials for {ticker}: {e}")
-                
-            try:
-                balance_sheet = ticker_obj.balance_sheet
-                if not balance_sheet.empty:
-                    result["balance_sheet"] = balance_sheet
-                time.sleep(REQUEST_DELAY)
-            except Exception as e:
-                logger.debug(f"Could not fetch balance sheet for {ticker}: {e}")
-                
-            try:
-                cashflow = ticker_obj.cashflow
-                if not cashflow.empty:
-                    result["cashflow"] = cashflow
-                time.sleep(REQUEST_DELAY)
-            except Exception as e:
-                logger.debug(f"Could not fetch cashflow for {ticker}: {e}")
-                
-            try:
-                # Using income_stmt instead of the deprecated earnings attribute
-                income_stmt = ticker_obj.income_stmt
-                if not income_stmt.empty and "Net Income" in income_stmt.index:
-                    result["earnings"] = income_stmt.loc[["Net Income"]].T
-                time.sleep(REQUEST_DELAY)
-            except Exception as e:
-                logger.debug(f"Could not fetch earnings data for {ticker}: {e}")
+            if hist_data.empty:
+                logger.warning(f"No data returned for {ticker}")
+                await asyncio.sleep(REQUEST_DELAY)
+                continue
             
-            # Save to cache if data_dir is provided
-            if data_dir and result:
-                save_ticker_data(ticker, result, data_dir)
-                logger.info(f"Cached data for {ticker}")
+            # The fundamentals are independent requests, so issue them together
+            frames = await asyncio.gather(*(
+                request(_fetch_fundamental, ticker_obj, ticker, data_type, fetch)
+                for data_type, fetch in fetchers
+            ))
+            fundamentals = {
+                data_type: frame
+                for (data_type, _), frame in zip(fetchers, frames)
+                if frame is not None
+            }
+            _add_earnings(fundamentals)
             
-            return result
-                
+            result = await run(_finalize_ohlcv, ticker, hist_data, data_dir, fundamentals, update_summary)
+            return {**cached, **result}
+        
         except Exception as e:
             if "Too Many Requests" in str(e):
                 # Rate limited, use exponential backoff
-                wait_time = RATE_LIMIT_DEFAULT_TIMEOUT * (2 ** attempt) + random.uniform(0, 3)
+                wait_time = _backoff(attempt)
                 logger.warning(f"Rate limited for {ticker}, waiting {wait_time:.2f}s before retry")
-                time.sleep(wait_time)
+                _record_rate_limited(wait_time)
+                await asyncio.sleep(wait_time)
             else:
                 logger.error(f"Error fetching data for {ticker}: {e}")
-                time.sleep(REQUEST_DELAY)  # Still add delay on errors
+                await asyncio.sleep(REQUEST_DELAY)
     
     logger.error(f"Failed to fetch {ticker} after {max_retries} retries")
     return {}
@@ -168,7 +826,8 @@ def fetch_batch_price_data(
     interval: str = "1d",
     prepost: bool = False,
     actions: bool = True,
-    max_retries: int = MAX_RETRIES
+    max_retries: int = MAX_RETRIES,
+    session: Optional[Any] = None
 ) -> Dict[str, pd.DataFrame]:
     """Fetch price data for multiple tickers in a single batch request.
     
@@ -179,6 +838,8 @@ def fetch_batch_price_data(
         prepost: Include pre and post market data
         actions: Include dividends and stock splits
         max_retries: Maximum number of retry attempts
+        session: HTTP session shared by the yfinance requests (yfinance
+            creates its own if None)
         
     Returns:
         Dictionary with ticker symbols as keys and price data as values
@@ -191,15 +852,20 @@ def fetch_batch_price_data(
             logger.info(f"Fetching batch price data for {len(tickers)} tickers (attempt {attempt+1}/{max_retries})")
             
             # Use yf.download for more efficient batch request
-            data = yf.download(
+            _request_bucket.acquire()
+            data = _download(
                 tickers=tickers,
                 period=period,
                 interval=interval,
                 prepost=prepost,
                 actions=actions,
                 group_by='ticker',
-                auto_adjust=False
+                auto_adjust=False,
+                threads=_download_threads(len(tickers)),
+                progress=False,
+                session=session
             )
+            _record_success()
             
             if data.empty:
                 logger.warning(f"No data returned for batch of {len(tickers)} tickers")
@@ -213,10 +879,12 @@ def fetch_batch_price_data(
                 ticker = tickers[0]
                 result[ticker] = data
             else:
-                # Process multi-ticker response
+                # Process multi-ticker response; slices are only read, so
+                # they are not copied
+                returned = set(data.columns.get_level_values(0))
                 for ticker in tickers:
-                    if ticker in data.columns.levels[0]:
-                        ticker_data = data[ticker].copy()
+                    if ticker in returned:
+                        ticker_data = data[ticker]
                         if not ticker_data.empty:
                             result[ticker] = ticker_data
                     
@@ -226,8 +894,9 @@ def fetch_batch_price_data(
         except Exception as e:
             if "Too Many Requests" in str(e):
                 # Rate limited, use exponential backoff
-                wait_time = RATE_LIMIT_DEFAULT_TIMEOUT * (2 ** attempt) + random.uniform(0, 5)
+                wait_time = _backoff(attempt)
                 logger.warning(f"Rate limited for batch request, waiting {wait_time:.2f}s before retry")
+                _record_rate_limited(wait_time)
                 time.sleep(wait_time)
             else:
                 logger.error(f"Error fetching batch data: {e}")
@@ -237,6 +906,76 @@ def fetch_batch_price_data(
     return {}
 
 
+def _fetch_batch_ticker(
+    ticker: str,
+    price_data: Dict[str, pd.DataFrame],
+    period: str,
+    interval: str,
+    prepost: bool,
+    actions: bool,
+    data_dir: Optional[str],
+    max_retries: int,
+    force_refresh: bool,
+    session: Optional[Any] = None,
+    update_summary: bool = True
+) -> Dict[str, pd.DataFrame]:
+    """Assemble and cache one ticker's data after a batch price download.
+    
+    Args:
+        ticker: Ticker symbol
+        price_data: Price history by ticker from fetch_batch_price_data
+        period: Data period to fetch
+        interval: Data interval
+        prepost: Include pre and post market data
+        actions: Include dividends and stock splits
+        data_dir: Base data directory for caching
+        max_retries: Maximum number of retry attempts
+        force_refresh: Force refresh even if cache is valid
+        session: HTTP session shared by the yfinance requests (yfinance
+            creates its own if None)
+        update_summary: Record the OHLCV date range in the summary index
+            (callers fetching many tickers batch this themselves)
+        
+    Returns:
+        Dictionary with data frames (empty if the ticker failed)
+    """
+    try:
+        logger.info(f"Fetching fundamentals for {ticker}")
+        
+        # Check if we have price data for this ticker
+        if ticker in price_data and not price_data[ticker].empty:
+            # Reuse cached fundamentals still within their TTL, fetch the rest
+            cached, stale_fundamentals = _cached_fundamentals(ticker, data_dir, force_refresh)
+            fundamentals = {}
+            if stale_fundamentals:
+                fundamentals = _fetch_fundamentals(ticker, data_types=stale_fundamentals, session=session)
+            
+            ticker_result = _finalize_ohlcv(ticker, price_data[ticker], data_dir, fundamentals, update_summary)
+            return {**cached, **ticker_result}
+        
+        # If batch request didn't return data for this ticker, try individual fetch
+        return fetch_with_retry(
+            ticker=ticker,
+            period=period,
+            interval=interval,
+            prepost=prepost,
+            actions=actions,
+            data_dir=data_dir,
+            max_retries=max_retries,
+            force_refresh=force_refresh,
+            session=session,
+            update_summary=update_summary
+        )
+    
+    except Exception as e:
+        if "Too Many Requests" in str(e):
+            logger.warning(f"Rate limited during fundamentals fetch for {ticker}, skipping for now")
+            # Don't immediately retry, continue with next ticker
+        else:
+            logger.error(f"Error processing ticker {ticker}: {e}")
+        return {}
+
+
 def fetch_data_for_tickers(
     tickers: List[str],
     period: str = "max",
@@ -247,7 +986,8 @@ def fetch_data_for_tickers(
     max_retries: int = MAX_RETRIES,
     force_refresh: bool = False,
     batch_size: int = BATCH_SIZE,
-    daily_limit: int = DAILY_LIMIT
+    daily_limit: int = DAILY_LIMIT,
+    threads: Optional[int] = None
 ) -> Dict[str, Dict[str, pd.DataFrame]]:
     """Fetch data for multiple tickers with rate limit handling, batching, and caching.
     
@@ -261,7 +1001,12 @@ def fetch_data_for_tickers(
         max_retries: Maximum number of retry attempts
         force_refresh: Force refresh even if cache is valid
         batch_size: Number of tickers to process in a batch
-        daily_limit: Maximum number of tickers to process per day
+        daily_limit: Maximum number of tickers fetched from Yahoo per day,
+            shared by all runs of the day; once reached, the remaining
+            tickers are skipped and partial results returned
+        threads: Worker threads for each batch's fundamentals (defaults to
+            min(32, batch length)); yfinance requests are additionally capped
+            at FUNDAMENTALS_CONCURRENCY
         
     Returns:
         Dictionary with ticker symbols as keys and data dictionaries as values
@@ -270,186 +1015,235 @@ def fetch_data_for_tickers(
         logger.warning("No tickers provided")
         return {}
     
+    # Resume at the request rate learned by earlier runs
+    _restore_ratelimit_state(data_dir)
+    
     # Check for excessive number of tickers
     if len(tickers) > 1000:
         logger.warning(f"Large number of tickers ({len(tickers)}). This operation might take a long time.")
     
+    # Cache checks are memoized for this run only
+    _cache_valid_cached.cache_clear()
+    
+    # One HTTP session (connections, cookie and crumb) for the whole run
+    session = _new_session()
+    
     # Prioritize tickers if using cache
     if data_dir and not force_refresh:
-        tickers = prioritize_tickers(tickers, data_dir, max_age_days=MAX_AGE_DAYS)
+        tickers = prioritize_tickers(tickers, data_dir, max_age_days=TTL_DAYS["ohlcv"], cache_check=_cache_valid_cached)
         logger.info(f"Prioritized {len(tickers)} tickers based on cache status")
     
-    # Split into daily chunks to respect daily limits
-    daily_chunks = chunk_list(tickers, daily_limit)
-    logger.info(f"Split {len(tickers)} tickers into {len(daily_chunks)} daily chunks")
+    # Tickers fetched from Yahoo count against a budget shared by today's runs
+    budget = DailyBudget(daily_limit, _budget_path(data_dir))
+    budget_warned = False
     
     result = {}
     
-    for day, daily_tickers in enumerate(daily_chunks):
-        logger.info(f"Processing day {day+1}/{len(daily_chunks)}, {len(daily_tickers)} tickers")
-        
-        # Process tickers in batches for price data
-        price_batches = chunk_list(daily_tickers, batch_size)
+    # Process tickers in batches for price data
+    price_batches = chunk_list(tickers, batch_size)
+    
+    for batch_idx, batch in enumerate(price_batches):
+        logger.info(f"Processing batch {batch_idx+1}/{len(price_batches)}, {len(batch)} tickers")
         
-        batch_results = {}
-        for batch_idx, batch in enumerate(price_batches):
-            logger.info(f"Processing batch {batch_idx+1}/{len(price_batches)}, {len(batch)} tickers")
-            
-            # Skip batch if all tickers have valid cache
-            if data_dir and not force_refresh and all(is_cache_valid(t, data_dir, max_age_days=MAX_AGE_DAYS) for t in batch):
+        # Load tickers with a valid cache and only download the rest
+        if data_dir and not force_refresh:
+            fresh = {t for t in batch if _cache_valid_cached(t, data_dir, TTL_DAYS["ohlcv"])}
+            if len(fresh) == len(batch):
                 logger.info(f"Batch {batch_idx+1} entirely in cache, loading cached data")
-                for ticker in batch:
+            for ticker in batch:
+                if ticker in fresh:
                     ticker_data = load_ticker_data(ticker, data_dir)
                     if ticker_data:
-                        batch_results[ticker] = ticker_data
+                        result[ticker] = ticker_data
+            batch = [t for t in batch if t not in fresh]
+            if not batch:
+                continue
+        
+        # Stop fetching (but keep loading cached batches) once the daily
+        # budget is used up; the rest is left for a later run
+        granted = budget.consume(len(batch))
+        if granted < len(batch):
+            if not budget_warned:
+                logger.warning(f"Daily limit of {daily_limit} tickers reached, returning partial results")
+                budget_warned = True
+            batch = batch[:granted]
+            if not batch:
                 continue
+        
+        # Attempt batch download for price data first
+        try:
+            price_data = fetch_batch_price_data(
+                tickers=batch,
+                period=period,
+                interval=interval,
+                prepost=prepost,
+                actions=actions,
+                max_retries=max_retries,
+                session=session
+            )
             
-            # Attempt batch download for price data first
-            try:
-                price_data = fetch_batch_price_data(
-                    tickers=batch,
+            # Add delay between batches
+            time.sleep(BATCH_DELAY)
+            
+            # Fetch additional data (fundamentals) for the batch's tickers in parallel
+            fetch_ticker = functools.partial(
+                _fetch_batch_ticker,
+                price_data=price_data,
+                period=period,
+                interval=interval,
+                prepost=prepost,
+                actions=actions,
+                data_dir=data_dir,
+                max_retries=max_retries,
+                force_refresh=force_refresh,
+                session=session,
+                update_summary=False
+            )
+            max_workers = threads or min(32, len(batch))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # map keeps the results in batch order
+                for ticker, ticker_data in zip(batch, executor.map(fetch_ticker, batch)):
+                    if ticker_data:
+                        result[ticker] = ticker_data
+        
+        except Exception as e:
+            logger.error(f"Error processing batch {batch_idx+1}: {e}")
+            # Fall back to individual fetching for all tickers in the batch
+            for ticker in batch:
+                ticker_data = fetch_with_retry(
+                    ticker=ticker,
                     period=period,
                     interval=interval,
                     prepost=prepost,
                     actions=actions,
-                    max_retries=max_retries
+                    data_dir=data_dir,
+                    max_retries=max_retries,
+                    force_refresh=force_refresh,
+                    session=session,
+                    update_summary=False
                 )
                 
-                # Add delay between batches
-                time.sleep(BATCH_DELAY)
-                
-                # Fetch additional data (fundamentals) for each ticker individually
-                for ticker in batch:
-                    try:
-                        logger.info(f"Fetching fundamentals for {ticker}")
-                        
-                        # Check if we have price data for this ticker
-                        if ticker in price_data and not price_data[ticker].empty:
-                            # Initialize with price data
-                            ticker_result = {"ohlcv": price_data[ticker]}
-                            
-                            # Extract dividends and splits if available
-                            if 'Dividends' in price_data[ticker].columns and price_data[ticker]['Dividends'].any():
-                                dividends = price_data[ticker][price_data[ticker]['Dividends'] > 0][['Dividends']]
-                                ticker_result["dividends"] = dividends
-                                
-                            if 'Stock Splits' in price_data[ticker].columns and price_data[ticker]['Stock Splits'].any():
-                                splits = price_data[ticker][price_data[ticker]['Stock Splits'] > 0][['Stock Splits']]
-                                ticker_result["splits"] = splits
-                            
-                            # If cache is valid for fundamentals but we need fresh price data
-                            if data_dir and not force_refresh and is_cache_valid(ticker, data_dir, max_age_days=MAX_AGE_DAYS):
-                                cached_data = load_ticker_data(ticker, data_dir)
-                                # Merge fundamental data from cache
-                                for key, df in cached_data.items():
-                                    if key not in ["ohlcv", "dividends", "splits"]:
-                                        ticker_result[key] = df
-                            else:
-                                # Fetch fundamentals with retries
-                                ticker_obj = yf.Ticker(ticker)
-                                
-                                # Get fundamental data with delays between requests
-                                try:
-                                    # Add information about the company
-                                    info = ticker_obj.info
-                                    if info:
-                                        company_info = pd.DataFrame([info])
-                                        ticker_result["info"] = company_info
-                                    time.sleep(REQUEST_DELAY)
-                                except Exception as e:
-                                    logger.warning(f"Could not fetch info for {ticker}: {e}")
-                                
-                                # Try to get other fundamental data with delays
-                                try:
-                                    financials = ticker_obj.financials
-                                    if not financials.empty:
-                                        ticker_result["financials"] = financials
-                                    time.sleep(REQUEST_DELAY)
-                                except Exception as e:
-                                    logger.debug(f"Could not fetch financials for {ticker}: {e}")
-                                    
-                                try:
-                                    balance_sheet = ticker_obj.balance_sheet
-                                    if not balance_sheet.empty:
-                                        ticker_result["balance_sheet"] = balance_sheet
-                                    time.sleep(REQUEST_DELAY)
-                                except Exception as e:
-                                    logger.debug(f"Could not fetch balance sheet for {ticker}: {e}")
-                                    
-                                try:
-                                    cashflow = ticker_obj.cashflow
-                                    if not cashflow.empty:
-                                        ticker_result["cashflow"] = cashflow
-                                    time.sleep(REQUEST_DELAY)
-                                except Exception as e:
-                                    logger.debug(f"Could not fetch cashflow for {ticker}: {e}")
-                                    
-                                try:
-                                    # Using income_stmt instead of the deprecated earnings attribute
-                                    income_stmt = ticker_obj.income_stmt
-                                    if not income_stmt.empty and "Net Income" in income_stmt.index:
-                                        ticker_result["earnings"] = income_stmt.loc[["Net Income"]].T
-                                    time.sleep(REQUEST_DELAY)
-                                except Exception as e:
-                                    logger.debug(f"Could not fetch earnings data for {ticker}: {e}")
-                            
-                            # Save to cache
-                            if data_dir:
-                                save_ticker_data(ticker, ticker_result, data_dir)
-                                logger.info(f"Cached data for {ticker}")
-                            
-                            batch_results[ticker] = ticker_result
-                        else:
-                            # If batch request didn't return data for this ticker, try individual fetch
-                            ticker_data = fetch_with_retry(
-                                ticker=ticker,
-                                period=period,
-                                interval=interval,
-                                prepost=prepost,
-                                actions=actions,
-                                data_dir=data_dir,
-                                max_retries=max_retries,
-                                force_refresh=force_refresh
-                            )
-                            
-                            if ticker_data:
-                                batch_results[ticker] = ticker_data
-                    
-                    except Exception as e:
-                        if "Too Many Requests" in str(e):
-                            logger.warning(f"Rate limited during fundamentals fetch for {ticker}, skipping for now")
-                            # Don't immediately retry, continue with next ticker
-                        else:
-                            logger.error(f"Error processing ticker {ticker}: {e}")
-            
-            except Exception as e:
-                logger.error(f"Error processing batch {batch_idx+1}: {e}")
-                # Fall back to individual fetching for all tickers in the batch
-                for ticker in batch:
-                    ticker_data = fetch_with_retry(
-                        ticker=ticker,
-                        period=period,
-                        interval=interval,
-                        prepost=prepost,
-                        actions=actions,
-                        data_dir=data_dir,
-                        max_retries=max_retries,
-                        force_refresh=force_refresh
-                    )
-                    
-                    if ticker_data:
-                        batch_results[ticker] = ticker_data
+                if ticker_data:
+                    result[ticker] = ticker_data
         
-        # Update overall results with this day's batch
-        result.update(batch_results)
+        # One summary index rewrite per batch rather than per ticker
+        if data_dir:
+            refresh_summary_index(data_dir, [t for t in batch if t in result])
+    
+    logger.info(f"Total fetched: {len(result)}/{len(tickers)} tickers")
+    return result
+
+
+async def fetch_data_for_tickers_async(
+    tickers: List[str],
+    period: str = "max",
+    interval: str = "1d",
+    prepost: bool = False,
+    actions: bool = True,
+    data_dir: Optional[str] = None,
+    max_retries: int = MAX_RETRIES,
+    force_refresh: bool = False,
+    max_concurrency: int = MAX_CONCURRENCY,
+    rate_limiter: Optional[TokenBucketRateLimiter] = None,
+    daily_limit: Optional[int] = None
+) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """Fetch data for multiple tickers concurrently from an asyncio event loop.
+    
+    All tickers go into one queue drained by max_concurrency workers, each
+    running fetch_with_retry_async (including its cache check and retry
+    logic), so a slow ticker only holds up its own worker rather than a
+    whole batch.
+    
+    Args:
+        tickers: List of ticker symbols
+        period: Data period to fetch
+        interval: Data interval
+        prepost: Include pre and post market data
+        actions: Include dividends and stock splits
+        data_dir: Base data directory for caching
+        max_retries: Maximum number of retry attempts
+        force_refresh: Force refresh even if cache is valid
+        max_concurrency: Number of worker tasks, i.e. tickers fetched at once
+        rate_limiter: Optional limiter each ticker must pass before its
+            fetch starts, to stay under Yahoo's request rate
+        daily_limit: Maximum number of tickers fetched from Yahoo per day,
+            shared by all runs of the day; once reached, the remaining
+            uncached tickers are skipped (unlimited if None)
         
-        # If there are more days, add a delay between days
-        if day < len(daily_chunks) - 1:
-            logger.info(f"Day {day+1} complete. Sleeping before starting next day.")
-            # In production code, you might want to use a job scheduler instead
-            day_delay = 60  # Just a token delay for testing
-            time.sleep(day_delay)
+    Returns:
+        Dictionary with ticker symbols as keys and data dictionaries as values
+    """
+    if not tickers:
+        logger.warning("No tickers provided")
+        return {}
+    
+    _restore_ratelimit_state(data_dir)
+    session = _new_session()
+    
+    # Fetch uncached and outdated tickers first
+    if data_dir and not force_refresh:
+        tickers = prioritize_tickers(tickers, data_dir, max_age_days=TTL_DAYS["ohlcv"])
+    
+    max_concurrency = max(1, max_concurrency)
+    # Each ticker runs its history request, then its fundamentals at once
+    executor = ThreadPoolExecutor(max_workers=max_concurrency * len(FUNDAMENTALS))
+    budget = DailyBudget(daily_limit, _budget_path(data_dir)) if daily_limit else None
+    
+    queue: asyncio.Queue = asyncio.Queue()
+    for ticker in tickers:
+        queue.put_nowait(ticker)
+    fetched = {}
+    skipped = []
     
+    async def worker() -> None:
+        while True:
+            ticker = await queue.get()
+            try:
+                # Only tickers that go to Yahoo count against the daily limit
+                cached = data_dir and not force_refresh and is_cache_valid(ticker, data_dir, max_age_days=TTL_DAYS["ohlcv"])
+                if budget is not None and not cached and not budget.consume():
+                    skipped.append(ticker)
+                    continue
+                
+                ticker_data = await fetch_with_retry_async(
+                    ticker=ticker,
+                    period=period,
+                    interval=interval,
+                    prepost=prepost,
+                    actions=actions,
+                    data_dir=data_dir,
+                    max_retries=max_retries,
+                    force_refresh=force_refresh,
+                    rate_limiter=rate_limiter,
+                    executor=executor,
+                    session=session,
+                    update_summary=False
+                )
+                if ticker_data:
+                    fetched[ticker] = ticker_data
+            except Exception as e:
+                logger.error(f"Error processing ticker {ticker}: {e}")
+            finally:
+                queue.task_done()
+    
+    workers = [asyncio.create_task(worker()) for _ in range(min(max_concurrency, len(tickers)))]
+    try:
+        await queue.join()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        executor.shutdown(wait=False)
+    
+    # One summary index rewrite for the whole run rather than per ticker
+    if data_dir:
+        refresh_summary_index(data_dir, list(fetched))
+    
+    if skipped:
+        logger.warning(f"Daily limit of {daily_limit} tickers reached, skipped {len(skipped)} tickers")
+    
+    # Report in ticker order rather than completion order
+    result = {ticker: fetched[ticker] for ticker in tickers if ticker in fetched}
     logger.info(f"Total fetched: {len(result)}/{len(tickers)} tickers")
     return result
 
@@ -464,7 +1258,8 @@ def fetch_data_from_date(
     data_dir: Optional[str] = None,
     max_retries: int = MAX_RETRIES,
     batch_size: int = BATCH_SIZE,
-    daily_limit: int = DAILY_LIMIT
+    daily_limit: int = DAILY_LIMIT,
+    timeout: float = DOWNLOAD_TIMEOUT
 ) -> Dict[str, Dict[str, pd.DataFrame]]:
     """Fetch data for tickers from a specific start date with rate limit handling.
     
@@ -478,7 +1273,10 @@ def fetch_data_from_date(
         data_dir: Base data directory for caching
         max_retries: Maximum number of retry attempts
         batch_size: Number of tickers to process in a batch
-        daily_limit: Maximum number of tickers to process per day
+        daily_limit: Maximum number of tickers fetched from Yahoo per day,
+            shared by all runs of the day; once reached, the remaining
+            tickers are skipped and partial results returned
+        timeout: Seconds before a download request times out
         
     Returns:
         Dictionary with ticker symbols as keys and data dictionaries as values
@@ -488,147 +1286,132 @@ def fetch_data_from_date(
     
     logger.info(f"Fetching data for {len(tickers)} tickers from {start_date} to {end_date}")
     
+    # Resume at the request rate learned by earlier runs
+    _restore_ratelimit_state(data_dir)
+    
     # Check for excessive number of tickers
     if len(tickers) > 1000:
         logger.warning(f"Large number of tickers ({len(tickers)}). This operation might take a long time.")
     
-    # Split into daily chunks to respect daily limits
-    daily_chunks = chunk_list(tickers, daily_limit)
-    logger.info(f"Split {len(tickers)} tickers into {len(daily_chunks)} daily chunks")
+    # One HTTP session (connections, cookie and crumb) for the whole run
+    session = _new_session()
+    
+    # Tickers fetched from Yahoo count against a budget shared by today's runs
+    budget = DailyBudget(daily_limit, _budget_path(data_dir))
     
     result = {}
     
-    for day, daily_tickers in enumerate(daily_chunks):
-        logger.info(f"Processing day {day+1}/{len(daily_chunks)}, {len(daily_tickers)} tickers")
+    # Process tickers in batches
+    batches = chunk_list(tickers, batch_size)
+    
+    for batch_idx, batch in enumerate(batches):
+        granted = budget.consume(len(batch))
+        if granted < len(batch):
+            logger.warning(f"Daily limit of {daily_limit} tickers reached, returning partial results")
+            batch = batch[:granted]
+            if not batch:
+                break
         
-        # Process tickers in batches
-        batches = chunk_list(daily_tickers, batch_size)
+        logger.info(f"Processing batch {batch_idx+1}/{len(batches)}, {len(batch)} tickers")
         
-        for batch_idx, batch in enumerate(batches):
-            logger.info(f"Processing batch {batch_idx+1}/{len(batches)}, {len(batch)} tickers")
+        try:
+            # Use yf.download for more efficient batch download
+            _request_bucket.acquire()
+            hist_data = _download(
+                tickers=batch,
+                start=start_date,
+                end=end_date,
+                interval=interval,
+                prepost=prepost,
+                actions=actions,
+                group_by='ticker',
+                auto_adjust=False,
+                threads=_download_threads(len(batch)),
+                progress=False,
+                timeout=timeout,
+                session=session
+            )
+            _record_success()
             
-            try:
-                # Use yf.download for more efficient batch download
-                hist_data = yf.download(
-                    tickers=batch,
-                    start=start_date,
-                    end=end_date,
-                    interval=interval,
-                    prepost=prepost,
-                    actions=actions,
-                    group_by='ticker',
-                    auto_adjust=False
-                )
-                
-                # Add delay between batches
-                time.sleep(BATCH_DELAY)
-                
-                # Process the results
-                for ticker in batch:
-                    try:
-                        # Handle single ticker case
-                        if len(batch) == 1:
-                            ticker_hist = hist_data
+            # Add delay between batches
+            time.sleep(BATCH_DELAY)
+            
+            # Process the results
+            returned = set(hist_data.columns.get_level_values(0)) if len(batch) > 1 else set()
+            for ticker in batch:
+                try:
+                    # Handle single ticker case
+                    if len(batch) == 1:
+                        ticker_hist = hist_data
+                    else:
+                        # Get this ticker's data slice
+                        if ticker in returned:
+                            ticker_hist = hist_data[ticker]
                         else:
-                            # Get this ticker's data slice
-                            if ticker in hist_data.columns.levels[0]:
-                                ticker_hist = hist_data[ticker].copy()
-                            else:
-                                logger.warning(f"No data returned for {ticker}")
-                                continue
-                        
-                        if ticker_hist.empty:
-                            logger.warning(f"Empty data returned for {ticker}")
+                            logger.warning(f"No data returned for {ticker}")
                             continue
-                            
-                        # Store the results
-                        ticker_result = {"ohlcv": ticker_hist}
-                        
-                        # Extract dividends and splits if available
-                        if 'Dividends' in ticker_hist.columns and ticker_hist['Dividends'].any():
-                            dividends = ticker_hist[ticker_hist['Dividends'] > 0][['Dividends']]
-                            ticker_result["dividends"] = dividends
-                            
-                        if 'Stock Splits' in ticker_hist.columns and ticker_hist['Stock Splits'].any():
-                            splits = ticker_hist[ticker_hist['Stock Splits'] > 0][['Stock Splits']]
-                            ticker_result["splits"] = splits
-                        
-                        # Save to cache if data_dir is provided
-                        if data_dir:
-                            save_ticker_data(ticker, ticker_result, data_dir)
-                            logger.info(f"Cached data for {ticker}")
-                        
-                        result[ticker] = ticker_result
+                    
+                    if ticker_hist.empty:
+                        logger.warning(f"Empty data returned for {ticker}")
+                        continue
                         
-                    except Exception as e:
-                        logger.error(f"Error processing ticker {ticker}: {e}")
-            
-            except Exception as e:
-                if "Too Many Requests" in str(e):
-                    # Rate limited, use exponential backoff
-                    wait_time = RATE_LIMIT_DEFAULT_TIMEOUT * (2 ** batch_idx % 5) + random.uniform(0, 5)
-                    logger.warning(f"Rate limited for batch request, waiting {wait_time:.2f}s before trying individual requests")
-                    time.sleep(wait_time)
+                    # Store the results
+                    result[ticker] = _finalize_ohlcv(ticker, ticker_hist, data_dir, update_summary=False)
                     
-                    # Fall back to individual requests
-                    for ticker in batch:
-                        for attempt in range(max_retries):
-                            try:
-                                ticker_obj = yf.Ticker(ticker)
-                                
-                                hist_data = ticker_obj.history(
-                                    start=start_date,
-                                    end=end_date,
-                                    interval=interval,
-                                    prepost=prepost,
-                                    actions=actions,
-                                    auto_adjust=False
-                                )
-                                
-                                if hist_data.empty:
-                                    logger.warning(f"No data returned for {ticker}")
-                                    break
-                                    
-                                ticker_result = {"ohlcv": hist_data}
-                                
-                                # Extract dividends and splits if available
-                                if 'Dividends' in hist_data.columns and hist_data['Dividends'].any():
-                                    dividends = hist_data[hist_data['Dividends'] > 0][['Dividends']]
-                                    ticker_result["dividends"] = dividends
-                                    
-                                if 'Stock Splits' in hist_data.columns and hist_data['Stock Splits'].any():
-                                    splits = hist_data[hist_data['Stock Splits'] > 0][['Stock Splits']]
-                                    ticker_result["splits"] = splits
-                                
-                                # Save to cache if data_dir is provided
-                                if data_dir:
-                                    save_ticker_data(ticker, ticker_result, data_dir)
-                                    logger.info(f"Cached data for {ticker}")
-                                
-                                result[ticker] = ticker_result
+                except Exception as e:
+                    logger.error(f"Error processing ticker {ticker}: {e}")
+        
+        except Exception as e:
+            if "Too Many Requests" in str(e):
+                # Rate limited, use exponential backoff
+                wait_time = _backoff(batch_idx % 5)
+                logger.warning(f"Rate limited for batch request, waiting {wait_time:.2f}s before trying individual requests")
+                _record_rate_limited(wait_time)
+                time.sleep(wait_time)
+                
+                # Fall back to individual requests
+                for ticker in batch:
+                    for attempt in range(max_retries):
+                        try:
+                            ticker_obj = yf.Ticker(ticker, session=session)
+                            
+                            _request_bucket.acquire()
+                            hist_data = ticker_obj.history(
+                                start=start_date,
+                                end=end_date,
+                                interval=interval,
+                                prepost=prepost,
+                                actions=actions,
+                                auto_adjust=False
+                            )
+                            _record_success()
+                            
+                            if hist_data.empty:
+                                logger.warning(f"No data returned for {ticker}")
                                 break
                                 
-                            except Exception as inner_e:
-                                if "Too Many Requests" in str(inner_e):
-                                    # Rate limited, use exponential backoff
-                                    wait_time = RATE_LIMIT_DEFAULT_TIMEOUT * (2 ** attempt) + random.uniform(0, 3)
-                                    logger.warning(f"Rate limited for {ticker}, waiting {wait_time:.2f}s before retry")
-                                    time.sleep(wait_time)
-                                else:
-                                    logger.error(f"Error fetching data for {ticker}: {inner_e}")
-                                    break
-                        
-                        # Add delay between individual requests
-                        time.sleep(REQUEST_DELAY)
-                else:
-                    logger.error(f"Error processing batch {batch_idx+1}: {e}")
+                            result[ticker] = _finalize_ohlcv(ticker, hist_data, data_dir, update_summary=False)
+                            break
+                            
+                        except Exception as inner_e:
+                            if "Too Many Requests" in str(inner_e):
+                                # Rate limited, use exponential backoff
+                                wait_time = _backoff(attempt)
+                                logger.warning(f"Rate limited for {ticker}, waiting {wait_time:.2f}s before retry")
+                                _record_rate_limited(wait_time)
+                                time.sleep(wait_time)
+                            else:
+                                logger.error(f"Error fetching data for {ticker}: {inner_e}")
+                                break
+                    
+                    # Add delay between individual requests
+                    time.sleep(REQUEST_DELAY)
+            else:
+                logger.error(f"Error processing batch {batch_idx+1}: {e}")
         
-        # If there are more days, add a delay between days  
-        if day < len(daily_chunks) - 1:
-            logger.info(f"Day {day+1} complete. Sleeping before starting next day.")
-            # In production code, you might want to use a job scheduler instead
-            day_delay = 60  # Just a token delay for testing
-            time.sleep(day_delay)
+        # One summary index rewrite per batch rather than per ticker
+        if data_dir:
+            refresh_summary_index(data_dir, [t for t in batch if t in result])
     
     logger.info(f"Total fetched: {len(result)}/{len(tickers)} tickers")
     return result 
\ No newline at end of file
@@ -7,11 +7,25 @@ from typing import Dict, List, Optional, Union, Tuple, Set, Any
 import logging
 from datetime import datetime, date, timedelta
 import glob
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+from pyarrow import fs as pa_fs
 
 from yfinance_scraper.storage import (
     load_ticker_data, 
     load_data_for_tickers,
-    get_ticker_dir
+    load_dataframe_from_parquet,
+    load_columnar_field,
+    load_summary_index,
+    make_summary_entry,
+    read_summary_entry,
+    update_summary_index,
+    get_ticker_dir,
+    get_ticker_file,
+    list_data_types,
+    scan_data_dir
 )
 
 logger = logging.getLogger(__name__)
@@ -30,13 +44,28 @@ def get_available_tickers(data_dir: str) -> List[str]:
         logger.warning(f"Data directory not found: {data_dir}")
         return []
     
-    # Get all subdirectories in the data directory
-    tickers = [d for d in os.listdir(data_dir) 
-               if os.path.isdir(os.path.join(data_dir, d)) and 
-               any(f.endswith('.parquet') for f in os.listdir(os.path.join(data_dir, d)))]
+    tickers = list(scan_data_dir(data_dir)[0])
     
     logger.info(f"Found {len(tickers)} available tickers in {data_dir}")
-    return sorted(tickers)
+    return tickers
+
+
+def ticker_exists(data_dir: str, ticker: str) -> bool:
+    """Check whether a ticker has stored data without listing the whole data directory.
+    
+    Args:
+        data_dir: Base data directory
+        ticker: Ticker symbol
+        
+    Returns:
+        True if the ticker directory exists and holds at least one Parquet file
+    """
+    if not ticker or ticker.startswith("_"):
+        return False
+    try:
+        return bool(list_data_types(os.path.join(data_dir, ticker)))
+    except OSError:
+        return False
 
 
 def get_available_data_types(data_dir: str, ticker: Optional[str] = None) -> Dict[str, Set[str]]:
@@ -50,22 +79,17 @@ def get_available_data_types(data_dir: str, ticker: Optional[str] = None) -> Dic
         Dictionary mapping tickers to sets of available data types
     """
     if ticker:
-        tickers = [ticker]
-    else:
-        tickers = get_available_tickers(data_dir)
-    
-    result = {}
-    
-    for ticker in tickers:
         ticker_dir = os.path.join(data_dir, ticker)
-        if not os.path.exists(ticker_dir):
-            continue
-            
-        parquet_files = [f for f in os.listdir(ticker_dir) if f.endswith('.parquet')]
-        data_types = {os.path.splitext(f)[0] for f in parquet_files}
-        result[ticker] = data_types
+        if not os.path.isdir(ticker_dir):
+            return {}
+        return {ticker: list_data_types(ticker_dir)}
     
-    return result
+    if not os.path.exists(data_dir):
+        logger.warning(f"Data directory not found: {data_dir}")
+        return {}
+    
+    # Copy so callers may modify the result without touching the cache
+    return {t: set(types) for t, types in scan_data_dir(data_dir)[1].items()}
 
 
 def load_ticker_history(
@@ -73,7 +97,9 @@ def load_ticker_history(
     data_dir: str,
     start_date: Optional[Union[str, datetime, date]] = None,
     end_date: Optional[Union[str, datetime, date]] = None,
-    fields: Optional[List[str]] = None
+    fields: Optional[List[str]] = None,
+    engine: str = "pyarrow",
+    dtype: Optional[Union[str, np.dtype, type]] = None
 ) -> Optional[pd.DataFrame]:
     """Load OHLCV data for a specific ticker with date filtering.
     
@@ -83,24 +109,27 @@ def load_ticker_history(
         start_date: Start date for filtering (inclusive)
         end_date: End date for filtering (inclusive)
         fields: List of specific fields to include (e.g., ['Close', 'Volume'])
+        engine: Parquet reader ('pyarrow', 'pandas' or 'polars')
+        dtype: Float dtype for the price columns (e.g., np.float32 to halve
+            memory traffic); integer columns such as Volume are left as is
         
     Returns:
         DataFrame with OHLCV data or None if not available
     """
-    ticker_data = load_ticker_data(ticker, data_dir, ['ohlcv'])
+    # Only the requested fields are read from the Parquet file
+    file_path = get_ticker_file(data_dir, ticker, "ohlcv")
+    df = load_dataframe_from_parquet(file_path, columns=fields, engine=engine)
     
-    if not ticker_data or 'ohlcv' not in ticker_data:
+    if df is None:
         logger.warning(f"No OHLCV data found for {ticker}")
         return None
     
-    df = ticker_data['ohlcv']
-    
     # Filter by date range if specified
     if start_date or end_date:
         df = filter_dataframe_by_date(df, start_date, end_date)
         
     # Filter by fields if specified
-    if fields and not df.empty:
+    if fields:
         available_fields = [f for f in fields if f in df.columns]
         if not available_fields:
             logger.warning(f"None of the requested fields {fields} are available for {ticker}")
@@ -110,6 +139,11 @@ def load_ticker_history(
             logger.warning(f"Some requested fields are not available for {ticker}: {missing}")
         df = df[available_fields]
     
+    if dtype is not None:
+        float_columns = df.select_dtypes(include="floating").columns
+        if len(float_columns):
+            df = df.astype({c: dtype for c in float_columns})
+    
     return df
 
 
@@ -167,10 +201,19 @@ def load_portfolio_history(
     field: str = "Close",
     start_date: Optional[Union[str, datetime, date]] = None,
     end_date: Optional[Union[str, datetime, date]] = None,
-    fill_method: Optional[str] = "ffill"
+    fill_method: Optional[str] = "ffill",
+    threads: Optional[int] = None,
+    engine: str = "pyarrow",
+    dtype: Optional[Union[str, np.dtype, type]] = None
 ) -> pd.DataFrame:
     """Load a specific field across multiple tickers into a single DataFrame.
     
+    With the pyarrow engine all files are read in one dataset scan (see
+    load_field_bulk); with polars, in one lazy query. Otherwise, or if the
+    files cannot be read together, ticker files are read concurrently on a
+    thread pool; the reads are IO-bound and pyarrow releases the GIL while
+    decoding.
+    
     Args:
         tickers: List of ticker symbols
         data_dir: Base data directory
@@ -178,33 +221,269 @@ def load_portfolio_history(
         start_date: Start date for filtering
         end_date: End date for filtering
         fill_method: Method for filling missing values ('ffill', 'bfill', None for no filling)
+        threads: Number of worker threads (defaults to min(32, number of tickers))
+        engine: Parquet reader ('pyarrow', 'pandas' or 'polars')
+        dtype: Float dtype of the result (defaults to float64); np.float32
+            halves the memory used by wide universes
         
     Returns:
         DataFrame with tickers as columns and dates as index
     """
-    result = pd.DataFrame()
+    if not tickers:
+        return pd.DataFrame()
     
-    for ticker in tickers:
-        df = load_ticker_history(ticker, data_dir, start_date, end_date, [field])
+    result = None
+    if engine == "pyarrow":
+        result = load_field_bulk(data_dir, field, start_date, end_date, tickers)
+    elif engine == "polars":
+        result = _load_field_polars(tickers, data_dir, field, start_date, end_date)
+    if result is not None:
+        if dtype is not None:
+            result = result.astype(dtype)
+        return _fill_missing(result, fill_method)
+    
+    max_workers = threads or min(32, len(tickers))
+    series_by_ticker = {}
+    
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                load_ticker_history, ticker, data_dir, start_date, end_date, [field], engine, dtype
+            ): ticker
+            for ticker in tickers
+        }
         
-        if df is not None and not df.empty and field in df.columns:
-            # Extract the specified field and create a Series with ticker as name
-            series = df[field]
-            series.name = ticker
+        for completed, future in enumerate(as_completed(futures), 1):
+            ticker = futures[future]
+            try:
+                df = future.result()
+            except (ImportError, ValueError):
+                # Bad or unavailable engine: the same for every ticker
+                raise
+            except Exception as e:
+                logger.error(f"Error loading {field} for {ticker}: {e}")
+                continue
             
-            # Add to the result DataFrame
-            if result.empty:
-                result = pd.DataFrame(series)
-            else:
-                result = pd.concat([result, series], axis=1)
-    
-    # Handle missing values if requested
-    if fill_method and not result.empty:
+            if df is not None and not df.empty and field in df.columns:
+                series_by_ticker[ticker] = df[field]
+            logger.debug(f"Loaded {completed}/{len(tickers)} tickers")
+    
+    # Keep the caller's ticker order regardless of completion order
+    columns = [t for t in dict.fromkeys(tickers) if t in series_by_ticker]
+    if not columns:
+        return pd.DataFrame()
+    
+    # Align all series in one concat instead of growing the date index (and
+    # the frame) ticker by ticker. The result is a single block, stored
+    # column-major, so per-ticker operations (pct_change, corr, fills) walk
+    # contiguous memory.
+    result = pd.concat([series_by_ticker[t].rename(t) for t in columns], axis=1, sort=True)
+    value_dtype = np.dtype(dtype) if dtype is not None else np.dtype(np.float64)
+    if (result.dtypes != value_dtype).any():
+        result = result.astype(value_dtype)
+    
+    return _fill_missing(result, fill_method)
+
+
+def _fill_missing(df: pd.DataFrame, fill_method: Optional[str]) -> pd.DataFrame:
+    """Fill missing values in a wide ticker DataFrame.
+    
+    The frame is filled in place: every caller passes a frame it has just
+    built, and pandas' compiled pad loop then writes into the existing
+    buffer instead of allocating a second one. (A NumPy
+    maximum.accumulate fill was measured slower than this loop.)
+    
+    Args:
+        df: DataFrame with tickers as columns, owned by the caller
+        fill_method: Method for filling missing values ('ffill', 'bfill', None for no filling)
+        
+    Returns:
+        Filled DataFrame
+    """
+    if fill_method and not df.empty:
         if fill_method == "ffill":
-            result = result.fillna(method="ffill")
+            df.ffill(inplace=True)
         elif fill_method == "bfill":
-            result = result.fillna(method="bfill")
+            df.bfill(inplace=True)
     
+    return df
+
+
+def _date_bound(value: Union[str, datetime, date], arrow_type: pa.DataType) -> pa.Scalar:
+    """Convert a date bound to a scalar comparable with a timestamp column."""
+    return pa.scalar(_index_bound(value, getattr(arrow_type, "tz", None)), type=arrow_type)
+
+
+def _load_field_dataset(
+    tickers: List[str],
+    data_dir: str,
+    data_type: str,
+    field: str,
+    start_date: Optional[Union[str, datetime, date]] = None,
+    end_date: Optional[Union[str, datetime, date]] = None
+) -> Optional[pd.DataFrame]:
+    """Read one field from many ticker files in a single pyarrow dataset scan.
+    
+    The ticker directories are exposed as a partition column, so Arrow can
+    schedule the (memory-mapped) file reads across threads and decode only
+    the index and the requested field. Date bounds on a timestamp index are
+    applied inside the scan.
+    
+    Args:
+        tickers: List of ticker symbols
+        data_dir: Base data directory
+        data_type: Type of data to extract the field from
+        field: Field to extract
+        start_date: Start date for filtering (inclusive)
+        end_date: End date for filtering (inclusive)
+        
+    Returns:
+        DataFrame with tickers as columns and dates as index, or None if the
+        files cannot be scanned as one dataset
+    """
+    base_dir = os.path.abspath(data_dir)
+    paths = [get_ticker_file(base_dir, t, data_type) for t in tickers]
+    paths = [p for p in paths if os.path.exists(p)]
+    if not paths:
+        return pd.DataFrame()
+    
+    dataset = ds.dataset(
+        paths,
+        format="parquet",
+        partitioning=ds.DirectoryPartitioning(pa.schema([("ticker", pa.string())])),
+        partition_base_dir=base_dir,
+        filesystem=pa_fs.LocalFileSystem(use_mmap=True)
+    )
+    
+    pandas_metadata = dataset.schema.pandas_metadata or {}
+    index_columns = pandas_metadata.get("index_columns", [])
+    if len(index_columns) != 1 or not isinstance(index_columns[0], str):
+        return None
+    index_col = index_columns[0]
+    if field not in dataset.schema.names:
+        return None
+    
+    expr = None
+    if start_date or end_date:
+        index_type = dataset.schema.field(index_col).type
+        if not pa.types.is_timestamp(index_type):
+            return None
+        if start_date:
+            expr = ds.field(index_col) >= _date_bound(start_date, index_type)
+        if end_date:
+            upper = ds.field(index_col) <= _date_bound(end_date, index_type)
+            expr = upper if expr is None else expr & upper
+    
+    table = dataset.to_table(columns=[index_col, "ticker", field], filter=expr, use_threads=True)
+    # Dictionary-encode the ticker so pandas gets a categorical (one small
+    # code per row) instead of a Python string per row to hash in the pivot
+    table = table.set_column(1, "ticker", table.column("ticker").dictionary_encode())
+    # The index is pivoted explicitly, so skip restoring it from metadata
+    df = table.to_pandas(ignore_metadata=True)
+    
+    result = df.pivot(index=index_col, columns="ticker", values=field)
+    result.columns = result.columns.astype(str)
+    result = result[[t for t in dict.fromkeys(tickers) if t in result.columns]]
+    result.columns.name = None
+    if index_col.startswith("__index_level_"):
+        result.index.name = None
+    return result
+
+
+def load_field_bulk(
+    data_dir: str,
+    field: str = "Close",
+    start_date: Optional[Union[str, datetime, date]] = None,
+    end_date: Optional[Union[str, datetime, date]] = None,
+    tickers: Optional[List[str]] = None,
+    data_type: str = "ohlcv"
+) -> Optional[pd.DataFrame]:
+    """Load one field for many tickers with a single pyarrow dataset scan.
+    
+    Unlike load_portfolio_history, no missing values are filled and there
+    is no per-ticker fallback.
+    
+    Args:
+        data_dir: Base data directory
+        field: Field to extract (e.g., 'Close', 'Volume')
+        start_date: Start date for filtering (inclusive)
+        end_date: End date for filtering (inclusive)
+        tickers: Tickers to include (all available tickers if None)
+        data_type: Type of data to extract the field from
+        
+    Returns:
+        DataFrame with tickers as columns and dates as index, or None if the
+        files cannot be scanned as one dataset
+    """
+    if tickers is None:
+        tickers = get_available_tickers(data_dir)
+    
+    try:
+        return _load_field_dataset(tickers, data_dir, data_type, field, start_date, end_date)
+    except (pa.ArrowException, ValueError) as e:
+        logger.warning(f"Could not scan {data_type} files as one dataset: {e}")
+        return None
+
+
+def _load_field_polars(
+    tickers: List[str],
+    data_dir: str,
+    field: str,
+    start_date: Optional[Union[str, datetime, date]] = None,
+    end_date: Optional[Union[str, datetime, date]] = None
+) -> Optional[pd.DataFrame]:
+    """Read one OHLCV field for many tickers in a single polars query.
+    
+    The per-file scans are concatenated lazily, so polars reads the files
+    in parallel with only the index and the field projected, and the
+    result crosses into pandas once.
+    
+    Args:
+        tickers: List of ticker symbols
+        data_dir: Base data directory
+        field: Field to extract
+        start_date: Start date for filtering (inclusive)
+        end_date: End date for filtering (inclusive)
+        
+    Returns:
+        DataFrame with tickers as columns and dates as index, or None if the
+        files cannot be read as one frame (e.g. differing timezones)
+    """
+    import polars as pl
+    
+    paths = {t: get_ticker_file(data_dir, t, "ohlcv") for t in dict.fromkeys(tickers)}
+    paths = {t: p for t, p in paths.items() if os.path.exists(p)}
+    if not paths:
+        return pd.DataFrame()
+    
+    pandas_metadata = pq.read_schema(next(iter(paths.values()))).pandas_metadata or {}
+    index_columns = pandas_metadata.get("index_columns", [])
+    if len(index_columns) != 1 or not isinstance(index_columns[0], str):
+        return None
+    index_col = index_columns[0]
+    
+    frames = [
+        pl.scan_parquet(path).select(
+            pl.col(index_col), pl.col(field).cast(pl.Float64), pl.lit(ticker).alias("ticker")
+        )
+        for ticker, path in paths.items()
+    ]
+    try:
+        df = pl.concat(frames, how="vertical_relaxed").collect().to_pandas()
+    except Exception as e:
+        # polars appends the query plan to its messages; keep the first line
+        reason = str(e).splitlines()[0] if str(e) else type(e).__name__
+        logger.warning(f"Could not read OHLCV files as one polars frame: {reason}")
+        return None
+    
+    result = df.pivot(index=index_col, columns="ticker", values=field)
+    result = result[[t for t in paths if t in result.columns]]
+    result.columns.name = None
+    if index_col.startswith("__index_level_"):
+        result.index.name = None
+    
+    if start_date or end_date:
+        result = filter_dataframe_by_date(result, start_date, end_date)
     return result
 
 
@@ -253,7 +532,8 @@ def load_field_for_all_tickers(
     field: str = "Close",
     start_date: Optional[Union[str, datetime, date]] = None,
     end_date: Optional[Union[str, datetime, date]] = None,
-    fill_method: Optional[str] = "ffill"
+    fill_method: Optional[str] = "ffill",
+    engine: str = "pyarrow"
 ) -> pd.DataFrame:
     """Load a specific field from all available tickers into a single DataFrame.
     
@@ -264,12 +544,97 @@ def load_field_for_all_tickers(
         start_date: Start date for filtering
         end_date: End date for filtering
         fill_method: Method for filling missing values
+        engine: Parquet reader. 'pyarrow' scans all files as one dataset and
+            'polars' reads the OHLCV files in one lazy query; 'pandas' reads
+            them ticker by ticker.
         
     Returns:
         DataFrame with tickers as columns and dates as index
     """
     tickers = get_available_tickers(data_dir)
-    return load_portfolio_history(tickers, data_dir, field, start_date, end_date, fill_method)
+    
+    if engine != "pyarrow":
+        if data_type != "ohlcv":
+            result = _load_field_per_ticker(tickers, data_dir, data_type, field, start_date, end_date)
+            return _fill_missing(result, fill_method)
+        return load_portfolio_history(
+            tickers, data_dir, field, start_date, end_date, fill_method, engine=engine
+        )
+    
+    result = None
+    
+    # Prefer the field-partitioned store when it covers every OHLCV file
+    if data_type == "ohlcv":
+        try:
+            result = load_columnar_field(data_dir, field, tickers)
+        except (pa.ArrowException, ValueError) as e:
+            logger.warning(f"Could not read columnar data for {field}: {e}")
+        if result is not None:
+            expected = {t for t in tickers if os.path.exists(get_ticker_file(data_dir, t, "ohlcv"))}
+            if not expected.issubset(result.columns):
+                result = None
+    
+    if result is not None:
+        if start_date or end_date:
+            result = filter_dataframe_by_date(result, start_date, end_date)
+        return _fill_missing(result, fill_method)
+    
+    if data_type == "ohlcv":
+        return load_portfolio_history(tickers, data_dir, field, start_date, end_date, fill_method)
+    
+    result = load_field_bulk(data_dir, field, start_date, end_date, tickers, data_type)
+    if result is None:
+        # Files whose schemas cannot be unified are read one by one instead
+        result = _load_field_per_ticker(tickers, data_dir, data_type, field, start_date, end_date)
+    
+    return _fill_missing(result, fill_method)
+
+
+def _load_field_per_ticker(
+    tickers: List[str],
+    data_dir: str,
+    data_type: str,
+    field: str,
+    start_date: Optional[Union[str, datetime, date]] = None,
+    end_date: Optional[Union[str, datetime, date]] = None
+) -> pd.DataFrame:
+    """Load one field of any data type by reading each ticker's file.
+    
+    The slow path for data types load_portfolio_history does not cover,
+    used when the files cannot be scanned as one dataset.
+    
+    Args:
+        tickers: List of ticker symbols
+        data_dir: Base data directory
+        data_type: Type of data to extract the field from
+        field: Field to extract
+        start_date: Start date for filtering
+        end_date: End date for filtering
+        
+    Returns:
+        DataFrame with tickers as columns and dates as index (empty if no
+        ticker has the field)
+    """
+    if not tickers:
+        return pd.DataFrame()
+    
+    def load(ticker: str) -> Optional[pd.DataFrame]:
+        return load_ticker_data(ticker, data_dir, [data_type], columns=[field]).get(data_type)
+    
+    series_by_ticker = {}
+    with ThreadPoolExecutor(max_workers=min(32, len(tickers))) as executor:
+        for ticker, df in zip(tickers, executor.map(load, tickers)):
+            if df is None or field not in df.columns:
+                continue
+            if start_date or end_date:
+                df = filter_dataframe_by_date(df, start_date, end_date)
+            series_by_ticker[ticker] = df[field].rename(ticker)
+    
+    if not series_by_ticker:
+        logger.warning(f"No {data_type} data with field {field} found")
+        return pd.DataFrame()
+    
+    return pd.concat(list(series_by_ticker.values()), axis=1, sort=True)
 
 
 def filter_dataframe_by_date(
@@ -291,21 +656,58 @@ def filter_dataframe_by_date(
         logger.warning("DataFrame index is not a DatetimeIndex, cannot filter by date")
         return df
     
-    # Convert string dates to datetime
-    if start_date and isinstance(start_date, str):
-        start_date = pd.to_datetime(start_date)
-    if end_date and isinstance(end_date, str):
-        end_date = pd.to_datetime(end_date)
-        
-    # Apply filters
-    if start_date:
-        df = df[df.index >= start_date]
-    if end_date:
-        df = df[df.index <= end_date]
+    start = _index_bound(start_date, df.index.tz) if start_date else None
+    end = _index_bound(end_date, df.index.tz) if end_date else None
+    
+    # A sorted index is sliced by binary search without building masks
+    if df.index.is_monotonic_increasing:
+        return df.loc[start:end]
+    
+    if start is not None:
+        df = df[df.index >= start]
+    if end is not None:
+        df = df[df.index <= end]
         
     return df
 
 
+def _index_bound(value: Union[str, datetime, date], tz: Optional[Any]) -> pd.Timestamp:
+    """Convert a date bound to a Timestamp comparable with an index in tz.
+    
+    Naive bounds are interpreted in the index's timezone, so '2024-01-02'
+    means midnight New York time for Yahoo's exchange-local indexes.
+    """
+    ts = pd.Timestamp(value)
+    if tz is not None and ts.tzinfo is None:
+        return ts.tz_localize(tz)
+    if tz is None and ts.tzinfo is not None:
+        return ts.tz_convert(None)
+    return ts
+
+
+def _refresh_summary_entry(ticker: str, data_dir: str) -> Optional[Dict[str, Any]]:
+    """Rebuild a ticker's summary entry, from the Parquet footer when possible.
+    
+    Args:
+        ticker: Ticker symbol
+        data_dir: Base data directory
+        
+    Returns:
+        Summary entry, or None if the date range cannot be determined
+    """
+    file_path = get_ticker_file(data_dir, ticker, "ohlcv")
+    try:
+        entry = read_summary_entry(ticker, file_path)
+        if entry is None:
+            # No usable index statistics; decode the file instead
+            ticker_data = load_ticker_data(ticker, data_dir, ['ohlcv'])
+            entry = make_summary_entry(ticker, ticker_data.get('ohlcv'), file_path)
+        return entry
+    except Exception as e:
+        logger.warning(f"Error getting date range for {ticker}: {e}")
+        return None
+
+
 def get_data_summary(data_dir: str) -> pd.DataFrame:
     """Generate a summary of available data for all tickers.
     
@@ -317,6 +719,30 @@ def get_data_summary(data_dir: str) -> pd.DataFrame:
     """
     tickers = get_available_tickers(data_dir)
     data_types_by_ticker = get_available_data_types(data_dir)
+    summary_index = load_summary_index(data_dir)
+    
+    # Refresh entries that are missing or older than the file on disk from
+    # the Parquet footers; the reads are IO-bound, so run them on a pool
+    stale = []
+    for ticker in tickers:
+        if 'ohlcv' not in data_types_by_ticker.get(ticker, set()):
+            continue
+        file_path = get_ticker_file(data_dir, ticker, "ohlcv")
+        entry = summary_index.get(ticker)
+        try:
+            if entry is None or entry['mtime_ns'] != os.stat(file_path).st_mtime_ns:
+                stale.append(ticker)
+        except OSError as e:
+            logger.warning(f"Error getting date range for {ticker}: {e}")
+    
+    refreshed_entries = []
+    if stale:
+        with ThreadPoolExecutor(max_workers=min(32, len(stale))) as executor:
+            entries = executor.map(_refresh_summary_entry, stale, [data_dir] * len(stale))
+            for ticker, entry in zip(stale, entries):
+                summary_index[ticker] = entry
+                if entry is not None:
+                    refreshed_entries.append(entry)
     
     rows = []
     for ticker in tickers:
@@ -325,17 +751,12 @@ def get_data_summary(data_dir: str) -> pd.DataFrame:
         # Check which data types are available
         ticker_data_types = data_types_by_ticker.get(ticker, set())
         
-        # Get date ranges for time series data
-        if 'ohlcv' in ticker_data_types:
-            try:
-                ticker_data = load_ticker_data(ticker, data_dir, ['ohlcv'])
-                ohlcv = ticker_data.get('ohlcv')
-                if ohlcv is not None and not ohlcv.empty and isinstance(ohlcv.index, pd.DatetimeIndex):
-                    row['start_date'] = ohlcv.index.min()
-                    row['end_date'] = ohlcv.index.max()
-                    row['trading_days'] = len(ohlcv)
-            except Exception as e:
-                logger.warning(f"Error getting date range for {ticker}: {e}")
+        # Get date ranges for time series data from the summary index
+        entry = summary_index.get(ticker) if 'ohlcv' in ticker_data_types else None
+        if entry is not None:
+            row['start_date'] = entry['start_date']
+            row['end_date'] = entry['end_date']
+            row['trading_days'] = entry['trading_days']
         
         # Add flags for available data types
         for data_type in ['ohlcv', 'financials', 'balance_sheet', 'cashflow', 'earnings', 'info', 'dividends', 'splits']:
@@ -343,6 +764,8 @@ def get_data_summary(data_dir: str) -> pd.DataFrame:
             
         rows.append(row)
     
+    update_summary_index(data_dir, refreshed_entries)
+    
     if not rows:
         return pd.DataFrame()
         
@@ -0,0 +1,278 @@
+"""Rate limiting helpers for YFinance Scraper."""
+
+import asyncio
+import json
+import os
+import random
+import threading
+import time
+import logging
+from datetime import date
+from email.utils import parsedate_to_datetime
+from typing import Mapping, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucketRateLimiter:
+    """Token bucket rate limiter for asyncio code.
+
+    The bucket holds up to max_tokens tokens and refills at max_tokens per
+    refill_interval seconds. Callers are served one at a time through an
+    internal lock, so concurrent tasks queue behind each other instead of
+    all computing the same wait and waking up together.
+
+    Usage:
+        limiter = TokenBucketRateLimiter(max_tokens=2, refill_interval=1.0)
+        async with limiter:
+            ...  # at most ~2 entries per second
+    """
+
+    def __init__(self, max_tokens: float, refill_interval: float = 1.0):
+        """Initialize the rate limiter.
+
+        Args:
+            max_tokens: Bucket capacity, i.e. requests allowed per refill_interval
+            refill_interval: Seconds needed to refill an empty bucket
+        """
+        if max_tokens <= 0:
+            raise ValueError(f"max_tokens must be positive, got {max_tokens}")
+        if refill_interval <= 0:
+            raise ValueError(f"refill_interval must be positive, got {refill_interval}")
+
+        self.max_tokens = max_tokens
+        self.refill_interval = refill_interval
+        self._tokens = float(max_tokens)
+        self._updated = time.monotonic()
+        # Created on first use so it binds to the running event loop
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        rate = self.max_tokens / self.refill_interval
+        self._tokens = min(self.max_tokens, self._tokens + (now - self._updated) * rate)
+        self._updated = now
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until the requested number of tokens is available and take them.
+
+        Args:
+            tokens: Number of tokens to take
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            self._refill()
+            if self._tokens < tokens:
+                wait_time = (tokens - self._tokens) * self.refill_interval / self.max_tokens
+                logger.debug(f"Rate limiter waiting {wait_time:.2f}s")
+                await asyncio.sleep(wait_time)
+                self._refill()
+            self._tokens -= tokens
+
+    async def __aenter__(self) -> "TokenBucketRateLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+
+class TokenBucket:
+    """Thread-safe token bucket shared by every thread talking to Yahoo.
+
+    Tokens refill continuously at rate per second up to capacity. Besides
+    pacing requests up front, the bucket can absorb rate-limit feedback:
+    update_from_headers() honours Retry-After / X-RateLimit-Remaining and
+    penalize() pauses all callers after a 429, so threads back off together
+    instead of each discovering the limit on its own.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None, jitter: float = 0.1):
+        """Initialize the token bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to max(1, rate))
+            jitter: Extra random wait, as a fraction of each computed wait,
+                so sleeping threads do not all wake at the same instant
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.jitter = jitter
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update. Caller holds the lock."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until the requested number of tokens is available and take them.
+
+        Args:
+            tokens: Number of tokens to take (capped at capacity)
+
+        Returns:
+            Seconds spent waiting
+        """
+        tokens = min(tokens, self.capacity)
+        waited = 0.0
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self._blocked_until and self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                wait_time = max(self._blocked_until - now, (tokens - self._tokens) / self.rate)
+
+            wait_time += random.uniform(0, self.jitter * wait_time)
+            time.sleep(wait_time)
+            waited += wait_time
+
+    def set_rate(self, rate: float) -> None:
+        """Change the refill rate, keeping the tokens accrued so far.
+
+        Args:
+            rate: Tokens added per second
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        with self._lock:
+            self._refill(time.monotonic())
+            self.rate = rate
+
+    def penalize(self, delay: float) -> None:
+        """Pause all callers for delay seconds and drain the bucket.
+
+        Args:
+            delay: Seconds before the next token is handed out
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self._tokens = 0.0
+            self._blocked_until = max(self._blocked_until, now + delay)
+        logger.debug(f"Rate limiter paused for {delay:.2f}s")
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adjust the bucket from rate-limit response headers.
+
+        Args:
+            headers: Response headers; Retry-After (seconds or HTTP date) pauses
+                all callers and X-RateLimit-Remaining caps the available tokens
+        """
+        retry_after = headers.get("Retry-After")
+        remaining = headers.get("X-RateLimit-Remaining")
+
+        delay = None
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    logger.debug(f"Ignoring unparsable Retry-After header: {retry_after}")
+        if delay is not None and delay > 0:
+            self.penalize(delay)
+
+        if remaining is not None:
+            try:
+                remaining = float(remaining)
+            except ValueError:
+                return
+            with self._lock:
+                self._refill(time.monotonic())
+                self._tokens = min(self._tokens, max(0.0, remaining))
+
+
+class DailyBudget:
+    """Number of tickers that may still be fetched from Yahoo today.
+
+    The count is kept per calendar day and, when path is given, saved after
+    every change so that separate runs on the same day share one budget.
+    Exhausting the budget does not block: callers get fewer grants than
+    they asked for and should return what they have. Spreading a large
+    ticker list over several days is left to a scheduler such as cron.
+    """
+
+    def __init__(self, limit: int, path: Optional[str] = None):
+        """Initialize the budget.
+
+        Args:
+            limit: Tickers allowed per day
+            path: JSON file holding today's usage (kept in memory if None)
+        """
+        if limit <= 0:
+            raise ValueError(f"limit must be positive, got {limit}")
+
+        self.limit = limit
+        self.path = path
+        self._lock = threading.Lock()
+        self._date = date.today().isoformat()
+        self._used = 0
+
+        if path:
+            try:
+                with open(path, "r") as f:
+                    state = json.load(f)
+                if state.get("date") == self._date:
+                    self._used = int(state.get("used", 0))
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, TypeError, AttributeError) as e:
+                logger.warning(f"Ignoring unreadable daily budget {path}: {e}")
+
+    def _roll_over(self) -> None:
+        """Start a fresh count when the day has changed. Caller holds the lock."""
+        today = date.today().isoformat()
+        if today != self._date:
+            self._date = today
+            self._used = 0
+
+    @property
+    def remaining(self) -> int:
+        """Tickers still allowed today."""
+        with self._lock:
+            self._roll_over()
+            return max(0, self.limit - self._used)
+
+    def consume(self, count: int = 1) -> int:
+        """Take up to count tickers from today's budget.
+
+        Args:
+            count: Number of tickers wanted
+
+        Returns:
+            Number of tickers granted (0 once the budget is used up)
+        """
+        with self._lock:
+            self._roll_over()
+            granted = max(0, min(count, self.limit - self._used))
+            if granted:
+                self._used += granted
+                self._save()
+            return granted
+
+    def _save(self) -> None:
+        """Write today's usage to path. Caller holds the lock."""
+        if not self.path:
+            return
+        try:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump({"date": self._date, "used": self._used}, f)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Error saving daily budget to {self.path}: {e}")
@@ -1,15 +1,68 @@
 """Module for storing and retrieving data in Parquet format."""
 
 import os
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import Dict, Any, Optional, List, Union
+from typing import Dict, Any, Optional, List, Union, Set, Tuple, FrozenSet
 import logging
 from datetime import datetime
+from urllib.parse import quote
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 
 logger = logging.getLogger(__name__)
 
+# Directory (inside the data directory) holding the field-partitioned OHLCV store
+COLUMNAR_DIR = "_columnar"
+
+# Directory (inside the data directory) holding the Hive-partitioned store of
+# the time series data types, which share one schema across tickers
+PARTITIONED_DIR = "_partitioned"
+PARTITIONED_TYPES = ("ohlcv", "dividends", "splits")
+
+# Per-directory index of OHLCV date ranges, maintained by save_ticker_data
+SUMMARY_FILE = "_summary.parquet"
+_summary_lock = threading.Lock()
+
+# Codec for ticker files; zstd at a low level compresses better than snappy
+# and decodes about as fast
+PARQUET_COMPRESSION = "zstd"
+PARQUET_COMPRESSION_LEVEL = 3
+
+# Files at least this large are memory-mapped by the pyarrow reader; below
+# it the mapping costs more than the copy it saves
+MMAP_MIN_BYTES = 1 << 20
+
+# Readers supported by load_dataframe_from_parquet
+PARQUET_ENGINES = ("pyarrow", "pandas", "polars")
+
+# Threads used to load or save many tickers at once; parquet I/O and the
+# Arrow conversion release the GIL
+IO_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Bytes read from the end of a file in one go when only its footer is
+# needed; ticker files are usually smaller than this
+FOOTER_READ_BYTES = 256 * 1024
+
+# Index date range read from each file's footer, keyed by path and stored
+# with the (mtime_ns, size) it was read at; see _cached_index_range
+_FOOTER_CACHE: Dict[str, Tuple[Tuple[int, int], Optional[Tuple[pd.Timestamp, pd.Timestamp]]]] = {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process.
+    
+    Saves of many files into the same ticker directories skip the repeated
+    makedirs calls; save_dataframe_to_parquet clears the cache when a
+    cached directory has been removed behind our back.
+    """
+    os.makedirs(path, exist_ok=True)
+
 
 def get_ticker_dir(data_dir: str, ticker: str) -> str:
     """Get the directory path for a ticker.
@@ -22,10 +75,71 @@ def get_ticker_dir(data_dir: str, ticker: str) -> str:
         Path to the ticker's directory
     """
     ticker_dir = os.path.join(data_dir, ticker)
-    os.makedirs(ticker_dir, exist_ok=True)
+    _ensure_dir(ticker_dir)
     return ticker_dir
 
 
+def get_ticker_file(data_dir: str, ticker: str, data_type: str) -> str:
+    """Get the Parquet file path of one of a ticker's data types.
+    
+    Args:
+        data_dir: Base data directory
+        ticker: Ticker symbol
+        data_type: Data type (e.g., 'ohlcv')
+        
+    Returns:
+        Path to the file, which may not exist
+    """
+    return os.path.join(data_dir, ticker, f"{data_type}.parquet")
+
+
+def list_data_types(ticker_dir: str) -> Set[str]:
+    """List the data types stored in a ticker directory with one scandir pass."""
+    with os.scandir(ticker_dir) as it:
+        return {entry.name[:-len('.parquet')] for entry in it
+                if entry.name.endswith('.parquet') and entry.is_file()}
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_listing(data_dir: str, mtime_ns: int) -> Tuple[Tuple[str, ...], Dict[str, FrozenSet[str]]]:
+    """Walk data_dir once and list every ticker with its data types.
+    
+    Cached on the directory's modification time, which changes when ticker
+    directories are added or removed. Files added inside an existing ticker
+    directory do not touch it, so save_ticker_data clears the cache itself.
+    """
+    data_types = {}
+    with os.scandir(data_dir) as it:
+        for entry in it:
+            # Skip internal stores such as _columnar
+            if entry.name.startswith("_") or not entry.is_dir():
+                continue
+            types = list_data_types(entry.path)
+            if types:
+                data_types[entry.name] = frozenset(types)
+    return tuple(sorted(data_types)), data_types
+
+
+def scan_data_dir(data_dir: str) -> Tuple[Tuple[str, ...], Dict[str, FrozenSet[str]]]:
+    """List the tickers in data_dir and the data types stored for each.
+    
+    Args:
+        data_dir: Base data directory (must exist)
+        
+    Returns:
+        Tuple of the sorted ticker symbols and a dictionary mapping each
+        ticker to its data types. Both are shared with the listing cache
+        and must not be modified.
+    """
+    data_dir = os.path.abspath(data_dir)
+    return _scan_listing(data_dir, os.stat(data_dir).st_mtime_ns)
+
+
+def invalidate_listing_cache() -> None:
+    """Forget cached directory listings after files were written or removed."""
+    _scan_listing.cache_clear()
+
+
 def save_dataframe_to_parquet(df: pd.DataFrame, file_path: str) -> bool:
     """Save a DataFrame to a Parquet file.
     
@@ -36,12 +150,35 @@ def save_dataframe_to_parquet(df: pd.DataFrame, file_path: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
+    directory = os.path.dirname(file_path)
+    
+    def write():
+        # Save DataFrame to Parquet with proper index handling. Ticker files
+        # are small, so a single row group lets readers fetch each column in
+        # one contiguous read.
+        df.to_parquet(
+            file_path,
+            engine="pyarrow",
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            index=True,
+            row_group_size=max(1, len(df)),
+            use_dictionary=True,
+            write_statistics=True
+        )
+    
     try:
         # Create directory if it doesn't exist
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        # Save DataFrame to Parquet with proper index handling
-        df.to_parquet(file_path, index=True)
+        _ensure_dir(directory)
+        try:
+            write()
+        except OSError:
+            if os.path.isdir(directory):
+                raise
+            # Removed since it was cached as created
+            _ensure_dir.cache_clear()
+            _ensure_dir(directory)
+            write()
         logger.info(f"Saved data to {file_path}")
         return True
     except Exception as e:
@@ -49,10 +186,65 @@ def save_dataframe_to_parquet(df: pd.DataFrame, file_path: str) -> bool:
         return False
 
 
+def append_dataframe_to_parquet(df: pd.DataFrame, file_path: str) -> bool:
+    """Append rows that all follow the last index value of a stored file.
+    
+    The file's last date is taken from the footer statistics, and the
+    stored rows are carried over as Arrow data without converting them to
+    pandas, deduplicating or sorting.
+    
+    Args:
+        df: New rows with a DatetimeIndex and the stored file's columns
+        file_path: Path of the stored Parquet file
+        
+    Returns:
+        True if the rows were appended, False if they overlap the stored
+        range, do not match its schema or could not be written; the caller
+        should then merge and rewrite the file
+    """
+    if df is None or df.empty or not isinstance(df.index, pd.DatetimeIndex):
+        return False
+    if not os.path.exists(file_path):
+        return False
+    
+    try:
+        parquet_file = pq.ParquetFile(file_path)
+        index_range = _read_index_range(parquet_file.metadata)
+        if index_range is None or df.index.min() <= index_range[1]:
+            return False
+        
+        schema = parquet_file.schema_arrow
+        new_table = pa.Table.from_pandas(df, preserve_index=True)
+        if set(new_table.schema.names) != set(schema.names):
+            return False
+        new_table = new_table.select(schema.names).cast(schema)
+        table = pa.concat_tables([parquet_file.read(), new_table])
+        
+        # Write then rename so readers never see a partial file
+        tmp_path = f"{file_path}.tmp"
+        pq.write_table(
+            table,
+            tmp_path,
+            compression=PARQUET_COMPRESSION,
+            compression_level=PARQUET_COMPRESSION_LEVEL,
+            row_group_size=max(1, table.num_rows),
+            use_dictionary=True,
+            write_statistics=True
+        )
+        os.replace(tmp_path, file_path)
+    except Exception as e:
+        logger.debug(f"Could not append to {file_path}, falling back to a merge: {e}")
+        return False
+    
+    logger.info(f"Appended {len(df)} rows to {file_path}")
+    return True
+
+
 def save_ticker_data(
     ticker: str,
     data: Dict[str, pd.DataFrame],
-    data_dir: str
+    data_dir: str,
+    update_summary: bool = True
 ) -> bool:
     """Save ticker data to Parquet files.
     
@@ -60,6 +252,8 @@ def save_ticker_data(
         ticker: Ticker symbol
         data: Dictionary of DataFrames
         data_dir: Base data directory
+        update_summary: Record the OHLCV date range in the summary index
+            (callers saving many tickers batch this themselves)
         
     Returns:
         True if all data was saved successfully, False otherwise
@@ -71,53 +265,705 @@ def save_ticker_data(
         if df is None or df.empty:
             continue
             
-        file_path = os.path.join(ticker_dir, f"{data_type}.parquet")
+        file_path = get_ticker_file(data_dir, ticker, data_type)
         if not save_dataframe_to_parquet(df, file_path):
             success = False
+        elif data_type == "ohlcv" and update_summary:
+            entry = make_summary_entry(ticker, df, file_path)
+            if entry is not None:
+                update_summary_index(data_dir, [entry])
     
+    # Keep the optional stores in sync once they have been enabled
+    if os.path.isdir(get_partitioned_dir(data_dir)):
+        if not save_partitioned_data(ticker, data, data_dir):
+            success = False
+    
+    ohlcv = data.get("ohlcv")
+    if ohlcv is not None and not ohlcv.empty and os.path.isdir(get_columnar_dir(data_dir)):
+        if not save_columnar_data(ticker, ohlcv, data_dir):
+            success = False
+    
+    invalidate_listing_cache()
     return success
 
 
+def make_summary_entry(ticker: str, df: pd.DataFrame, file_path: str) -> Optional[Dict[str, Any]]:
+    """Build a summary index entry for a ticker's OHLCV data.
+    
+    Args:
+        ticker: Ticker symbol
+        df: OHLCV DataFrame as stored in file_path
+        file_path: Path of the stored OHLCV file
+        
+    Returns:
+        Entry with the date range, row count and file mtime, or None if the
+        data has no DatetimeIndex
+    """
+    if df is None or df.empty or not isinstance(df.index, pd.DatetimeIndex):
+        return None
+    
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError:
+        return None
+    
+    return {
+        "ticker": ticker,
+        "start_date": df.index.min(),
+        "end_date": df.index.max(),
+        "trading_days": len(df),
+        "mtime_ns": mtime_ns
+    }
+
+
+def _read_index_range(metadata: pq.FileMetaData) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Read the first and last timestamp of a file's index from its footer.
+    
+    Args:
+        metadata: Footer of a Parquet file written from a pandas DataFrame
+        
+    Returns:
+        Tuple of the minimum and maximum index value, or None if the file
+        has no timestamp index, no rows or no statistics for the index
+    """
+    schema = metadata.schema.to_arrow_schema()
+    index_columns = (schema.pandas_metadata or {}).get("index_columns", [])
+    if len(index_columns) != 1 or not isinstance(index_columns[0], str):
+        return None
+    index_type = schema.field(index_columns[0]).type
+    if not pa.types.is_timestamp(index_type) or metadata.num_rows == 0:
+        return None
+    
+    column = metadata.schema.names.index(index_columns[0])
+    start_date = end_date = None
+    for i in range(metadata.num_row_groups):
+        stats = metadata.row_group(i).column(column).statistics
+        if stats is None or not stats.has_min_max:
+            return None
+        if start_date is None or stats.min < start_date:
+            start_date = stats.min
+        if end_date is None or stats.max > end_date:
+            end_date = stats.max
+    
+    # Statistics of tz-aware columns come back in UTC
+    start_date, end_date = pd.Timestamp(start_date), pd.Timestamp(end_date)
+    if index_type.tz:
+        start_date, end_date = start_date.tz_convert(index_type.tz), end_date.tz_convert(index_type.tz)
+    return start_date, end_date
+
+
+def _read_footer(file_path: str) -> pq.FileMetaData:
+    """Read a Parquet file's footer, usually with a single read call.
+    
+    The last FOOTER_READ_BYTES of the file are read speculatively; the
+    footer length stored at the very end tells whether the whole footer
+    is in that buffer. Only a larger footer needs a second, exact read.
+    
+    Args:
+        file_path: Path of the Parquet file
+        
+    Returns:
+        The file's metadata
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the file does not end like a Parquet file
+    """
+    with open(file_path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(-min(size, FOOTER_READ_BYTES), os.SEEK_END)
+        buf = f.read()
+        # The file ends with the footer, its 4-byte length and b"PAR1"
+        if len(buf) < 12 or buf[-4:] != b"PAR1":
+            raise ValueError(f"{file_path} is not a Parquet file")
+        footer_len = int.from_bytes(buf[-8:-4], "little") + 8
+        if footer_len > size:
+            raise ValueError(f"{file_path} has a corrupt footer length")
+        if footer_len > len(buf):
+            f.seek(-footer_len, os.SEEK_END)
+            buf = f.read(footer_len)
+    
+    return pq.read_metadata(pa.BufferReader(buf[-footer_len:]))
+
+
+def _cached_index_range(file_path: str) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """_read_index_range of a file, remembered until the file changes.
+    
+    Entries are keyed by path and checked against the file's size and
+    mtime, so a rewritten or appended file is read again.
+    
+    Args:
+        file_path: Path of the Parquet file
+        
+    Returns:
+        Same as _read_index_range
+        
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    st = os.stat(file_path)
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _FOOTER_CACHE.get(file_path)
+    if cached is not None and cached[0] == version:
+        return cached[1]
+    
+    index_range = _read_index_range(_read_footer(file_path))
+    _FOOTER_CACHE[file_path] = (version, index_range)
+    return index_range
+
+
+def clear_footer_cache() -> None:
+    """Forget all cached footer date ranges."""
+    _FOOTER_CACHE.clear()
+
+
+def read_summary_entry(ticker: str, file_path: str) -> Optional[Dict[str, Any]]:
+    """Build a summary index entry from a stored OHLCV file's Parquet footer.
+    
+    The row count and the min/max statistics of the index column are read
+    from the file metadata, so no data pages are decoded.
+    
+    Args:
+        ticker: Ticker symbol
+        file_path: Path of the stored OHLCV file
+        
+    Returns:
+        Entry like make_summary_entry's, or None if the file has no
+        timestamp index or lacks statistics for it
+    """
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+        parquet_file = pq.ParquetFile(file_path)
+    except Exception as e:
+        logger.warning(f"Could not read Parquet footer of {file_path}: {e}")
+        return None
+    
+    index_range = _read_index_range(parquet_file.metadata)
+    if index_range is None:
+        return None
+    start_date, end_date = index_range
+    
+    return {
+        "ticker": ticker,
+        "start_date": start_date,
+        "end_date": end_date,
+        "trading_days": parquet_file.metadata.num_rows,
+        "mtime_ns": mtime_ns
+    }
+
+
+def load_summary_index(data_dir: str) -> Dict[str, Dict[str, Any]]:
+    """Load the summary index of a data directory.
+    
+    Entries are only trustworthy while their ``mtime_ns`` matches the
+    ticker's current OHLCV file; callers must check this.
+    
+    Args:
+        data_dir: Base data directory
+        
+    Returns:
+        Dictionary with ticker symbols as keys and summary entries as values
+    """
+    file_path = os.path.join(data_dir, SUMMARY_FILE)
+    if not os.path.exists(file_path):
+        return {}
+    
+    try:
+        df = pd.read_parquet(file_path)
+    except Exception as e:
+        logger.warning(f"Could not read summary index {file_path}: {e}")
+        return {}
+    
+    entries = {}
+    for row in df.to_dict(orient="records"):
+        # Dates are stored in UTC next to the original timezone
+        tz = row.pop("tz")
+        for key in ("start_date", "end_date"):
+            row[key] = row[key].tz_convert(tz) if tz else row[key].tz_convert(None)
+        entries[row["ticker"]] = row
+    
+    return entries
+
+
+def update_summary_index(data_dir: str, entries: List[Dict[str, Any]]) -> bool:
+    """Insert or replace entries in the summary index of a data directory.
+    
+    Args:
+        data_dir: Base data directory
+        entries: Entries built by make_summary_entry
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    if not entries:
+        return True
+    
+    rows = []
+    for entry in entries:
+        row = dict(entry)
+        tz = None
+        for key in ("start_date", "end_date"):
+            ts = pd.Timestamp(row[key])
+            if ts.tz is not None:
+                tz = str(ts.tz)
+                row[key] = ts.tz_convert("UTC")
+            else:
+                row[key] = ts.tz_localize("UTC")
+        row["tz"] = tz
+        rows.append(row)
+    
+    file_path = os.path.join(data_dir, SUMMARY_FILE)
+    
+    with _summary_lock:
+        try:
+            summary = pd.DataFrame(rows)
+            if os.path.exists(file_path):
+                existing = pd.read_parquet(file_path)
+                existing = existing[~existing["ticker"].isin(summary["ticker"])]
+                summary = pd.concat([existing, summary], ignore_index=True)
+            
+            # Write then rename so readers never see a partial file
+            tmp_path = f"{file_path}.tmp"
+            summary.to_parquet(tmp_path, index=False)
+            os.replace(tmp_path, file_path)
+            return True
+        except Exception as e:
+            logger.error(f"Error updating summary index {file_path}: {e}")
+            return False
+
+
+def refresh_summary_index(data_dir: str, tickers: List[str]) -> bool:
+    """Update the summary index entries of tickers from their stored OHLCV files.
+    
+    Entries are read from the files' Parquet footers, so they describe what
+    is on disk even if a save failed, and all of them are written with a
+    single index rewrite. Tickers without an OHLCV file are skipped.
+    
+    Args:
+        data_dir: Base data directory
+        tickers: Ticker symbols whose OHLCV files were written
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    entries = []
+    for ticker in tickers:
+        file_path = get_ticker_file(data_dir, ticker, "ohlcv")
+        if not os.path.exists(file_path):
+            continue
+        entry = read_summary_entry(ticker, file_path)
+        if entry is not None:
+            entries.append(entry)
+    
+    return update_summary_index(data_dir, entries)
+
+
+def get_columnar_dir(data_dir: str) -> str:
+    """Get the root directory of the field-partitioned OHLCV store.
+    
+    Args:
+        data_dir: Base data directory
+        
+    Returns:
+        Path to the columnar store
+    """
+    return os.path.join(data_dir, COLUMNAR_DIR)
+
+
+def save_columnar_data(ticker: str, df: pd.DataFrame, data_dir: str) -> bool:
+    """Write a ticker's OHLCV data into the field-partitioned store.
+    
+    The store is a Hive-partitioned dataset laid out as
+    ``_columnar/field=Close/ticker=AAPL/part-0.parquet`` with ``date`` and
+    ``value`` columns, so reading one field across the universe only touches
+    that field's files. Existing partitions for the ticker are replaced.
+    
+    Args:
+        ticker: Ticker symbol
+        df: OHLCV DataFrame with a DatetimeIndex
+        data_dir: Base data directory
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        numeric = df.select_dtypes(include="number")
+        long_df = numeric.rename_axis("date").reset_index().melt(
+            id_vars="date", var_name="field", value_name="value"
+        )
+        long_df["value"] = long_df["value"].astype("float64")
+        long_df["ticker"] = ticker
+        
+        table = pa.Table.from_pandas(long_df, preserve_index=False)
+        ds.write_dataset(
+            table,
+            get_columnar_dir(data_dir),
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([("field", pa.string()), ("ticker", pa.string())]),
+                flavor="hive"
+            ),
+            basename_template="part-{i}.parquet",
+            existing_data_behavior="delete_matching",
+            file_options=ds.ParquetFileFormat().make_write_options(compression="zstd")
+        )
+        logger.debug(f"Saved columnar data for {ticker}")
+        return True
+    except Exception as e:
+        logger.error(f"Error saving columnar data for {ticker}: {e}")
+        return False
+
+
+def build_columnar_dataset(data_dir: str, tickers: Optional[List[str]] = None) -> Dict[str, bool]:
+    """Enable the columnar store and backfill it from the per-ticker files.
+    
+    Args:
+        data_dir: Base data directory
+        tickers: Tickers to backfill (all ticker directories if None)
+        
+    Returns:
+        Dictionary with ticker symbols as keys and success status as values
+    """
+    os.makedirs(get_columnar_dir(data_dir), exist_ok=True)
+    
+    if tickers is None:
+        tickers = [d for d in os.listdir(data_dir)
+                   if not d.startswith(("_", ".")) and os.path.isdir(os.path.join(data_dir, d))]
+    
+    results = {}
+    for ticker in tickers:
+        ohlcv = load_ticker_data(ticker, data_dir, ["ohlcv"]).get("ohlcv")
+        if ohlcv is not None and not ohlcv.empty:
+            results[ticker] = save_columnar_data(ticker, ohlcv, data_dir)
+    
+    logger.info(f"Built columnar data for {sum(results.values())}/{len(results)} tickers")
+    return results
+
+
+def load_columnar_field(
+    data_dir: str,
+    field: str,
+    tickers: Optional[List[str]] = None
+) -> Optional[pd.DataFrame]:
+    """Load one field for many tickers from the field-partitioned store.
+    
+    Args:
+        data_dir: Base data directory
+        field: Field to load (e.g., 'Close')
+        tickers: Tickers to include (all stored tickers if None)
+        
+    Returns:
+        DataFrame with tickers as columns and dates as index, or None if the
+        store does not contain the field
+    """
+    # Partition values are URI-encoded on disk (e.g. 'field=Adj%20Close')
+    field_dir = os.path.join(get_columnar_dir(data_dir), f"field={quote(field, safe='')}")
+    if not os.path.isdir(field_dir):
+        return None
+    
+    dataset = ds.dataset(
+        get_columnar_dir(data_dir),
+        format="parquet",
+        partitioning=ds.partitioning(
+            pa.schema([("field", pa.string()), ("ticker", pa.string())]),
+            flavor="hive"
+        )
+    )
+    expr = ds.field("field") == field
+    if tickers is not None:
+        expr = expr & ds.field("ticker").isin(list(tickers))
+    
+    table = dataset.to_table(columns=["date", "ticker", "value"], filter=expr)
+    # Pivot on a categorical ticker rather than a Python string per row
+    table = table.set_column(1, "ticker", table.column("ticker").dictionary_encode())
+    df = table.to_pandas(ignore_metadata=True)
+    
+    result = df.pivot(index="date", columns="ticker", values="value")
+    result.columns = result.columns.astype(str)
+    if tickers is not None:
+        result = result[[t for t in dict.fromkeys(tickers) if t in result.columns]]
+    result.columns.name = None
+    result.index.name = "Date"
+    return result
+
+
+def get_partitioned_dir(data_dir: str) -> str:
+    """Get the directory of the Hive-partitioned time series store.
+    
+    Args:
+        data_dir: Base data directory
+        
+    Returns:
+        Path to the partitioned store
+    """
+    return os.path.join(data_dir, PARTITIONED_DIR)
+
+
+def save_partitioned_data(ticker: str, data: Dict[str, pd.DataFrame], data_dir: str) -> bool:
+    """Write a ticker's time series data into the Hive-partitioned store.
+    
+    Files are laid out as ``_partitioned/data_type=ohlcv/ticker=AAPL/part-0.parquet``.
+    So that every ticker shares one schema, floats are stored as float64,
+    integers as int64 and the index as a UTC ``date`` column next to a
+    ``tz`` column holding the original timezone.
+    
+    Args:
+        ticker: Ticker symbol
+        data: Dictionary of DataFrames; types outside PARTITIONED_TYPES are ignored
+        data_dir: Base data directory
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    success = True
+    
+    for data_type in PARTITIONED_TYPES:
+        df = data.get(data_type)
+        if df is None or df.empty or not isinstance(df.index, pd.DatetimeIndex):
+            continue
+        
+        try:
+            tz = str(df.index.tz) if df.index.tz is not None else ""
+            dates = df.index.tz_convert("UTC") if tz else df.index.tz_localize("UTC")
+            
+            dtypes = {c: "float64" for c in df.select_dtypes(include="floating").columns}
+            dtypes.update({c: "int64" for c in df.select_dtypes(include="integer").columns})
+            out = df.astype(dtypes).reset_index(drop=True)
+            out.insert(0, "date", dates)
+            out["tz"] = tz
+            
+            partition_dir = os.path.join(
+                get_partitioned_dir(data_dir), f"data_type={data_type}", f"ticker={quote(ticker, safe='')}"
+            )
+            os.makedirs(partition_dir, exist_ok=True)
+            
+            # Write then rename so scans never see a partial file; the
+            # underscore keeps the temporary file out of dataset discovery
+            file_path = os.path.join(partition_dir, "part-0.parquet")
+            tmp_path = os.path.join(partition_dir, "_part-0.parquet.tmp")
+            pq.write_table(
+                pa.Table.from_pandas(out, preserve_index=False),
+                tmp_path,
+                compression=PARQUET_COMPRESSION,
+                compression_level=PARQUET_COMPRESSION_LEVEL
+            )
+            os.replace(tmp_path, file_path)
+        except Exception as e:
+            logger.error(f"Error saving partitioned {data_type} data for {ticker}: {e}")
+            success = False
+    
+    return success
+
+
+def migrate_to_partitioned(data_dir: str, tickers: Optional[List[str]] = None) -> Dict[str, bool]:
+    """Enable the partitioned store and backfill it from the per-ticker files.
+    
+    The per-ticker files stay in place: fetching, caching and the other
+    data types keep using them.
+    
+    Args:
+        data_dir: Base data directory
+        tickers: Tickers to backfill (all ticker directories if None)
+        
+    Returns:
+        Dictionary with ticker symbols as keys and success status as values
+    """
+    os.makedirs(get_partitioned_dir(data_dir), exist_ok=True)
+    
+    if tickers is None:
+        tickers = list(scan_data_dir(data_dir)[0])
+    
+    def migrate(ticker):
+        return save_partitioned_data(ticker, load_ticker_data(ticker, data_dir, list(PARTITIONED_TYPES)), data_dir)
+    
+    with ThreadPoolExecutor(max_workers=IO_WORKERS) as executor:
+        results = dict(zip(tickers, executor.map(migrate, tickers)))
+    
+    logger.info(f"Built partitioned data for {sum(results.values())}/{len(results)} tickers")
+    return results
+
+
+def load_partitioned_data(
+    data_dir: str,
+    data_type: str,
+    tickers: Optional[List[str]] = None
+) -> Dict[str, pd.DataFrame]:
+    """Load one data type for many tickers with a single dataset scan.
+    
+    Args:
+        data_dir: Base data directory
+        data_type: One of PARTITIONED_TYPES
+        tickers: Tickers to include (all stored tickers if None)
+        
+    Returns:
+        Dictionary with ticker symbols as keys and DataFrames indexed by
+        Date in their original timezone as values
+    """
+    type_dir = os.path.join(get_partitioned_dir(data_dir), f"data_type={data_type}")
+    if not os.path.isdir(type_dir):
+        return {}
+    
+    dataset = ds.dataset(
+        type_dir,
+        format="parquet",
+        partitioning=ds.partitioning(pa.schema([("ticker", pa.string())]), flavor="hive")
+    )
+    expr = ds.field("ticker").isin(list(tickers)) if tickers is not None else None
+    df = dataset.to_table(filter=expr).to_pandas(ignore_metadata=True)
+    
+    result = {}
+    for ticker, group in df.groupby("ticker", sort=False):
+        tz = group["tz"].iloc[0]
+        frame = group.drop(columns=["ticker", "tz"]).set_index("date")
+        frame.index = frame.index.tz_convert(tz or None).rename("Date")
+        result[ticker] = frame
+    
+    return result
+
+
 def save_data_for_tickers(
     ticker_data: Dict[str, Dict[str, pd.DataFrame]],
-    data_dir: str
+    data_dir: str,
+    columnar: bool = False,
+    max_workers: Optional[int] = None
 ) -> Dict[str, bool]:
     """Save data for multiple tickers.
     
     Args:
         ticker_data: Dictionary with ticker symbols as keys and data dictionaries as values
         data_dir: Base data directory
+        columnar: Also maintain the field-partitioned OHLCV store (see
+            save_columnar_data); once enabled, later saves keep it in sync
+        max_workers: Threads saving tickers in parallel (defaults to IO_WORKERS)
         
     Returns:
         Dictionary with ticker symbols as keys and success status as values
     """
-    results = {}
+    if columnar:
+        os.makedirs(get_columnar_dir(data_dir), exist_ok=True)
     
+    def save(item):
+        ticker, data = item
+        return save_ticker_data(ticker, data, data_dir, update_summary=False)
+    
+    with ThreadPoolExecutor(max_workers=max_workers or IO_WORKERS) as executor:
+        # map keeps the results in ticker order
+        results = dict(zip(ticker_data, executor.map(save, ticker_data.items())))
+    
+    # Only successful saves: a failed one would stamp the old file's mtime
+    # on a date range the file does not contain
+    summary_entries = []
     for ticker, data in ticker_data.items():
-        results[ticker] = save_ticker_data(ticker, data, data_dir)
+        if not results[ticker]:
+            continue
+        ohlcv = data.get("ohlcv")
+        if ohlcv is not None and not ohlcv.empty:
+            file_path = get_ticker_file(data_dir, ticker, "ohlcv")
+            entry = make_summary_entry(ticker, ohlcv, file_path)
+            if entry is not None:
+                summary_entries.append(entry)
+    
+    # One index rewrite for the whole batch
+    update_summary_index(data_dir, summary_entries)
     
     logger.info(f"Saved data for {sum(results.values())}/{len(results)} tickers")
     
     return results
 
 
-def load_dataframe_from_parquet(file_path: str) -> Optional[pd.DataFrame]:
+def _read_parquet_polars(file_path: str, columns: Optional[List[str]], schema: pa.Schema) -> pd.DataFrame:
+    """Read a Parquet file with polars and restore the pandas index.
+    
+    Args:
+        file_path: Path to the Parquet file
+        columns: Columns to read (read all if None)
+        schema: Arrow schema of the file
+        
+    Returns:
+        DataFrame
+    """
+    import polars as pl
+    
+    pandas_metadata = schema.pandas_metadata or {}
+    index_columns = [c for c in pandas_metadata.get("index_columns", []) if isinstance(c, str)]
+    
+    lazy_frame = pl.scan_parquet(file_path)
+    if columns is not None:
+        lazy_frame = lazy_frame.select(index_columns + [c for c in columns if c not in index_columns])
+    df = lazy_frame.collect().to_pandas()
+    
+    if index_columns:
+        df = df.set_index(index_columns)
+        df.index.names = [None if c.startswith("__index_level_") else c for c in index_columns]
+    return df
+
+
+@functools.lru_cache(maxsize=1024)
+def _read_schema_cached(file_path: str, mtime_ns: int, size: int) -> pa.Schema:
+    """Read a Parquet file's Arrow schema.
+    
+    Cached on the file's path, modification time and size, so repeated
+    projected reads of an unchanged file skip parsing the footer twice.
+    """
+    return pq.read_schema(file_path)
+
+
+def load_dataframe_from_parquet(
+    file_path: str,
+    columns: Optional[List[str]] = None,
+    engine: str = "pyarrow"
+) -> Optional[pd.DataFrame]:
     """Load a DataFrame from a Parquet file.
     
     Args:
         file_path: Path to the Parquet file
+        columns: Columns to read (read all if None). Columns missing from the
+            file are skipped; the index is always restored.
+        engine: Reader to use: 'pyarrow' (default), 'pandas' or 'polars'.
+            polars must be installed separately; its multithreaded reader only
+            pays off on files large enough to amortise its startup cost.
         
     Returns:
         DataFrame or None if the file doesn't exist or an error occurs
     """
-    if not os.path.exists(file_path):
+    if engine not in PARQUET_ENGINES:
+        raise ValueError(f"Invalid engine: {engine}. Must be one of {PARQUET_ENGINES}")
+    
+    try:
+        stat = os.stat(file_path)
+    except FileNotFoundError:
         logger.debug(f"File does not exist: {file_path}")
         return None
         
     try:
-        df = pd.read_parquet(file_path)
+        schema = None
+        if columns is not None or engine == "polars":
+            schema = _read_schema_cached(file_path, stat.st_mtime_ns, stat.st_size)
+        if columns is not None:
+            # Project the read so unused columns are never decoded
+            columns = [c for c in columns if c in schema.names]
+        
+        if engine == "polars":
+            df = _read_parquet_polars(file_path, columns, schema)
+        elif engine == "pandas":
+            df = pd.read_parquet(file_path, columns=columns)
+        else:
+            # Ticker files are small and usually read from our own thread
+            # pools, so Arrow's internal threads would only oversubscribe the
+            # CPU; pre_buffer coalesces the column reads into few IO calls
+            table = pq.read_table(
+                file_path, columns=columns, use_pandas_metadata=True,
+                memory_map=stat.st_size >= MMAP_MIN_BYTES,
+                use_threads=False, pre_buffer=True
+            )
+            # One block per column lets null-free numeric columns wrap the
+            # Arrow buffers instead of being copied into a consolidated 2D
+            # block; columns with nulls are still converted (to NaN) by copy
+            df = table.to_pandas(use_threads=False, self_destruct=True, split_blocks=True)
         logger.debug(f"Loaded data from {file_path}")
         return df
+    except ImportError:
+        raise
     except Exception as e:
         logger.error(f"Error loading data from {file_path}: {e}")
         return None
@@ -126,7 +972,8 @@ def load_dataframe_from_parquet(file_path: str) -> Optional[pd.DataFrame]:
 def load_ticker_data(
     ticker: str,
     data_dir: str,
-    data_types: Optional[List[str]] = None
+    data_types: Optional[List[str]] = None,
+    columns: Optional[List[str]] = None
 ) -> Dict[str, pd.DataFrame]:
     """Load ticker data from Parquet files.
     
@@ -134,37 +981,74 @@ def load_ticker_data(
         ticker: Ticker symbol
         data_dir: Base data directory
         data_types: List of data types to load (load all if None)
+        columns: Columns to read from each file (all if None); only these
+            are decoded, and the index is always restored
         
     Returns:
         Dictionary of DataFrames
     """
     ticker_dir = os.path.join(data_dir, ticker)
-    
-    if not os.path.exists(ticker_dir):
-        logger.warning(f"No data directory found for ticker {ticker}")
-        return {}
-        
     result = {}
     
     # If data_types not specified, load all available data types
     if data_types is None:
-        parquet_files = [f for f in os.listdir(ticker_dir) if f.endswith('.parquet')]
-        data_types = [os.path.splitext(f)[0] for f in parquet_files]
+        try:
+            data_types = list(list_data_types(ticker_dir))
+        except FileNotFoundError:
+            data_types = []
     
     for data_type in data_types:
-        file_path = os.path.join(ticker_dir, f"{data_type}.parquet")
-        df = load_dataframe_from_parquet(file_path)
+        file_path = get_ticker_file(data_dir, ticker, data_type)
+        df = load_dataframe_from_parquet(file_path, columns=columns)
         
         if df is not None:
             result[data_type] = df
     
+    # Only check the directory on a miss, so hits cost no extra stat
+    if not result and not os.path.isdir(ticker_dir):
+        logger.warning(f"No data directory found for ticker {ticker}")
+    
+    return result
+
+
+def _load_partitioned_for_tickers(
+    tickers: List[str],
+    data_dir: str,
+    data_types: Optional[List[str]]
+) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """Load the requested time series types from the partitioned store, if enabled.
+    
+    Args:
+        tickers: List of ticker symbols
+        data_dir: Base data directory
+        data_types: Requested data types (all if None)
+        
+    Returns:
+        Dictionary with ticker symbols as keys and data dictionaries as
+        values; empty if the store is not enabled
+    """
+    if not os.path.isdir(get_partitioned_dir(data_dir)):
+        return {}
+    
+    result = {}
+    for data_type in PARTITIONED_TYPES:
+        if data_types is not None and data_type not in data_types:
+            continue
+        try:
+            frames = load_partitioned_data(data_dir, data_type, tickers)
+        except (pa.ArrowException, ValueError) as e:
+            logger.warning(f"Could not scan partitioned {data_type} data: {e}")
+            continue
+        for ticker, df in frames.items():
+            result.setdefault(ticker, {})[data_type] = df
     return result
 
 
 def load_data_for_tickers(
     tickers: List[str],
     data_dir: str,
-    data_types: Optional[List[str]] = None
+    data_types: Optional[List[str]] = None,
+    max_workers: Optional[int] = None
 ) -> Dict[str, Dict[str, pd.DataFrame]]:
     """Load data for multiple tickers.
     
@@ -172,29 +1056,90 @@ def load_data_for_tickers(
         tickers: List of ticker symbols
         data_dir: Base data directory
         data_types: List of data types to load (load all if None)
+        max_workers: Threads loading tickers in parallel (defaults to IO_WORKERS)
         
     Returns:
         Dictionary with ticker symbols as keys and data dictionaries as values
     """
     result = {}
+    partitioned = _load_partitioned_for_tickers(tickers, data_dir, data_types)
     
-    for ticker in tickers:
-        ticker_data = load_ticker_data(ticker, data_dir, data_types)
+    def load(ticker):
+        if not partitioned:
+            return load_ticker_data(ticker, data_dir, data_types)
+        # Read the per-ticker files only for the types the scan did not cover
+        ticker_data = dict(partitioned.get(ticker, {}))
+        if data_types is None:
+            ticker_dir = os.path.join(data_dir, ticker)
+            remaining = list(list_data_types(ticker_dir)) if os.path.isdir(ticker_dir) else None
+        else:
+            remaining = list(data_types)
+        if remaining is None:
+            return ticker_data or load_ticker_data(ticker, data_dir)
+        remaining = [t for t in remaining if t not in ticker_data]
+        if remaining:
+            ticker_data.update(load_ticker_data(ticker, data_dir, remaining))
+        return ticker_data
+    
+    with ThreadPoolExecutor(max_workers=max_workers or IO_WORKERS) as executor:
+        loaded = executor.map(load, tickers)
+        # map keeps the results in ticker order
+        for ticker, ticker_data in zip(tickers, loaded):
+            if ticker_data:
+                result[ticker] = ticker_data
+    
+    logger.info(f"Loaded data for {len(result)}/{len(tickers)} tickers")
+    
+    return result
+
+
+async def load_data_for_tickers_async(
+    tickers: List[str],
+    data_dir: str,
+    data_types: Optional[List[str]] = None,
+    max_concurrency: int = IO_WORKERS
+) -> Dict[str, Dict[str, pd.DataFrame]]:
+    """Load data for multiple tickers from within a running event loop.
+    
+    Each ticker is read in a worker thread of the loop's default executor,
+    so the event loop stays responsive; synchronous callers should use
+    load_data_for_tickers instead.
+    
+    Args:
+        tickers: List of ticker symbols
+        data_dir: Base data directory
+        data_types: List of data types to load (load all if None)
+        max_concurrency: Tickers read at once
         
-        if ticker_data:
-            result[ticker] = ticker_data
+    Returns:
+        Dictionary with ticker symbols as keys and data dictionaries as values
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+    
+    async def load(ticker: str) -> Dict[str, pd.DataFrame]:
+        async with semaphore:
+            return await loop.run_in_executor(
+                None, functools.partial(load_ticker_data, ticker, data_dir, data_types)
+            )
+    
+    loaded = await asyncio.gather(*(load(ticker) for ticker in tickers))
+    result = {ticker: ticker_data for ticker, ticker_data in zip(tickers, loaded) if ticker_data}
     
     logger.info(f"Loaded data for {len(result)}/{len(tickers)} tickers")
     
     return result
 
 
-def get_latest_date(
+def _get_date_range(
     ticker: str,
     data_dir: str,
-    data_type: str = "ohlcv"
-) -> Optional[datetime]:
-    """Get the latest date for a ticker's data.
+    data_type: str
+) -> Optional[Tuple[pd.Timestamp, pd.Timestamp]]:
+    """Get the first and last index date of a ticker's stored data.
+    
+    The range comes from the Parquet footer statistics when available;
+    otherwise only the index column is read.
     
     Args:
         ticker: Ticker symbol
@@ -202,9 +1147,21 @@ def get_latest_date(
         data_type: Data type to check
         
     Returns:
-        Latest date or None if no data exists
+        Tuple of the earliest and latest date, or None if no data exists
     """
-    ticker_data = load_ticker_data(ticker, data_dir, [data_type])
+    file_path = get_ticker_file(data_dir, ticker, data_type)
+    try:
+        index_range = _cached_index_range(file_path)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Could not read Parquet footer of {file_path}: {e}")
+        index_range = None
+    if index_range is not None:
+        return index_range
+    
+    # No usable statistics: decode the index alone
+    ticker_data = load_ticker_data(ticker, data_dir, [data_type], columns=[])
     
     if not ticker_data or data_type not in ticker_data:
         return None
@@ -215,16 +1172,19 @@ def get_latest_date(
     if not isinstance(df.index, pd.DatetimeIndex):
         logger.warning(f"Index for {ticker} {data_type} is not a DateTimeIndex")
         return None
+    # Only the index was read, so test it rather than df.empty
+    if len(df.index) == 0:
+        return None
         
-    return df.index.max().to_pydatetime()
+    return df.index.min(), df.index.max()
 
 
-def get_earliest_date(
+def get_latest_date(
     ticker: str,
     data_dir: str,
     data_type: str = "ohlcv"
 ) -> Optional[datetime]:
-    """Get the earliest date for a ticker's data.
+    """Get the latest date for a ticker's data.
     
     Args:
         ticker: Ticker symbol
@@ -232,18 +1192,91 @@ def get_earliest_date(
         data_type: Data type to check
         
     Returns:
-        Earliest date or None if no data exists
+        Latest date or None if no data exists
     """
-    ticker_data = load_ticker_data(ticker, data_dir, [data_type])
+    date_range = _get_date_range(ticker, data_dir, data_type)
+    return date_range[1].to_pydatetime() if date_range else None
+
+
+def get_latest_dates_bulk(
+    tickers: List[str],
+    data_dir: str,
+    data_type: str = "ohlcv"
+) -> Dict[str, Optional[datetime]]:
+    """Get the latest date of many tickers' data from their Parquet footers.
     
-    if not ticker_data or data_type not in ticker_data:
-        return None
+    All stored files are opened as one dataset and the date is taken from
+    each fragment's footer statistics, so no data pages are read. Files
+    without usable statistics fall back to get_latest_date.
+    
+    Args:
+        tickers: List of ticker symbols
+        data_dir: Base data directory
+        data_type: Data type to check
         
-    df = ticker_data[data_type]
+    Returns:
+        Dictionary mapping each ticker to its latest date, or None if it
+        has no data
+    """
+    latest_dates: Dict[str, Optional[datetime]] = dict.fromkeys(tickers)
     
-    # Handle the case where the index might not be a DateTimeIndex
-    if not isinstance(df.index, pd.DatetimeIndex):
-        logger.warning(f"Index for {ticker} {data_type} is not a DateTimeIndex")
-        return None
+    # Footers already cached and unchanged need no read at all
+    paths = {}
+    found = []
+    for ticker in tickers:
+        file_path = get_ticker_file(data_dir, ticker, data_type)
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            continue
+        found.append(ticker)
+        version = (st.st_mtime_ns, st.st_size)
+        cached = _FOOTER_CACHE.get(file_path)
+        if cached is not None and cached[0] == version:
+            if cached[1] is not None:
+                latest_dates[ticker] = cached[1][1].to_pydatetime()
+        else:
+            paths[os.path.normpath(file_path)] = (ticker, file_path, version)
+    
+    if paths:
+        try:
+            dataset = ds.dataset(list(paths), format="parquet")
+            for fragment in dataset.get_fragments():
+                ticker, file_path, version = paths[os.path.normpath(fragment.path)]
+                try:
+                    index_range = _read_index_range(fragment.metadata)
+                except Exception as e:
+                    logger.debug(f"Could not read Parquet footer of {fragment.path}: {e}")
+                    continue
+                # Stamped with the version seen before the read, so a file
+                # changed in between is read again next time
+                _FOOTER_CACHE[file_path] = (version, index_range)
+                if index_range is not None:
+                    latest_dates[ticker] = index_range[1].to_pydatetime()
+        except Exception as e:
+            logger.warning(f"Could not open {data_type} files as a dataset: {e}")
+    
+    for ticker in found:
+        if latest_dates[ticker] is None:
+            latest_dates[ticker] = get_latest_date(ticker, data_dir, data_type)
+    
+    return latest_dates
+
+
+def get_earliest_date(
+    ticker: str,
+    data_dir: str,
+    data_type: str = "ohlcv"
+) -> Optional[datetime]:
+    """Get the earliest date for a ticker's data.
+    
+    Args:
+        ticker: Ticker symbol
+        data_dir: Base data directory
+        data_type: Data type to check
         
-    return df.index.min().to_pydatetime() 
\ No newline at end of file
+    Returns:
+        Earliest date or None if no data exists
+    """
+    date_range = _get_date_range(ticker, data_dir, data_type)
+    return date_range[0].to_pydatetime() if date_range else None
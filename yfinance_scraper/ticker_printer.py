@@ -1,16 +1,35 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 from yahoo_fin import stock_info as si
 
+logger = logging.getLogger(__name__)
+
+# Index constituent lists, each scraped from a different page
+SOURCES = {
+    "S&P 500": si.tickers_sp500,
+    "NASDAQ": si.tickers_nasdaq,
+    "Dow": si.tickers_dow,
+}
+
 def get_combined_tickers():
-    tickers = set()
-    tickers.update(si.tickers_sp500())
-    tickers.update(si.tickers_nasdaq())
-    tickers.update(si.tickers_dow())
-    return sorted(tickers)
+    # The scrapes are independent and network-bound, so run them at once
+    tickers = []
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as executor:
+        futures = {name: executor.submit(fetch) for name, fetch in SOURCES.items()}
+        for name, future in futures.items():
+            try:
+                tickers.extend(future.result())
+            except Exception as e:
+                # One dead source should not lose the others
+                logger.error(f"Error fetching {name} tickers: {e}")
+    # np.unique dedupes and sorts in one pass
+    return np.unique(np.asarray(tickers, dtype=object)).tolist()
 
 if __name__ == "__main__":
     combined_tickers = get_combined_tickers()
     print("Combined Ticker List:")
     print(combined_tickers)
     print(len(combined_tickers))
-    
 
@@ -4,23 +4,99 @@ import os
 import pandas as pd
 from typing import List, Dict, Any, Optional, Union
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 
-from yfinance_scraper.fetcher import fetch_data_from_date
+from yfinance_scraper.fetcher import fetch_data_from_date, DOWNLOAD_TIMEOUT
 from yfinance_scraper.storage import (
     load_ticker_data,
     save_ticker_data,
-    get_latest_date
+    get_latest_date,
+    get_latest_dates_bulk,
+    get_columnar_dir,
+    get_ticker_file,
+    get_partitioned_dir,
+    PARTITIONED_TYPES,
+    append_dataframe_to_parquet,
+    read_summary_entry,
+    refresh_summary_index,
+    update_summary_index
 )
 
 logger = logging.getLogger(__name__)
 
+# Tickers updated at once; requests still share the fetcher's rate limiter
+UPDATE_WORKERS = 8
+
+
+@dataclass
+class UpdateStats:
+    """Outcome of updating a list of tickers.
+    
+    Attributes:
+        success: Number of tickers updated successfully
+        total: Number of tickers processed
+        failed: Tickers whose update failed, in processing order
+        results: Success status per ticker
+    """
+    success: int = 0
+    total: int = 0
+    failed: List[str] = field(default_factory=list)
+    results: Dict[str, bool] = field(default_factory=dict)
+    
+    def record(self, ticker: str, ok: bool) -> None:
+        """Record the outcome of one ticker update."""
+        self.results[ticker] = ok
+        self.total += 1
+        if ok:
+            self.success += 1
+        else:
+            self.failed.append(ticker)
+
+
+def _merge_time_series(existing_df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
+    """Merge new rows into stored data, keeping the new values on shared dates.
+    
+    When both frames are sorted, only the stored rows from the first new
+    date onwards are compared with the new index, so the common case of a
+    short overlap at the end needs neither a full-index dedup nor a sort.
+    
+    Args:
+        existing_df: Stored data
+        new_df: Newly fetched data
+        
+    Returns:
+        Merged DataFrame sorted by index
+    """
+    if (existing_df.index.is_monotonic_increasing
+            and new_df.index.is_monotonic_increasing
+            and new_df.index.is_unique):
+        try:
+            cutoff = existing_df.index.searchsorted(new_df.index[0], side="left")
+            # Stored dates missing from the new data would be lost by the slice
+            if existing_df.index[cutoff:].isin(new_df.index).all():
+                return pd.concat([existing_df.iloc[:cutoff], new_df])
+        except TypeError:
+            # e.g. tz-aware vs naive indexes; let the general path decide
+            pass
+    
+    # Concatenate the DataFrames
+    merged_df = pd.concat([existing_df, new_df])
+    # Remove duplicates if any
+    merged_df = merged_df[~merged_df.index.duplicated(keep='last')]
+    # Sort the index
+    return merged_df.sort_index()
+
 
 def update_ticker_data(
     ticker: str,
     data_dir: str,
     end_date: Optional[Union[str, datetime]] = None,
-    interval: str = "1d"
+    interval: str = "1d",
+    timeout: float = DOWNLOAD_TIMEOUT,
+    latest_date: Optional[datetime] = None,
+    update_summary: bool = True
 ) -> bool:
     """Update data for a single ticker.
     
@@ -29,6 +105,11 @@ def update_ticker_data(
         data_dir: Base data directory
         end_date: End date for the update (defaults to current date)
         interval: Data interval
+        timeout: Seconds before a download request times out
+        latest_date: Latest stored OHLCV date, if already known (looked up
+            when None)
+        update_summary: Record the new OHLCV date range in the summary
+            index (callers updating many tickers batch this themselves)
         
     Returns:
         True if update was successful, False otherwise
@@ -36,7 +117,8 @@ def update_ticker_data(
     logger.info(f"Updating data for {ticker}")
     
     # Get the latest date we have data for
-    latest_date = get_latest_date(ticker, data_dir)
+    if latest_date is None:
+        latest_date = get_latest_date(ticker, data_dir)
     
     if latest_date is None:
         logger.warning(f"No existing data found for {ticker}, skipping update")
@@ -45,8 +127,9 @@ def update_ticker_data(
     # Add one day to the latest date to avoid duplication
     start_date = latest_date + timedelta(days=1)
     
-    # If the start date is in the future, no update needed
-    if start_date > datetime.now():
+    # If the start date is in the future, no update needed (stored dates are
+    # usually tz-aware, so compare in their timezone)
+    if start_date > datetime.now(start_date.tzinfo):
         logger.info(f"Data for {ticker} is already up to date")
         return True
     
@@ -59,35 +142,47 @@ def update_ticker_data(
         tickers=[ticker],
         start_date=start_date,
         end_date=end_date,
-        interval=interval
+        interval=interval,
+        timeout=timeout
     )
     
     if not new_data or ticker not in new_data:
         logger.warning(f"No new data available for {ticker}")
         return False
     
-    # Load existing data
-    existing_data = load_ticker_data(ticker, data_dir)
-    
-    # Merge new data with existing data
+    # Rows after the stored range are appended; anything else is merged
+    # with the stored data and rewritten. Data types without new rows are
+    # left untouched.
+    columnar_enabled = os.path.isdir(get_columnar_dir(data_dir))
+    partitioned_enabled = os.path.isdir(get_partitioned_dir(data_dir))
     merged_data = {}
+    success = True
     
-    for data_type in set(list(existing_data.keys()) + list(new_data[ticker].keys())):
-        if data_type in new_data[ticker] and data_type in existing_data:
-            # Concatenate the DataFrames
-            merged_df = pd.concat([existing_data[data_type], new_data[ticker][data_type]])
-            # Remove duplicates if any
-            merged_df = merged_df[~merged_df.index.duplicated(keep='last')]
-            # Sort the index
-            merged_df = merged_df.sort_index()
-            merged_data[data_type] = merged_df
-        elif data_type in new_data[ticker]:
-            merged_data[data_type] = new_data[ticker][data_type]
+    for data_type, new_df in new_data[ticker].items():
+        if new_df is None or new_df.empty:
+            continue
+        
+        file_path = get_ticker_file(data_dir, ticker, data_type)
+        # The optional stores replace whole tickers, so they need the merged frame
+        needs_merge = ((data_type == "ohlcv" and columnar_enabled)
+                       or (data_type in PARTITIONED_TYPES and partitioned_enabled))
+        if not needs_merge:
+            if append_dataframe_to_parquet(new_df, file_path):
+                if data_type == "ohlcv" and update_summary:
+                    entry = read_summary_entry(ticker, file_path)
+                    if entry is not None:
+                        update_summary_index(data_dir, [entry])
+                continue
+        
+        existing_df = load_ticker_data(ticker, data_dir, [data_type]).get(data_type)
+        if existing_df is not None:
+            merged_data[data_type] = _merge_time_series(existing_df, new_df)
         else:
-            merged_data[data_type] = existing_data[data_type]
+            merged_data[data_type] = new_df
     
     # Save the merged data
-    success = save_ticker_data(ticker, merged_data, data_dir)
+    if merged_data:
+        success = save_ticker_data(ticker, merged_data, data_dir, update_summary=update_summary)
     
     if success:
         logger.info(f"Successfully updated data for {ticker}")
@@ -101,34 +196,63 @@ def update_data_for_tickers(
     tickers: List[str],
     data_dir: str,
     end_date: Optional[Union[str, datetime]] = None,
-    interval: str = "1d"
-) -> Dict[str, bool]:
+    interval: str = "1d",
+    max_workers: int = UPDATE_WORKERS,
+    timeout: float = DOWNLOAD_TIMEOUT
+) -> UpdateStats:
     """Update data for multiple tickers.
     
+    Tickers are updated concurrently on a thread pool: each update spends
+    most of its time waiting on Yahoo or on file IO. With yfinance
+    releases whose yf.download shares global state the downloads
+    themselves take turns (see fetcher._download).
+    
     Args:
         tickers: List of ticker symbols
         data_dir: Base data directory
         end_date: End date for the update (defaults to current date)
         interval: Data interval
+        max_workers: Number of tickers updated at once
+        timeout: Seconds before a download request times out
         
     Returns:
-        Dictionary with ticker symbols as keys and success status as values
+        UpdateStats with success/total counts, the failed tickers and the
+        per-ticker success status
     """
+    stats = UpdateStats()
+    if not tickers:
+        return stats
+    
+    # Read every ticker's latest date from the footers up front
+    latest_dates = get_latest_dates_bulk(tickers, data_dir)
+    
     results = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tickers)))) as executor:
+        futures = {
+            executor.submit(
+                update_ticker_data, ticker, data_dir, end_date, interval, timeout, latest_dates[ticker], False
+            ): ticker
+            for ticker in tickers
+        }
+        
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                results[ticker] = future.result()
+            except Exception as e:
+                logger.error(f"Error updating data for {ticker}: {e}")
+                results[ticker] = False
+                continue
+            if not results[ticker]:
+                logger.warning(f"Failed to update data for {ticker}")
     
-    for ticker in tickers:
-        results[ticker] = update_ticker_data(
-            ticker=ticker,
-            data_dir=data_dir,
-            end_date=end_date,
-            interval=interval
-        )
+    # One summary index rewrite for all updated tickers
+    refresh_summary_index(data_dir, [t for t in tickers if results[t]])
     
-    success_count = sum(results.values())
-    logger.info(f"Updated data for {success_count}/{len(tickers)} tickers")
+    # Record in the caller's order regardless of completion order
+    for ticker in tickers:
+        stats.record(ticker, results[ticker])
     
-    if success_count < len(tickers):
-        failed_tickers = [t for t, s in results.items() if not s]
-        logger.warning(f"Failed to update data for tickers: {', '.join(failed_tickers)}")
+    logger.info(f"Updated data for {stats.success}/{stats.total} tickers")
     
-    return results 
\ No newline at end of file
+    return stats
@@ -1,34 +1,108 @@
 """Utility functions for YFinance Scraper."""
 
 import os
+import time
 import logging
-from typing import List, Optional, Union, Any
-from datetime import datetime, date, timedelta
+import functools
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, Any
+from datetime import datetime, date
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on threads checking cache files in prioritize_tickers
+CACHE_CHECK_WORKERS = 32
 
-def parse_date(date_str: str) -> Optional[datetime]:
-    """Parse a date string into a datetime object.
+
+# Accepted date formats, in the order they are tried
+DATE_FORMATS = ("%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%d-%m-%Y", "%d/%m/%Y")
+
+# The DATE_FORMATS shapes in one pattern: year first with "-" or "/", or
+# year last with the separator used twice
+_DATE_RE = re.compile(r"(\d{4})([-/])(\d{1,2})\2(\d{1,2})|(\d{1,2})([-/])(\d{1,2})\6(\d{4})", re.ASCII)
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_date_cached(date_str: str) -> Optional[datetime]:
+    """Parse a date string in one of the DATE_FORMATS.
     
     Args:
-        date_str: Date string in format YYYY-MM-DD
+        date_str: Date string to parse
         
     Returns:
-        Datetime object or None if parsing fails
+        Datetime object or None if no format matches
     """
-    formats = ["%Y-%m-%d", "%Y/%m/%d", "%m/%d/%Y", "%d-%m-%Y", "%d/%m/%Y"]
+    # Fast path for YYYY-MM-DD, the format Yahoo Finance uses; the shape
+    # check keeps fromisoformat's other formats (e.g. week dates) out
+    if len(date_str) == 10 and date_str[4] == "-" and date_str[7] == "-" and date_str.isascii():
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
     
-    for fmt in formats:
+    # The other formats: read the fields with the regex, trying the
+    # readings in DATE_FORMATS order
+    match = _DATE_RE.fullmatch(date_str)
+    if match:
+        year, sep, a, b, c, sep2, d, year2 = match.groups()
+        if year:
+            candidates = ((year, a, b),)
+        elif sep2 == "/":
+            candidates = ((year2, c, d), (year2, d, c))
+        else:
+            candidates = ((year2, d, c),)
+        for y, m, day in candidates:
+            try:
+                return datetime(int(y), int(m), int(day))
+            except ValueError:
+                continue
+    
+    # Anything else strptime may still accept, e.g. a space-padded day
+    for fmt in DATE_FORMATS:
         try:
             return datetime.strptime(date_str, fmt)
         except ValueError:
             continue
     
-    logger.error(f"Could not parse date string: {date_str}")
     return None
 
 
+def parse_date(date_str: str) -> Optional[datetime]:
+    """Parse a date string into a datetime object.
+    
+    Results are memoized, so repeated dates cost a cache lookup.
+    
+    Args:
+        date_str: Date string in format YYYY-MM-DD
+        
+    Returns:
+        Datetime object or None if parsing fails
+    """
+    result = _parse_date_cached(date_str)
+    if result is None:
+        logger.error(f"Could not parse date string: {date_str}")
+    return result
+
+
+def parse_dates(date_strs: Iterable[str]) -> List[Optional[datetime]]:
+    """Parse many date strings, parsing each distinct string only once.
+    
+    Args:
+        date_strs: Date strings in any format accepted by parse_date
+        
+    Returns:
+        List of datetime objects, with None where parsing failed
+    """
+    cache: Dict[str, Optional[datetime]] = {}
+    results = []
+    for date_str in date_strs:
+        if date_str not in cache:
+            cache[date_str] = parse_date(date_str)
+        results.append(cache[date_str])
+    return results
+
+
 def format_date(dt: Union[datetime, date]) -> str:
     """Format a datetime or date object as a string.
     
@@ -38,10 +112,14 @@ def format_date(dt: Union[datetime, date]) -> str:
     Returns:
         Formatted date string in YYYY-MM-DD format
     """
-    if isinstance(dt, datetime):
-        return dt.strftime("%Y-%m-%d")
-    else:
-        return dt.strftime("%Y-%m-%d")
+    # Same output as strftime("%Y-%m-%d"), without the format machinery
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+# Characters allowed in a ticker symbol, in either case
+TICKER_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-^"
+_TICKER_BYTES = (TICKER_CHARS + TICKER_CHARS.lower()).encode("ascii")
+_TICKER_DROP_TABLE = str.maketrans("", "", TICKER_CHARS + TICKER_CHARS.lower())
 
 
 def validate_ticker_symbol(ticker: str) -> bool:
@@ -53,12 +131,12 @@ def validate_ticker_symbol(ticker: str) -> bool:
     Returns:
         True if the ticker symbol is valid, False otherwise
     """
-    # Basic validation - alphanumeric, dot, or dash, length <= 10
-    if not ticker or len(ticker) > 10:
+    # Basic validation - alphanumeric, dot, dash or caret, length <= 10
+    if not ticker or len(ticker) > 10 or not ticker.isascii():
         return False
     
-    valid_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-^")
-    return all(c in valid_chars for c in ticker.upper())
+    # Deleting every allowed byte leaves nothing behind for a valid symbol
+    return not ticker.encode("ascii").translate(None, _TICKER_BYTES)
 
 
 def validate_tickers(tickers: List[str]) -> List[str]:
@@ -68,45 +146,90 @@ def validate_tickers(tickers: List[str]) -> List[str]:
         tickers: List of ticker symbols to validate
         
     Returns:
-        List of valid ticker symbols
+        List of valid ticker symbols, uppercased and without repeats
     """
     valid_tickers = []
+    seen_inputs = set()
+    seen_symbols = set()
     
+    # Same rules as validate_ticker_symbol, inlined for long ticker files
     for ticker in tickers:
-        if validate_ticker_symbol(ticker):
-            valid_tickers.append(ticker.upper())
-        else:
-            logger.warning(f"Invalid ticker symbol: {ticker}")
+        if ticker in seen_inputs:
+            continue
+        seen_inputs.add(ticker)
+        
+        # Uppercase only tickers that passed, so rejects allocate nothing
+        if ticker and len(ticker) <= 10 and ticker.isascii() and not ticker.translate(_TICKER_DROP_TABLE):
+            symbol = ticker.upper()
+            if symbol not in seen_symbols:
+                seen_symbols.add(symbol)
+                valid_tickers.append(symbol)
+            continue
+        logger.warning(f"Invalid ticker symbol: {ticker}")
     
     return valid_tickers
 
 
-def get_valid_intervals() -> List[str]:
+# Intervals and periods accepted by Yahoo Finance
+VALID_INTERVALS = (
+    "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h",
+    "1d", "5d", "1wk", "1mo", "3mo"
+)
+VALID_PERIODS = (
+    "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"
+)
+_VALID_INTERVALS_SET = frozenset(VALID_INTERVALS)
+_VALID_PERIODS_SET = frozenset(VALID_PERIODS)
+
+
+def get_valid_intervals() -> Tuple[str, ...]:
     """Get list of valid intervals for Yahoo Finance.
     
     Returns:
-        List of valid interval strings
+        Tuple of valid interval strings
     """
-    return [
-        "1m", "2m", "5m", "15m", "30m", "60m", "90m", "1h",
-        "1d", "5d", "1wk", "1mo", "3mo"
-    ]
+    return VALID_INTERVALS
 
 
-def get_valid_periods() -> List[str]:
+def get_valid_periods() -> Tuple[str, ...]:
     """Get list of valid periods for Yahoo Finance.
     
     Returns:
-        List of valid period strings
+        Tuple of valid period strings
+    """
+    return VALID_PERIODS
+
+
+def is_valid_interval(interval: str) -> bool:
+    """Check whether Yahoo Finance accepts an interval.
+    
+    Args:
+        interval: Interval string such as "1d"
+        
+    Returns:
+        True if the interval is valid, False otherwise
     """
-    return [
-        "1d", "5d", "1mo", "3mo", "6mo", "1y", "2y", "5y", "10y", "ytd", "max"
-    ]
+    return interval in _VALID_INTERVALS_SET
+
+
+def is_valid_period(period: str) -> bool:
+    """Check whether Yahoo Finance accepts a period.
+    
+    Args:
+        period: Period string such as "1y"
+        
+    Returns:
+        True if the period is valid, False otherwise
+    """
+    return period in _VALID_PERIODS_SET
 
 
 def save_tickers_to_file(tickers: List[str], data_dir: str, filename: str = "tickers.txt") -> bool:
     """Save a list of tickers to a file.
     
+    Filenames ending in ``.parquet`` are written as a one-column Parquet
+    table, which is faster than text for large ticker universes.
+    
     Args:
         tickers: List of ticker symbols to save
         data_dir: Directory to save the file
@@ -122,12 +245,22 @@ def save_tickers_to_file(tickers: List[str], data_dir: str, filename: str = "tic
         # Validate tickers
         valid_tickers = validate_tickers(tickers)
         
-        # Write to file
+        # Write to a temporary file and rename it, so a reader never sees
+        # a half-written list
         file_path = os.path.join(data_dir, filename)
-        with open(file_path, 'w') as f:
-            for ticker in valid_tickers:
-                f.write(f"{ticker}\n")
-                
+        tmp_path = f"{file_path}.tmp"
+        if filename.endswith(".parquet"):
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            table = pa.table({"ticker": pa.array(valid_tickers, type=pa.string())})
+            pq.write_table(table, tmp_path, compression="zstd")
+        else:
+            with open(tmp_path, "w") as f:
+                if valid_tickers:
+                    f.write("\n".join(valid_tickers) + "\n")
+        os.replace(tmp_path, file_path)
+        
         logger.info(f"Saved {len(valid_tickers)} tickers to {file_path}")
         return True
     except Exception as e:
@@ -135,28 +268,54 @@ def save_tickers_to_file(tickers: List[str], data_dir: str, filename: str = "tic
         return False
 
 
+# Tickers loaded from each file, keyed by path and stored with the
+# (mtime_ns, size) the file had when it was read
+_TICKER_FILE_CACHE: Dict[str, Tuple[Tuple[int, int], Tuple[str, ...]]] = {}
+
+
 def load_tickers_from_file(data_dir: str, filename: str = "tickers.txt") -> List[str]:
     """Load a list of tickers from a file.
     
     Args:
         data_dir: Directory where the file is stored
-        filename: Name of the file
+        filename: Name of the file, either text with one ticker per line or
+            a ``.parquet`` file written by save_tickers_to_file
         
     Returns:
         List of ticker symbols
     """
     file_path = os.path.join(data_dir, filename)
     
-    if not os.path.exists(file_path):
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
         logger.warning(f"Tickers file does not exist: {file_path}")
         return []
     
+    # Reuse the previous result while the file is unchanged
+    version = (st.st_mtime_ns, st.st_size)
+    cached = _TICKER_FILE_CACHE.get(file_path)
+    if cached is not None and cached[0] == version:
+        logger.info(f"Loaded {len(cached[1])} tickers from {file_path}")
+        return list(cached[1])
+    
     try:
-        with open(file_path, 'r') as f:
-            tickers = [line.strip() for line in f if line.strip()]
+        if filename.endswith(".parquet"):
+            import pyarrow.parquet as pq
+            
+            column = pq.read_table(file_path, columns=["ticker"]).column("ticker")
+            tickers = [t.strip() for t in column.to_pylist() if t and t.strip()]
+        else:
+            with open(file_path, "rb") as f:
+                data = f.read()
+            # One ticker per line; split and drop repeats on the raw bytes,
+            # decoding each distinct ticker once
+            lines = (line.strip() for line in data.splitlines())
+            tickers = [t.decode("utf-8", "replace") for t in dict.fromkeys(lines) if t]
         
         # Validate tickers
         valid_tickers = validate_tickers(tickers)
+        _TICKER_FILE_CACHE[file_path] = (version, tuple(valid_tickers))
         
         logger.info(f"Loaded {len(valid_tickers)} tickers from {file_path}")
         return valid_tickers
@@ -165,59 +324,116 @@ def load_tickers_from_file(data_dir: str, filename: str = "tickers.txt") -> List
         return []
 
 
-def is_cache_valid(ticker: str, data_dir: str, data_type: str = "ohlcv", max_age_days: int = 1) -> bool:
+def is_cache_valid(ticker: str, data_dir: str, data_type: str = "ohlcv", max_age_days: float = 1) -> bool:
     """Check if cached data for a ticker is valid and recent enough.
     
+    Freshness is judged by when the file was last written, so each data
+    type can have its own TTL regardless of the dates it covers.
+    
     Args:
         ticker: Ticker symbol
         data_dir: Base data directory
         data_type: Type of data to check
-        max_age_days: Maximum age of data in days
+        max_age_days: Maximum age of the cached file in days
         
     Returns:
         True if data exists and is recent enough, False otherwise
     """
-    from yfinance_scraper.storage import get_latest_date
-    import os
-    from datetime import datetime, timedelta
-    
-    # Check if the file exists
-    ticker_dir = os.path.join(data_dir, ticker)
-    file_path = os.path.join(ticker_dir, f"{data_type}.parquet")
-    if not os.path.exists(file_path):
+    file_path = os.path.join(data_dir, ticker, f"{data_type}.parquet")
+    try:
+        mtime = os.stat(file_path).st_mtime
+    except OSError:
         return False
     
-    # Check if the data is recent enough
-    latest_date = get_latest_date(ticker, data_dir, data_type)
-    if latest_date is None:
-        return False
+    # Compare raw timestamps rather than building datetimes
+    return mtime >= time.time() - max_age_days * 86400
+
+
+def is_cache_fresh(ticker: str, data_dir: str, data_type: str = "ohlcv", max_age_hours: float = 4) -> bool:
+    """Check if cached data is recent enough to serve without revalidating.
+    
+    Args:
+        ticker: Ticker symbol
+        data_dir: Base data directory
+        data_type: Type of data to check
+        max_age_hours: Maximum age of fresh data in hours
+        
+    Returns:
+        True if data exists and is fresh, False otherwise
+    """
+    return is_cache_valid(ticker, data_dir, data_type, max_age_days=max_age_hours / 24)
+
+
+def is_cache_stale_ok(ticker: str, data_dir: str, data_type: str = "ohlcv", max_stale_days: float = 7) -> bool:
+    """Check if cached data can still be served while it is refreshed.
     
-    cutoff_date = datetime.now() - timedelta(days=max_age_days)
-    return latest_date >= cutoff_date
+    Args:
+        ticker: Ticker symbol
+        data_dir: Base data directory
+        data_type: Type of data to check
+        max_stale_days: Maximum age of servable data in days
+        
+    Returns:
+        True if data exists and is not too old to serve, False otherwise
+    """
+    return is_cache_valid(ticker, data_dir, data_type, max_age_days=max_stale_days)
 
 
-def prioritize_tickers(tickers: List[str], data_dir: str, max_age_days: int = 1) -> List[str]:
+def prioritize_tickers(
+    tickers: List[str],
+    data_dir: str,
+    max_age_days: int = 1,
+    cache_check: Optional[Callable[[str, str, int], bool]] = None
+) -> List[str]:
     """Prioritize tickers based on cache validity and importance.
     
     Args:
         tickers: List of ticker symbols
         data_dir: Base data directory
         max_age_days: Maximum age of data in days
+        cache_check: Function called as cache_check(ticker, data_dir,
+            max_age_days) to test cache validity (defaults to is_cache_valid)
         
     Returns:
         Prioritized list of tickers
     """
-    import os
+    # One directory listing answers "is it cached at all" for every ticker
+    try:
+        with os.scandir(data_dir) as entries:
+            ticker_dirs = {entry.name: entry.path for entry in entries if entry.is_dir()}
+    except OSError:
+        ticker_dirs = {}
+    
+    if cache_check is None:
+        # Same test as is_cache_valid, with the cutoff computed once and
+        # the file path built from the listed directory path
+        cutoff = time.time() - max_age_days * 86400
+        file_suffix = os.sep + "ohlcv.parquet"
+        
+        def cache_check(t: str, d: str, age: int) -> bool:
+            try:
+                return os.stat(ticker_dirs[t] + file_suffix).st_mtime >= cutoff
+            except OSError:
+                return False
     
     # Separate tickers into those with and without cached data
     uncached = []
     cached_outdated = []
     cached_valid = []
     
+    # The checks are stat calls, so run them side by side
+    cached = [ticker for ticker in tickers if ticker in ticker_dirs]
+    if len(cached) > 1:
+        with ThreadPoolExecutor(max_workers=min(CACHE_CHECK_WORKERS, len(cached))) as executor:
+            statuses = executor.map(lambda t: cache_check(t, data_dir, max_age_days), cached)
+            valid = dict(zip(cached, statuses))
+    else:
+        valid = {ticker: cache_check(ticker, data_dir, max_age_days) for ticker in cached}
+    
     for ticker in tickers:
-        if not os.path.exists(os.path.join(data_dir, ticker)):
+        if ticker not in ticker_dirs:
             uncached.append(ticker)
-        elif not is_cache_valid(ticker, data_dir, max_age_days=max_age_days):
+        elif not valid[ticker]:
             cached_outdated.append(ticker)
         else:
             cached_valid.append(ticker)
@@ -236,4 +452,25 @@ def chunk_list(items: List[Any], chunk_size: int) -> List[List[Any]]:
     Returns:
         List of chunks
     """
-    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)] 
\ No newline at end of file
+    if chunk_size == 1:
+        return [[item] for item in items]
+    return [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def chunk_list_iter(items: List[Any], chunk_size: int) -> Iterator[List[Any]]:
+    """Yield chunks of a list one at a time.
+    
+    Like chunk_list, for callers that only iterate over the chunks and do
+    not need them all in memory at once.
+    
+    Args:
+        items: List to split
+        chunk_size: Maximum size of each chunk
+        
+    Yields:
+        Consecutive chunks of at most chunk_size items
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+    for i in range(0, len(items), chunk_size):
+        yield items[i:i + chunk_size]